@@ -1,7 +1,7 @@
 """ AuthConfiguration class module.
 """
 
-from typing import Dict
+from typing import Dict, Optional
 from dms2122common.data.config import ServiceConfiguration
 
 
@@ -25,6 +25,22 @@ class AuthConfiguration(ServiceConfiguration):
         ServiceConfiguration.__init__(self)
 
         self.set_db_connection_string('sqlite:////tmp/dms2122auth.sqlite3.db')
+        self.set_auto_migrate(True)
+        self.set_db_engine({
+            'pool_size': 5,
+            'max_overflow': 10,
+            'pool_timeout': 30,
+            'pool_pre_ping': False,
+            'pool_recycle': -1,
+            'sqlite': {
+                'journal_mode': 'WAL',
+                'synchronous': 'NORMAL',
+                'cache_size': None,
+                'mmap_size': None,
+                'busy_timeout': 5000
+            }
+        })
+        self.set_role_cache({'max_entries': 4096, 'epoch_check_interval': 1})
         self.set_service_host('127.0.0.1')
         self.set_service_port(4000)
         self.set_debug_flag(True)
@@ -43,6 +59,12 @@ class AuthConfiguration(ServiceConfiguration):
 
         if 'db_connection_string' in values:
             self.set_db_connection_string(values['db_connection_string'])
+        if 'auto_migrate' in values:
+            self.set_auto_migrate(values['auto_migrate'])
+        if 'db_engine' in values:
+            self.set_db_engine(values['db_engine'])
+        if 'role_cache' in values:
+            self.set_role_cache(values['role_cache'])
         if 'salt' in values:
             self.set_password_salt(values['salt'])
         if 'jws_secret' in values:
@@ -70,6 +92,110 @@ class AuthConfiguration(ServiceConfiguration):
 
         return str(self._values['db_connection_string'])
 
+    def set_auto_migrate(self, auto_migrate: bool) -> None:
+        """ Sets whether the pending schema migrations are applied on startup.
+
+        Args:
+            - auto_migrate: A boolean with the configuration value.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        self._values['auto_migrate'] = bool(auto_migrate)
+
+    def get_auto_migrate(self) -> bool:
+        """ Gets whether the pending schema migrations are applied on startup.
+
+        Returns:
+            - bool: A boolean with the value of auto_migrate.
+        """
+
+        return bool(self._values['auto_migrate'])
+
+    def set_db_engine(self, db_engine: Dict) -> None:
+        """ Sets the database engine profile configuration value.
+
+        The given values are merged with the current ones, so only those to be changed need to
+        be given.
+
+        Args:
+            - db_engine: A dictionary with the configuration value, with the keys:
+                - pool_size (int): Connections kept open in the pool.
+                - max_overflow (int): Connections that can be opened beyond `pool_size`.
+                - pool_timeout (int): Seconds to wait for a connection before giving up.
+                - pool_pre_ping (bool): Whether connections are tested on checkout.
+                - pool_recycle (int): Seconds after which connections are replaced (-1 to never).
+                - sqlite (Dict): The pragmas applied to every SQLite connection: `journal_mode`,
+                  `synchronous`, `cache_size`, `mmap_size` and `busy_timeout` (`None` to keep
+                  the SQLite default).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        profile: Dict = dict(self._values.get('db_engine', {}))
+        profile['sqlite'] = dict(profile.get('sqlite', {}))
+        for key in ('pool_size', 'max_overflow', 'pool_timeout', 'pool_recycle'):
+            if key in db_engine:
+                profile[key] = int(db_engine[key])
+        if 'pool_pre_ping' in db_engine:
+            profile['pool_pre_ping'] = bool(db_engine['pool_pre_ping'])
+        sqlite: Dict = db_engine.get('sqlite') or {}
+        for key, allowed in (
+            ('journal_mode', ('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF')),
+            ('synchronous', ('OFF', 'NORMAL', 'FULL', 'EXTRA'))
+        ):
+            if key in sqlite:
+                value: Optional[str] = None
+                if sqlite[key] is not None:
+                    value = str(sqlite[key]).upper()
+                    if value not in allowed:
+                        raise ValueError(f'Invalid SQLite {key}: {sqlite[key]}')
+                profile['sqlite'][key] = value
+        for key in ('cache_size', 'mmap_size', 'busy_timeout'):
+            if key in sqlite:
+                profile['sqlite'][key] = int(sqlite[key]) if sqlite[key] is not None else None
+        self._values['db_engine'] = profile
+
+    def get_db_engine(self) -> Dict:
+        """ Gets the database engine profile configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of db_engine.
+        """
+
+        return self._values['db_engine']
+
+    def set_role_cache(self, role_cache: Dict) -> None:
+        """ Sets the role cache configuration value.
+
+        The given values are merged with the current ones.
+
+        Args:
+            - role_cache: A dictionary with the maximum number of users whose roles are cached
+              (`max_entries`, 0 to disable the cache) and the seconds between checks of the role
+              changes made by other processes (`epoch_check_interval`).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        values: Dict = dict(self._values.get('role_cache', {}))
+        if 'max_entries' in role_cache:
+            values['max_entries'] = int(role_cache['max_entries'])
+        if 'epoch_check_interval' in role_cache:
+            values['epoch_check_interval'] = float(role_cache['epoch_check_interval'])
+        if values.get('max_entries', 0) < 0 or values.get('epoch_check_interval', 0) < 0:
+            raise ValueError('The role cache size and epoch check interval cannot be negative.')
+        self._values['role_cache'] = values
+
+    def get_role_cache(self) -> Dict:
+        """ Gets the role cache configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of role_cache.
+        """
+
+        return self._values['role_cache']
+
     def set_password_salt(self, salt: str) -> None:
         """ Sets the password salt configuration value.
 
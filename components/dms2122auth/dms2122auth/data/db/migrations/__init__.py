@@ -0,0 +1,17 @@
+""" Authentication database schema migrations.
+"""
+
+from typing import List
+from .migration import Migration
+from .migrator import Migrator
+from .initialschema import InitialSchema
+from .userrolesusernameindex import UserRolesUsernameIndex
+from .usersrolesversion import UsersRolesVersion
+from .rolesepochtable import RolesEpochTable
+
+MIGRATIONS: List[Migration] = [
+    InitialSchema(),
+    UserRolesUsernameIndex(),
+    UsersRolesVersion(),
+    RolesEpochTable()
+]
@@ -0,0 +1,23 @@
+""" InitialSchema class module.
+"""
+
+from sqlalchemy import MetaData  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+from .migration import Migration
+
+
+class InitialSchema(Migration):
+    """ Creates the tables that do not exist yet.
+    """
+
+    version: int = 1
+    description: str = 'Initial schema'
+
+    def upgrade(self, connection: Connection, metadata: MetaData) -> None:
+        """ Upgrades the schema to this migration's version.
+
+        Args:
+            - connection (Connection): The connection to the database, within a transaction.
+            - metadata (MetaData): The current database schema metadata.
+        """
+        metadata.create_all(connection)
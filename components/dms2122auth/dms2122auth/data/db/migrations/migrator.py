@@ -0,0 +1,88 @@
+""" Migrator class module.
+"""
+
+from datetime import datetime
+from typing import List
+from sqlalchemy import Table, MetaData, Column, Integer, String, DateTime, func, select  # type: ignore
+from sqlalchemy.engine import Engine  # type: ignore
+from sqlalchemy.exc import IntegrityError  # type: ignore
+from .migration import Migration
+
+
+class Migrator():
+    """ Class responsible of keeping track of the schema version and applying the migrations.
+    """
+
+    def __init__(self, engine: Engine, metadata: MetaData, migrations: List[Migration]):
+        """ Constructor method.
+
+        Args:
+            - engine (Engine): The database engine.
+            - metadata (MetaData): The current database schema metadata.
+            - migrations (List[Migration]): Every migration of the schema.
+        """
+        self.__engine: Engine = engine
+        self.__metadata: MetaData = metadata
+        self.__migrations: List[Migration] = sorted(migrations, key=lambda m: m.version)
+        self.__version_table: Table = Table(
+            'schema_version',
+            MetaData(),
+            Column('version', Integer, primary_key=True, autoincrement=False),
+            Column('description', String(128), nullable=False),
+            Column('applied_at', DateTime, nullable=False)
+        )
+
+    def get_current_version(self) -> int:
+        """ Gets the version of the database schema.
+
+        Returns:
+            - int: The version of the latest migration applied, or 0 if none has been.
+        """
+        with self.__engine.connect() as connection:
+            if not self.__engine.dialect.has_table(connection, self.__version_table.name):
+                return 0
+            return connection.execute(
+                select([func.max(self.__version_table.c.version)])
+            ).scalar() or 0
+
+    def get_target_version(self) -> int:
+        """ Gets the version the database schema is migrated to.
+
+        Returns:
+            - int: The version of the latest migration.
+        """
+        return self.__migrations[-1].version if self.__migrations else 0
+
+    def is_current(self) -> bool:
+        """ Determines whether the database schema is up to date.
+
+        Returns:
+            - bool: `True` if there are no pending migrations.
+        """
+        return self.get_current_version() >= self.get_target_version()
+
+    def upgrade(self) -> List[Migration]:
+        """ Applies the pending migrations.
+
+        Returns:
+            - List[Migration]: The migrations that have been applied.
+        """
+        self.__version_table.create(self.__engine, checkfirst=True)
+        current_version: int = self.get_current_version()
+        applied: List[Migration] = []
+        for migration in self.__migrations:
+            if migration.version <= current_version:
+                continue
+            try:
+                with self.__engine.begin() as connection:
+                    migration.upgrade(connection, self.__metadata)
+                    connection.execute(self.__version_table.insert().values(
+                        version=migration.version,
+                        description=migration.description,
+                        applied_at=datetime.utcnow()
+                    ))
+            except IntegrityError:
+                # Another process has applied this migration concurrently
+                continue
+            applied.append(migration)
+        return applied
@@ -0,0 +1,27 @@
+""" RolesEpochTable class module.
+"""
+
+from sqlalchemy import MetaData, Table, func, select  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+from .migration import Migration
+
+
+class RolesEpochTable(Migration):
+    """ Adds the roles epoch, used to validate the cached roles of every process.
+    """
+
+    version: int = 4
+    description: str = 'Roles epoch'
+
+    def upgrade(self, connection: Connection, metadata: MetaData) -> None:
+        """ Upgrades the schema to this migration's version.
+
+        Args:
+            - connection (Connection): The connection to the database, within a transaction.
+            - metadata (MetaData): The current database schema metadata.
+        """
+        roles_epoch: Table = metadata.tables['roles_epoch']
+        roles_epoch.create(connection, checkfirst=True)
+        # The record is created here, so concurrent role changes only ever need to update it
+        if connection.execute(select([func.count()]).select_from(roles_epoch)).scalar() == 0:
+            connection.execute(roles_epoch.insert().values(rolesEpochId=1, epoch=0))
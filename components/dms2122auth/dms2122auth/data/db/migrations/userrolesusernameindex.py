@@ -0,0 +1,38 @@
+""" UserRolesUsernameIndex class module.
+"""
+
+from sqlalchemy import MetaData, inspect, text  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+from .migration import Migration
+
+
+class UserRolesUsernameIndex(Migration):
+    """ Indexes the user roles by user name.
+
+    The primary key of the user roles, `(username, role)`, already serves lookups by user name
+    in the supported databases, so the index is only created if no existing one leads with it.
+    """
+
+    version: int = 2
+    description: str = 'Index user roles by user name'
+
+    def upgrade(self, connection: Connection, metadata: MetaData) -> None:
+        """ Upgrades the schema to this migration's version.
+
+        Args:
+            - connection (Connection): The connection to the database, within a transaction.
+            - metadata (MetaData): The current database schema metadata.
+        """
+        inspector = inspect(connection)
+        leading_columns = [
+            index['column_names'][:1] for index in inspector.get_indexes('user_roles')
+        ]
+        leading_columns.append(
+            inspector.get_pk_constraint('user_roles')['constrained_columns'][:1]
+        )
+        if ['username'] not in leading_columns:
+            preparer = connection.dialect.identifier_preparer
+            connection.execute(text(
+                f'CREATE INDEX {preparer.quote("ix_user_roles_username")} '
+                f'ON {preparer.quote("user_roles")} ({preparer.quote("username")})'
+            ))
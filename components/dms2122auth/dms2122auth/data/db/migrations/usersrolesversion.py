@@ -0,0 +1,32 @@
+""" UsersRolesVersion class module.
+"""
+
+from sqlalchemy import MetaData, Table, inspect, text  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+from .migration import Migration
+
+
+class UsersRolesVersion(Migration):
+    """ Adds the version of the roles of each user, embedded in the user session tokens.
+    """
+
+    version: int = 3
+    description: str = 'User roles version'
+
+    def upgrade(self, connection: Connection, metadata: MetaData) -> None:
+        """ Upgrades the schema to this migration's version.
+
+        Args:
+            - connection (Connection): The connection to the database, within a transaction.
+            - metadata (MetaData): The current database schema metadata.
+        """
+        users: Table = metadata.tables['users']
+        columns = [column['name'] for column in inspect(connection).get_columns('users')]
+        if 'roles_version' not in columns:
+            preparer = connection.dialect.identifier_preparer
+            connection.execute(text(
+                f'ALTER TABLE {preparer.quote(users.name)} '
+                f'ADD COLUMN {preparer.quote("roles_version")} '
+                f'{users.c.roles_version.type.compile(dialect=connection.dialect)} '
+                'NOT NULL DEFAULT 0'
+            ))
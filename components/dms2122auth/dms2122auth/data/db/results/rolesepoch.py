@@ -0,0 +1,43 @@
+""" RolesEpoch class module.
+"""
+
+from sqlalchemy import Table, MetaData, Column, Integer  # type: ignore
+from dms2122auth.data.db.results.resultbase import ResultBase
+
+
+class RolesEpoch(ResultBase):
+    """ Definition and storage of the roles epoch ORM record.
+
+    The epoch is increased on every change of the roles of any user, so every process serving
+    the database can tell whether its cached roles are still valid with a single lookup.
+    """
+
+    def __init__(self, rolesEpochId: int = 1, epoch: int = 0):
+        """ Constructor method.
+
+        Initializes the roles epoch record.
+
+        Args:
+            - rolesEpochId (int): The record identifier (there is a single record).
+            - epoch (int): The roles epoch.
+        """
+        self.rolesEpochId: int = rolesEpochId
+        self.epoch: int = epoch
+
+    @staticmethod
+    def _table_definition(metadata: MetaData) -> Table:
+        """ Gets the table definition.
+
+        Args:
+            - metadata (MetaData): The database schema metadata
+                        (used to gather the entities' definitions and mapping)
+
+        Returns:
+            - Table: A `Table` object with the table definition.
+        """
+        return Table(
+            'roles_epoch',
+            metadata,
+            Column('rolesEpochId', Integer, primary_key=True, autoincrement=False),
+            Column('epoch', Integer, nullable=False, default=0)
+        )
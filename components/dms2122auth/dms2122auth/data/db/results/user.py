@@ -2,7 +2,7 @@
 """
 
 from typing import Dict
-from sqlalchemy import Table, MetaData, Column, String  # type: ignore
+from sqlalchemy import Table, MetaData, Column, Integer, String  # type: ignore
 from sqlalchemy.orm import relationship  # type: ignore
 from dms2122auth.data.db.results.resultbase import ResultBase
 from dms2122auth.data.db.results.userrole import UserRole
@@ -23,6 +23,8 @@ class User(ResultBase):
         """
         self.username: str = username
         self.password: str = password
+        # Increased whenever the user roles change, to tell stale role claims apart
+        self.roles_version: int = 0
 
     @staticmethod
     def _table_definition(metadata: MetaData) -> Table:
@@ -39,7 +41,8 @@ class User(ResultBase):
             'users',
             metadata,
             Column('username', String(32), primary_key=True),
-            Column('password', String(64), nullable=False)
+            Column('password', String(64), nullable=False),
+            Column('roles_version', Integer, nullable=False, default=0)
         )
 
     @staticmethod
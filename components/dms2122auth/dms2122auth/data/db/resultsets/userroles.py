@@ -1,12 +1,13 @@
 """ UserRoles class module.
 """
 
-from typing import Optional, List
-from sqlalchemy.orm import Session  # type: ignore
+from typing import Dict, List, Optional, Set
+from sqlalchemy import Table, select  # type: ignore
+from sqlalchemy.orm import Session, class_mapper  # type: ignore
 from sqlalchemy.exc import IntegrityError  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
 from dms2122common.data import Role
-from dms2122auth.data.db.results import UserRole
+from dms2122auth.data.db.results import User, UserRole, RolesEpoch
 from dms2122auth.data.db.exc import UserNotFoundError
 
 
@@ -40,6 +41,7 @@ class UserRoles():
         try:
             new_user_role = UserRole(username, role)
             session.add(new_user_role)
+            UserRoles.__increase_roles_versions(session, [username])
             session.commit()
             return new_user_role
         except IntegrityError as ex:
@@ -71,11 +73,151 @@ class UserRoles():
             return
         try:
             session.delete(user_role)
+            UserRoles.__increase_roles_versions(session, [username])
             session.commit()
         except:
             session.rollback()
             raise
 
+    @staticmethod
+    def get_roles_version(session: Session, username: str) -> int:
+        """ Gets the version of the roles of a user, increased whenever they change.
+
+        Args:
+            - session (Session): The session object.
+            - username (str): The user name string.
+
+        Raises:
+            - ValueError: If the username is missing.
+            - UserNotFoundError: If the user does not exist.
+
+        Returns:
+            - int: The roles version.
+        """
+        if not username:
+            raise ValueError('A username is required.')
+        table: Table = class_mapper(User).local_table
+        roles_version: Optional[int] = session.execute(
+            select([table.c.roles_version]).where(table.c.username == username)
+        ).scalar()
+        if roles_version is None:
+            raise UserNotFoundError()
+        return roles_version
+
+    @staticmethod
+    def get_roles_epoch(session: Session) -> int:
+        """ Gets the roles epoch, increased whenever the roles of any user change.
+
+        Args:
+            - session (Session): The session object.
+
+        Returns:
+            - int: The roles epoch (0 if no roles have ever been changed).
+        """
+        table: Table = class_mapper(RolesEpoch).local_table
+        return session.execute(
+            select([table.c.epoch]).where(table.c.rolesEpochId == 1)
+        ).scalar() or 0
+
+    @staticmethod
+    def set_roles(session: Session, roles_by_user: Dict[str, Set[Role]],
+                  chunk_size: int = 500) -> List[str]:
+        """ Sets the exact roles of several users, granting and revoking only the differences
+        with their current ones, in a single transaction.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - roles_by_user (Dict[str, Set[Role]]): The roles each user must have, by user name.
+            - chunk_size (int): The maximum number of users whose current roles are read per
+              query.
+
+        Raises:
+            - ValueError: If a username is missing.
+            - UserNotFoundError: If any of the users does not exist (no roles are changed).
+
+        Returns:
+            - List[str]: The names of the users whose roles have changed.
+        """
+        if not all(roles_by_user):
+            raise ValueError('A username is required.')
+        usernames: List[str] = list(roles_by_user)
+        users_table: Table = class_mapper(User).local_table
+        user_roles_table: Table = class_mapper(UserRole).local_table
+        try:
+            existing: Set[str] = set()
+            current: Dict[str, Dict[Role, UserRole]] = {username: {} for username in usernames}
+            for start in range(0, len(usernames), chunk_size):
+                chunk: List[str] = usernames[start:start + chunk_size]
+                existing.update(
+                    username for (username,) in session.execute(
+                        select([users_table.c.username]).where(users_table.c.username.in_(chunk))
+                    )
+                )
+                for user_role in session.query(UserRole).filter(
+                        user_roles_table.c.username.in_(chunk)):
+                    current[user_role.username][user_role.role] = user_role
+            missing: List[str] = [username for username in usernames if username not in existing]
+            if missing:
+                raise UserNotFoundError('Users not found: ' + ', '.join(missing))
+            changed: List[str] = []
+            for username, roles in roles_by_user.items():
+                granted: Set[Role] = roles.difference(current[username])
+                revoked: Set[Role] = set(current[username]).difference(roles)
+                if not granted and not revoked:
+                    continue
+                session.add_all([UserRole(username, role) for role in granted])
+                for role in revoked:
+                    session.delete(current[username][role])
+                changed.append(username)
+            if changed:
+                UserRoles.__increase_roles_versions(session, changed, chunk_size)
+            session.commit()
+            return changed
+        except:
+            session.rollback()
+            raise
+
+    @staticmethod
+    def __increase_roles_versions(session: Session, usernames: List[str],
+                                  chunk_size: int = 500) -> None:
+        """ Increases the version of the roles of some users and the roles epoch, in the current
+        transaction.
+
+        Args:
+            - session (Session): The session object.
+            - usernames (List[str]): The user name strings.
+            - chunk_size (int): The maximum number of users updated per statement.
+        """
+        table: Table = class_mapper(User).local_table
+        for start in range(0, len(usernames), chunk_size):
+            session.execute(
+                table.update().where(
+                    table.c.username.in_(usernames[start:start + chunk_size])
+                ).values(roles_version=table.c.roles_version + 1)
+            )
+        UserRoles.increase_roles_epoch(session)
+
+    @staticmethod
+    def increase_roles_epoch(session: Session) -> None:
+        """ Increases the roles epoch, so other processes discard their cached roles.
+
+        Note:
+            The changes are not committed, so they take effect within the transaction of the
+            roles being changed.
+
+        Args:
+            - session (Session): The session object.
+        """
+        table: Table = class_mapper(RolesEpoch).local_table
+        result = session.execute(
+            table.update().where(table.c.rolesEpochId == 1).values(epoch=table.c.epoch + 1)
+        )
+        if result.rowcount == 0:
+            session.execute(table.insert().values(rolesEpochId=1, epoch=1))
+
     @staticmethod
     def find_role(session: Session, username: str, role: Role) -> Optional[UserRole]:
         """ Finds a role for a user.
@@ -2,11 +2,14 @@
 """
 
 import hashlib
-from typing import List
+from typing import Dict, List
+from sqlalchemy import Table  # type: ignore
 from sqlalchemy.exc import IntegrityError  # type: ignore
+from sqlalchemy.orm import class_mapper  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
-from dms2122auth.data.db.results import User
+from dms2122auth.data.db.results import User, UserRole
+from dms2122auth.data.db.resultsets.userroles import UserRoles
 from dms2122auth.data.db.exc import UserExistsError
 
 
@@ -44,6 +47,68 @@ class Users():
                 'A user with name ' + username + ' already exists.'
                 ) from ex
 
+    @staticmethod
+    def create_many(session: Session, users: List[Dict], chunk_size: int = 500) -> List[bool]:
+        """ Creates several user records, along with their initial roles, at once.
+
+        The users and their roles are inserted with a multi-row statement per table and chunk,
+        each chunk in its own transaction. If a chunk fails, its users are retried one by one so
+        only the offending ones (e.g., already existing) are left out.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - users (List[Dict]): The already validated users' data, with a user name
+              (`username`), a password hash (`password`) and a list of roles (`roles`).
+            - chunk_size (int): The maximum number of users inserted per transaction.
+
+        Returns:
+            - List[bool]: Whether each of the given users was created (`True`) or not.
+        """
+        created: List[bool] = []
+        for start in range(0, len(users), chunk_size):
+            chunk: List[Dict] = users[start:start + chunk_size]
+            try:
+                Users.__insert(session, chunk)
+                session.commit()
+                created.extend([True] * len(chunk))
+                continue
+            except IntegrityError:
+                session.rollback()
+            for user in chunk:
+                try:
+                    Users.__insert(session, [user])
+                    session.commit()
+                    created.append(True)
+                except IntegrityError:
+                    session.rollback()
+                    created.append(False)
+        return created
+
+    @staticmethod
+    def __insert(session: Session, users: List[Dict]) -> None:
+        """ Inserts user records and their roles, in the current transaction.
+
+        Args:
+            - session (Session): The session object.
+            - users (List[Dict]): The users' data, as in `create_many`.
+        """
+        users_table: Table = class_mapper(User).local_table
+        user_roles_table: Table = class_mapper(UserRole).local_table
+        session.execute(users_table.insert(), [
+            {'username': user['username'], 'password': user['password'], 'roles_version': 0}
+            for user in users
+        ])
+        user_roles: List[Dict] = [
+            {'username': user['username'], 'role': role}
+            for user in users for role in user['roles']
+        ]
+        if user_roles:
+            session.execute(user_roles_table.insert(), user_roles)
+            UserRoles.increase_roles_epoch(session)
+
     @staticmethod
     def list_all(session: Session) -> List[User]:
         """Lists every user.
@@ -1,26 +1,44 @@
 """ Schema class module.
 """
 
+from typing import Callable, Dict, List, Optional
 from sqlalchemy import create_engine, event  # type: ignore
 from sqlalchemy.engine import Engine  # type: ignore
+from sqlalchemy.engine.url import URL, make_url  # type: ignore
 from sqlalchemy.ext.declarative import declarative_base  # type: ignore
 from sqlalchemy.orm import sessionmaker, scoped_session  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2122auth.data.config import AuthConfiguration
-from dms2122auth.data.db.results import User, UserRole
+from dms2122auth.data.db.results import User, UserRole, RolesEpoch
+from dms2122auth.data.db.meteredqueuepool import MeteredQueuePool
+from dms2122auth.data.db.migrations import MIGRATIONS, Migration, Migrator
 
 
-# Required for SQLite to enforce FK integrity when supported
-@event.listens_for(Engine, 'connect')
-def set_sqlite_pragma(dbapi_connection, connection_record):  # pylint: disable=unused-argument
-    """ Sets the SQLite foreign keys enforcement pragma on connection.
+def sqlite_pragmas_setter(pragmas: Dict) -> Callable:
+    """ Builds a listener that sets the SQLite pragmas on every new connection.
+
+    The foreign keys enforcement pragma is always set, as it is required for SQLite to enforce
+    FK integrity when supported.
 
     Args:
-        - dbapi_connection: The connection to the database API.
+        - pragmas (Dict): The pragma values; those set to `None` are left to the SQLite defaults.
+
+    Returns:
+        - Callable: The `connect` event listener.
     """
-    cursor = dbapi_connection.cursor()
-    cursor.execute('PRAGMA foreign_keys = ON;')
-    cursor.close()
+    def set_sqlite_pragmas(dbapi_connection, connection_record):  # pylint: disable=unused-argument
+        """ Sets the SQLite pragmas on connection.
+
+        Args:
+            - dbapi_connection: The connection to the database API.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA foreign_keys = ON;')
+        for name in ('journal_mode', 'synchronous', 'cache_size', 'mmap_size', 'busy_timeout'):
+            if pragmas.get(name) is not None:
+                cursor.execute(f'PRAGMA {name} = {pragmas[name]};')
+        cursor.close()
+    return set_sqlite_pragmas
 
 
 class Schema():
@@ -30,13 +48,15 @@ class Schema():
     def __init__(self, config: AuthConfiguration):
         """ Constructor method.
 
-        Initializes the schema, deploying it if necessary.
+        Initializes the schema, applying the pending migrations if necessary (and allowed by
+        the `auto_migrate` configuration value).
 
         Args:
             - config (AuthConfiguration): The instance with the schema connection parameters.
 
         Raises:
-            - RuntimeError: When the connection cannot be created/established.
+            - RuntimeError: When the connection cannot be created/established, or the schema is
+              outdated and cannot be migrated automatically.
         """
         self.__declarative_base = declarative_base()
         if config.get_db_connection_string() is None:
@@ -44,12 +64,86 @@ class Schema():
                 'A value for the configuration parameter `db_connection_string` is needed.'
             )
         db_connection_string: str = config.get_db_connection_string() or ''
-        self.__create_engine = create_engine(db_connection_string)
+        self.__create_engine = Schema.__new_engine(db_connection_string, config.get_db_engine())
         self.__session_maker = scoped_session(sessionmaker(bind=self.__create_engine))
 
         User.map(self.__declarative_base.metadata)
         UserRole.map(self.__declarative_base.metadata)
-        self.__declarative_base.metadata.create_all(self.__create_engine)
+        RolesEpoch.map(self.__declarative_base.metadata)
+
+        self.__applied_migrations: List[Migration] = []
+        migrator: Migrator = Migrator(
+            self.__create_engine, self.__declarative_base.metadata, MIGRATIONS
+        )
+        if not migrator.is_current():
+            if not config.get_auto_migrate():
+                raise RuntimeError(
+                    'The database schema is outdated. Run `dms2122auth-migrate-database` or '
+                    'set the configuration parameter `auto_migrate`.'
+                )
+            self.__applied_migrations = migrator.upgrade()
+        self.__schema_version: int = migrator.get_target_version()
+
+    @staticmethod
+    def __new_engine(db_connection_string: str, profile: Dict) -> Engine:
+        """ Creates a database engine tuned as per the given profile.
+
+        Connections are kept in a `MeteredQueuePool`, except for in-memory SQLite databases,
+        which only live as long as their single connection.
+
+        Args:
+            - db_connection_string (str): The database connection string.
+            - profile (Dict): The engine profile, as in the `db_engine` configuration value.
+
+        Returns:
+            - Engine: The new engine.
+        """
+        url: URL = make_url(db_connection_string)
+        sqlite: bool = url.get_backend_name() == 'sqlite'
+        options: Dict = {
+            'pool_pre_ping': profile['pool_pre_ping'],
+            'pool_recycle': profile['pool_recycle']
+        }
+        if not sqlite or url.database not in (None, '', ':memory:'):
+            options['poolclass'] = MeteredQueuePool
+            options['pool_size'] = profile['pool_size']
+            options['max_overflow'] = profile['max_overflow']
+            options['pool_timeout'] = profile['pool_timeout']
+            if sqlite:
+                # Pooled connections are handed over between threads, never shared at once
+                options['connect_args'] = {'check_same_thread': False}
+        engine: Engine = create_engine(db_connection_string, **options)
+        if sqlite:
+            event.listen(engine, 'connect', sqlite_pragmas_setter(profile['sqlite']))
+        return engine
+
+    def get_pool_metrics(self) -> Optional[Dict]:
+        """ Gets the connection pool checkout metrics.
+
+        Returns:
+            - Optional[Dict]: A dictionary with the pool metrics, or `None` if the connections
+              are not metered.
+        """
+        pool = self.__create_engine.pool
+        if isinstance(pool, MeteredQueuePool):
+            return pool.get_metrics()
+        return None
+
+    def get_schema_version(self) -> int:
+        """ Gets the version of the database schema.
+
+        Returns:
+            - int: The schema version.
+        """
+        return self.__schema_version
+
+    def get_applied_migrations(self) -> List[Migration]:
+        """ Gets the migrations applied when initializing the schema.
+
+        Returns:
+            - List[Migration]: The applied migrations, in order.
+        """
+        return self.__applied_migrations
 
     def new_session(self) -> Session:
         """ Constructs a new session.
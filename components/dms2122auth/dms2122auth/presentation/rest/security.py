@@ -61,7 +61,9 @@ def verify_token(token: str) -> Dict:
         - Unauthorized: When the token is incorrect.
 
     Returns:
-        - Dict: A dictionary with the user name (key `user`) if the credentials are correct.
+        - Dict: A dictionary with the user name (key `user`) if the credentials are correct, and
+          the role names (key `roles`) and their version (key `roles_version`) if the token
+          embeds them.
     """
     with current_app.app_context():
         token_bytes: bytes = token.encode('ascii')
@@ -72,7 +74,11 @@ def verify_token(token: str) -> Dict:
             raise Unauthorized from ex
         if 'user' not in data:
             return Unauthorized('Invalid token')
-        return {
+        user_info: Dict = {
             'sub': data['sub'],
             'user': data['user']
         }
+        if 'roles_version' in data:
+            user_info['roles'] = data['roles']
+            user_info['roles_version'] = data['roles_version']
+        return user_info
@@ -5,6 +5,7 @@ from typing import Dict, Tuple, Optional
 from http import HTTPStatus
 from flask import current_app
 from itsdangerous import TimedJSONWebSignatureSerializer
+from dms2122auth.service import RoleServices
 
 
 def health_test() -> Tuple[None, Optional[int]]:
@@ -16,9 +17,28 @@ def health_test() -> Tuple[None, Optional[int]]:
     return (None, HTTPStatus.NO_CONTENT.value)
 
 
+def get_metrics() -> Tuple[Dict, Optional[int]]:
+    """Gets the service performance metrics.
+
+    Returns:
+        - Tuple[Dict, Optional[int]]: A tuple with a dictionary of metrics and code 200 OK.
+    """
+    with current_app.app_context():
+        metrics: Dict = {
+            'db_pool': current_app.db.get_pool_metrics(),
+            'role_cache': RoleServices.get_cache_metrics(current_app.db),
+            'compression': current_app.compressor.get_metrics()
+            if hasattr(current_app, 'compressor') else {}
+        }
+    return (metrics, HTTPStatus.OK.value)
+
+
 def login(token_info: Dict) -> Tuple[str, Optional[int]]:
     """Generates a user token if the user validation was passed.
 
+    The token embeds the user roles and their version. When refreshing a token whose roles
+    version is still current, its roles are reused instead of listed again.
+
     Args:
         - token_info (Dict): A dictionary of information provided by the security schema handlers.
 
@@ -28,12 +48,15 @@ def login(token_info: Dict) -> Tuple[str, Optional[int]]:
     with current_app.app_context():
         jws: TimedJSONWebSignatureSerializer = current_app.jws
         user: str = ''
+        previous_claims: Optional[Dict] = None
         if 'user_token' in token_info:
             user = token_info['user_token']['user']
+            previous_claims = token_info['user_token']
         elif 'user_credentials' in token_info:
             user = token_info['user_credentials']['user']
         token = jws.dumps({
             'user': user,
-            'sub': user
+            'sub': user,
+            **RoleServices.get_role_claims(user, current_app.db, previous_claims)
         })
         return (token.decode('ascii'), HTTPStatus.OK.value)
@@ -50,3 +50,25 @@ def create_user(body: Dict, token_info: Dict) -> Tuple[Union[Dict, str], Optiona
         except UserExistsError:
             return ('A user with the given username already exists', HTTPStatus.CONFLICT.value)
     return (user, HTTPStatus.OK.value)
+
+
+def create_users(body: List[Dict], token_info: Dict) -> Tuple[Union[List[Dict], str], Optional[int]]:
+    """Creates several users, with their initial roles, if the requestor has the Admin role.
+
+    Args:
+        - body (List[Dict]): A list of dictionaries with the new users' data.
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+
+    Returns:
+        - Tuple[Union[List[Dict], str], Optional[int]]: A tuple with the per-user results (in the
+          same order as given) and a code 200 OK. On error, a description message and code:
+            - 403 FORBIDDEN when the requestor does not have the rights to create users.
+    """
+    with current_app.app_context():
+        if not RoleServices.has_role(token_info['user_token']['user'], Role.Admin, current_app.db):
+            return (
+                'Current user has not enough privileges to create users',
+                HTTPStatus.FORBIDDEN.value
+            )
+        results: List[Dict] = UserServices.create_users(body, current_app.db, current_app.cfg)
+    return (results, HTTPStatus.OK.value)
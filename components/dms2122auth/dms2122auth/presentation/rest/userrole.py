@@ -124,3 +124,95 @@ def revoke_role(
         except ValueError:
             return 'Both a username and a role name must be given', HTTPStatus.BAD_REQUEST.value
         return (None, HTTPStatus.OK.value)
+
+
+def set_user_roles(
+    username: str, body: List[str], token_info: Dict
+) -> Tuple[Union[List[str], str], Optional[int]]:
+    """Sets the exact roles of a user, granting and revoking the differences at once.
+
+    Args:
+        - username (str): The user name.
+        - body (List[str]): The names of the roles the user must have.
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+
+    Returns:
+        - Tuple[Union[List[str], str], Optional[int]]: A tuple with the resulting list of user
+          roles and a code 200 OK on success. Otherwise, a description message and codes:
+            - 400 BAD REQUEST if a mandatory parameter is missing or a role does not exist.
+            - 403 FORBIDDEN if the requesting user has no rights to grant and revoke roles.
+            - 404 NOT FOUND if the user does not exist.
+    """
+    with current_app.app_context():
+        forbidden: Optional[str] = _check_roles_update(token_info, {username: body})
+        if forbidden is not None:
+            return (forbidden, HTTPStatus.FORBIDDEN.value)
+        try:
+            user_roles: List[str] = RoleServices.set_user_roles(username, body, current_app.db)
+        except ValueError as ex:
+            return (str(ex), HTTPStatus.BAD_REQUEST.value)
+        except UserNotFoundError:
+            return (f'User {username} was not found', HTTPStatus.NOT_FOUND.value)
+        return (user_roles, HTTPStatus.OK.value)
+
+
+def set_users_roles(
+    body: List[Dict], token_info: Dict
+) -> Tuple[Union[List[Dict], str], Optional[int]]:
+    """Sets the exact roles of several users at once (e.g., to provision a new term).
+
+    Either every user is updated or, on error, none is.
+
+    Args:
+        - body (List[Dict]): A list of dictionaries with a user name (key `username`) and the names
+          of the roles the user must have (key `roles`).
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+
+    Returns:
+        - Tuple[Union[List[Dict], str], Optional[int]]: A tuple with a list of dictionaries with the
+          user names and their resulting roles, and a code 200 OK on success. Otherwise, a
+          description message and codes:
+            - 400 BAD REQUEST if a mandatory parameter is missing, a role does not exist or a user
+              is given more than once.
+            - 403 FORBIDDEN if the requesting user has no rights to grant and revoke roles.
+            - 404 NOT FOUND if any of the users does not exist.
+    """
+    with current_app.app_context():
+        roles_by_user: Dict[str, List[str]] = {
+            user_roles['username']: user_roles['roles'] for user_roles in body
+        }
+        if len(roles_by_user) != len(body):
+            return ('Every user must be given once', HTTPStatus.BAD_REQUEST.value)
+        forbidden: Optional[str] = _check_roles_update(token_info, roles_by_user)
+        if forbidden is not None:
+            return (forbidden, HTTPStatus.FORBIDDEN.value)
+        try:
+            users_roles: Dict[str, List[str]] = RoleServices.set_users_roles(
+                roles_by_user, current_app.db
+            )
+        except ValueError as ex:
+            return (str(ex), HTTPStatus.BAD_REQUEST.value)
+        except UserNotFoundError as ex:
+            return (str(ex), HTTPStatus.NOT_FOUND.value)
+        return (
+            [{'username': username, 'roles': roles} for username, roles in users_roles.items()],
+            HTTPStatus.OK.value
+        )
+
+
+def _check_roles_update(token_info: Dict, roles_by_user: Dict[str, List[str]]) -> Optional[str]:
+    """Checks that the requesting user can set the given roles.
+
+    Args:
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+        - roles_by_user (Dict[str, List[str]]): The roles each user must have, by user name.
+
+    Returns:
+        - Optional[str]: A description of why the update is forbidden, or `None` if it is allowed.
+    """
+    requestor: str = token_info['user_token']['user']
+    if not RoleServices.has_role(requestor, Role.Admin, current_app.db):
+        return 'Current user has not enough privileges to grant and revoke roles'
+    if requestor in roles_by_user and Role.Admin.name not in roles_by_user[requestor]:
+        return 'Current user cannot revoke the Admin role from oneself'
+    return None
@@ -1,5 +1,16 @@
 """ Service layer modules.
 """
 
-from .userservices import UserServices
-from .roleservices import RoleServices
+from typing import TYPE_CHECKING
+from dms2122common.lazyexports import LazyExports
+
+if TYPE_CHECKING:
+    from .userservices import UserServices
+    from .roleservices import RoleServices
+
+_exports = LazyExports(__name__, {
+    'UserServices': 'userservices',
+    'RoleServices': 'roleservices'
+})
+__getattr__ = _exports.get_attribute
+__dir__ = _exports.list_attributes
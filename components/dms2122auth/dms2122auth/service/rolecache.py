@@ -0,0 +1,129 @@
+""" RoleCache class module.
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Callable, Dict, Optional, Tuple
+
+
+class RoleCache():
+    """ In-process LRU cache of the roles of each user.
+
+    The roles change in this process are invalidated at once. Those changed by other processes
+    are detected through the roles epoch, a database counter increased on every role change:
+    it is read at most once per check interval, and the whole cache is discarded when it has
+    moved on.
+
+    Note:
+        Other processes' changes may thus be seen up to a check interval late.
+    """
+
+    def __init__(self, max_entries: int = 4096, epoch_check_interval: float = 1.0):
+        """ Constructor method.
+
+        Args:
+            - max_entries (int): The maximum number of users whose roles are cached (0 disables
+              the cache).
+            - epoch_check_interval (float): The seconds between reads of the roles epoch (0 reads
+              it on every lookup).
+        """
+        self.__max_entries: int = max_entries
+        self.__epoch_check_interval: float = epoch_check_interval
+        self.__lock: Lock = Lock()
+        self.__entries: 'OrderedDict[str, Tuple[str, ...]]' = OrderedDict()
+        self.__epoch: Optional[int] = None
+        self.__epoch_checked_at: float = 0.0
+        self.__generation: int = 0
+        self.__metrics: Dict = {
+            'hits': 0,
+            'misses': 0,
+            'invalidations': 0,
+            'epoch_invalidations': 0
+        }
+
+    def get(self, username: str, loader: Callable[[], Tuple[str, ...]],
+            epoch_loader: Callable[[], int]) -> Tuple[str, ...]:
+        """ Gets the cached roles of a user, loading them on a miss.
+
+        Args:
+            - username (str): The user name.
+            - loader (Callable[[], Tuple[str, ...]]): A function returning the role names of the
+              user.
+            - epoch_loader (Callable[[], int]): A function returning the current roles epoch.
+
+        Returns:
+            - Tuple[str, ...]: The role names.
+        """
+        if self.__max_entries <= 0:
+            return loader()
+        if monotonic() - self.__epoch_checked_at >= self.__epoch_check_interval:
+            self.__check_epoch(epoch_loader)
+        with self.__lock:
+            roles: Optional[Tuple[str, ...]] = self.__entries.get(username)
+            if roles is not None:
+                self.__entries.move_to_end(username)
+                self.__metrics['hits'] += 1
+                return roles
+            self.__metrics['misses'] += 1
+            generation: int = self.__generation
+        roles = loader()
+        with self.__lock:
+            # Roles loaded across an invalidation might be stale already
+            if generation == self.__generation:
+                self.__entries[username] = roles
+                while len(self.__entries) > self.__max_entries:
+                    self.__entries.popitem(last=False)
+        return roles
+
+    def __check_epoch(self, epoch_loader: Callable[[], int]) -> None:
+        """ Discards every cached role if the roles epoch has changed since the last check.
+
+        Args:
+            - epoch_loader (Callable[[], int]): A function returning the current roles epoch.
+        """
+        checked_at: float = monotonic()
+        epoch: int = epoch_loader()
+        with self.__lock:
+            self.__epoch_checked_at = checked_at
+            if self.__epoch is not None and epoch != self.__epoch:
+                self.__discard()
+                self.__metrics['epoch_invalidations'] += 1
+            self.__epoch = epoch
+
+    def invalidate(self, username: Optional[str] = None) -> None:
+        """ Discards the cached roles of a user, or of every user.
+
+        Args:
+            - username (Optional[str]): The user name, or `None` for every user.
+        """
+        with self.__lock:
+            if username is None:
+                self.__discard()
+            else:
+                self.__entries.pop(username, None)
+                self.__generation += 1
+            self.__metrics['invalidations'] += 1
+
+    def __discard(self) -> None:
+        """ Discards every cached role. The lock must be held.
+        """
+        self.__entries.clear()
+        self.__generation += 1
+
+    def get_metrics(self) -> Dict:
+        """ Gets the cache usage metrics.
+
+        Returns:
+            - Dict: A dictionary with the number of hits, misses, hit rate, invalidations (by
+              role changes in this process, and by changes of the roles epoch), and the current
+              and maximum number of entries.
+        """
+        with self.__lock:
+            metrics: Dict = dict(self.__metrics)
+            metrics['entries'] = len(self.__entries)
+        lookups: int = metrics['hits'] + metrics['misses']
+        metrics['hit_rate'] = metrics['hits'] / lookups if lookups else 0.0
+        metrics['max_entries'] = self.__max_entries
+        metrics['epoch_check_interval'] = self.__epoch_check_interval
+        return metrics
@@ -1,18 +1,111 @@
 """ RoleServices class module.
 """
 
-from typing import Union, List
+from typing import Dict, List, Mapping, Optional, Sequence, Set, Tuple, Union
+from weakref import WeakKeyDictionary
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2122common.data import Role
 from dms2122auth.data.db import Schema
-from dms2122auth.data.db.exc.usernotfounderror import UserNotFoundError
-from dms2122auth.data.db.results import UserRole
 from dms2122auth.data.db.resultsets import UserRoles
+from dms2122auth.service.rolecache import RoleCache
 
 
 class RoleServices():
     """ Monostate class that provides high-level services to handle role-related use cases.
+
+    Role checks and listings are served through a `RoleCache` per schema, which the role
+    changes invalidate.
     """
+
+    __caches: 'WeakKeyDictionary[Schema, RoleCache]' = WeakKeyDictionary()
+
+    @staticmethod
+    def configure_cache(schema: Schema, max_entries: int, epoch_check_interval: float) -> None:
+        """Sets up the role cache of a schema, discarding the current one.
+
+        Args:
+            - schema (Schema): A database handler where users and roles are mapped into.
+            - max_entries (int): The maximum number of users whose roles are cached (0 disables
+              the cache).
+            - epoch_check_interval (float): The seconds between checks of the role changes made
+              by other processes.
+        """
+        RoleServices.__caches[schema] = RoleCache(max_entries, epoch_check_interval)
+
+    @staticmethod
+    def get_cache_metrics(schema: Schema) -> Dict:
+        """Gets the usage metrics of the role cache of a schema.
+
+        Args:
+            - schema (Schema): A database handler where users and roles are mapped into.
+
+        Returns:
+            - Dict: A dictionary with the cache metrics.
+        """
+        return RoleServices.get_cache(schema).get_metrics()
+
+    @staticmethod
+    def invalidate_cache(schema: Schema, username: Optional[str] = None) -> None:
+        """Discards the cached roles of a user, or of every user.
+
+        Role changes made through this class invalidate the cache by themselves, and those made
+        by other processes are detected through the roles epoch. This is meant for changes made
+        otherwise (e.g., directly in the database).
+
+        Args:
+            - schema (Schema): A database handler where users and roles are mapped into.
+            - username (Optional[str]): The user name, or `None` for every user.
+        """
+        RoleServices.get_cache(schema).invalidate(username)
+
+    @staticmethod
+    def get_cache(schema: Schema) -> RoleCache:
+        """Gets the role cache of a schema, setting up a default one if needed.
+
+        Args:
+            - schema (Schema): A database handler where users and roles are mapped into.
+
+        Returns:
+            - RoleCache: The role cache.
+        """
+        cache: Optional[RoleCache] = RoleServices.__caches.get(schema)
+        if cache is None:
+            cache = RoleServices.__caches.setdefault(schema, RoleCache())
+        return cache
+
+    @staticmethod
+    def __cached_roles(username: str, schema: Schema) -> Tuple[str, ...]:
+        """Gets the role names of a user through the role cache.
+
+        Args:
+            - username (str): The username of the user queried.
+            - schema (Schema): A database handler where users and roles are mapped into.
+
+        Raises:
+            - ValueError: If the username is missing.
+
+        Returns:
+            - Tuple[str, ...]: The role names.
+        """
+        def load() -> Tuple[str, ...]:
+            session: Session = schema.new_session()
+            try:
+                return tuple(
+                    user_role.role.name
+                    for user_role in UserRoles.list_all_for_user(session, username)
+                )
+            finally:
+                schema.remove_session()
+
+        def load_epoch() -> int:
+            session: Session = schema.new_session()
+            try:
+                return UserRoles.get_roles_epoch(session)
+            finally:
+                schema.remove_session()
+
+        return RoleServices.get_cache(schema).get(username, load, load_epoch)
+
     @staticmethod
     def has_role(username: str, role: Union[Role, str], schema: Schema) -> bool:
         """Determines whether a user has a certain role or not.
@@ -25,19 +118,12 @@ class RoleServices():
         Returns:
             - bool: `True` if the user has the given role. `False` otherwise.
         """
-        session: Session = schema.new_session()
-        has_role: bool
         try:
             if isinstance(role, str):
                 role = Role[role]
-            has_role = bool(UserRoles.find_role(
-                session, username, role) is not None)
         except KeyError:
-            has_role = False
-        except UserNotFoundError:
-            has_role = False
-        schema.remove_session()
-        return has_role
+            return False
+        return role.name in RoleServices.__cached_roles(username, schema)
 
     @staticmethod
     def list_user_roles(username: str, schema: Schema) -> List[str]:
@@ -53,18 +139,45 @@ class RoleServices():
         Returns:
             - List[str]: The list of role names.
         """
+        return list(RoleServices.__cached_roles(username, schema))
+
+    @staticmethod
+    def get_role_claims(username: str, schema: Schema, claims: Optional[Dict] = None) -> Dict:
+        """Gets the roles of a user and their version, to be embedded in a user session token.
+
+        Args:
+            - username (str): The username of the user queried.
+            - schema (Schema): A database handler where users and roles are mapped into.
+            - claims (Optional[Dict]): The role claims of a previous token of the user, if any.
+              Its roles are reused if their version is still current.
+
+        Raises:
+            - ValueError: If the username is missing.
+            - UserNotFoundError: If the user does not exist.
+
+        Returns:
+            - Dict: A dictionary with the list of role names (key `roles`) and their version
+              (key `roles_version`).
+        """
         session: Session = schema.new_session()
-        out: List[str] = []
         try:
-            roles: List[UserRole] = UserRoles.list_all_for_user(
-                session, username)
-            for role in roles:
-                out.append(role.role.name)
-        except:  # pylint: disable=try-except-raise
-            raise
+            # The version is read first, so roles changed meanwhile are listed with the older
+            # version and listed again on the next refresh, never the other way around
+            roles_version: int = UserRoles.get_roles_version(session, username)
+            if claims is not None and claims.get('roles_version') == roles_version \
+                    and isinstance(claims.get('roles'), list):
+                roles: List[str] = list(claims['roles'])
+            else:
+                roles = [
+                    user_role.role.name
+                    for user_role in UserRoles.list_all_for_user(session, username)
+                ]
         finally:
             schema.remove_session()
-        return out
+        return {
+            'roles': roles,
+            'roles_version': roles_version
+        }
 
     @staticmethod
     def grant_role(username: str, role: Union[Role, str], schema: Schema) -> None:
@@ -88,6 +201,7 @@ class RoleServices():
             raise
         finally:
             schema.remove_session()
+        RoleServices.get_cache(schema).invalidate(username)
 
     @staticmethod
     def revoke_role(username: str, role: Union[Role, str], schema: Schema) -> None:
@@ -110,3 +224,60 @@ class RoleServices():
             raise
         finally:
             schema.remove_session()
+        RoleServices.get_cache(schema).invalidate(username)
+
+    @staticmethod
+    def set_user_roles(username: str, roles: Sequence[Union[Role, str]],
+                       schema: Schema) -> List[str]:
+        """Sets the exact roles of a user, granting and revoking just the differences.
+
+        Args:
+            - username (str): The user name.
+            - roles (Sequence[Union[Role, str]]): The roles the user must have.
+            - schema (Schema): A database handler where users and roles are mapped into.
+
+        Raises:
+            - ValueError: If the username is missing or a role does not exist.
+            - UserNotFoundError: If the user does not exist.
+
+        Returns:
+            - List[str]: The resulting role names.
+        """
+        return RoleServices.set_users_roles({username: roles}, schema)[username]
+
+    @staticmethod
+    def set_users_roles(roles_by_user: Mapping[str, Sequence[Union[Role, str]]],
+                        schema: Schema) -> Dict[str, List[str]]:
+        """Sets the exact roles of several users at once, in a single transaction.
+
+        Args:
+            - roles_by_user (Mapping[str, Sequence[Union[Role, str]]]): The roles each user must
+              have, by user name.
+            - schema (Schema): A database handler where users and roles are mapped into.
+
+        Raises:
+            - ValueError: If a username is missing or a role does not exist.
+            - UserNotFoundError: If any of the users does not exist (no roles are changed).
+
+        Returns:
+            - Dict[str, List[str]]: The resulting role names, by user name.
+        """
+        try:
+            role_sets: Dict[str, Set[Role]] = {
+                username: {role if isinstance(role, Role) else Role[role] for role in roles}
+                for username, roles in roles_by_user.items()
+            }
+        except KeyError as ex:
+            raise ValueError(f'Unknown role: {ex.args[0]}') from ex
+        session: Session = schema.new_session()
+        try:
+            changed: List[str] = UserRoles.set_roles(session, role_sets)
+        finally:
+            schema.remove_session()
+        cache: RoleCache = RoleServices.get_cache(schema)
+        for username in changed:
+            cache.invalidate(username)
+        return {
+            username: [role.name for role in Role if role in roles]
+            for username, roles in role_sets.items()
+        }
@@ -1,12 +1,14 @@
 """ UserServices class module.
 """
 
-from typing import List, Dict
+from typing import Dict, List, Set
 from sqlalchemy.orm.session import Session  # type: ignore
+from dms2122common.data import Role
 from dms2122auth.data.config import AuthConfiguration
 from dms2122auth.data.db import Schema
 from dms2122auth.data.db.results import User
 from dms2122auth.data.db.resultsets import Users
+from dms2122auth.service.roleservices import RoleServices
 
 
 class UserServices():
@@ -83,3 +85,74 @@ class UserServices():
         finally:
             schema.remove_session()
         return out
+
+    @staticmethod
+    def create_users(users: List[Dict], schema: Schema, cfg: AuthConfiguration,
+                     chunk_size: int = 500) -> List[Dict]:
+        """Creates several users, with their initial roles, at once.
+
+        Invalid users are reported and skipped; the rest are created in chunked transactions,
+        so a failing user does not abort the others.
+
+        Args:
+            - users (List[Dict]): The users' data, with a user name (`username`), a password
+              (`password`) and, optionally, a list of role names (`roles`).
+            - schema (Schema): A database handler where the users are mapped into.
+            - cfg (AuthConfiguration): The application configuration.
+            - chunk_size (int): The maximum number of users inserted per transaction.
+
+        Returns:
+            - List[Dict]: A dictionary per given user (in the same order) with its `index`, its
+              `status` (`created`, `invalid` or `rejected`) and a `message` on error.
+        """
+        salt: str = cfg.get_password_salt()
+        out: List[Dict] = []
+        valid: List[Dict] = []
+        valid_results: List[Dict] = []
+        usernames: Set[str] = set()
+        for index, user in enumerate(users):
+            result: Dict = {'index': index, 'status': 'created'}
+            out.append(result)
+            if not isinstance(user, dict):
+                user = {}
+            username = user.get('username')
+            password = user.get('password')
+            roles = user.get('roles') or []
+            if not isinstance(username, str) or not isinstance(password, str) \
+                    or not username or not password:
+                result['status'] = 'invalid'
+                result['message'] = 'A username and a password are required'
+                continue
+            if not isinstance(roles, list) or any(
+                    not isinstance(role, str) or role not in Role.__members__ for role in roles):
+                result['status'] = 'invalid'
+                result['message'] = 'The roles must be a list of ' + \
+                    ', '.join(Role.__members__)
+                continue
+            if username in usernames:
+                result['status'] = 'invalid'
+                result['message'] = f'User {username} is given more than once'
+                continue
+            usernames.add(username)
+            valid.append({
+                'username': username,
+                # The password hash is a single SHA-256, cheaper than handing it to other processes
+                'password': Users.hash_password(password, suffix=username, salt=salt),
+                'roles': sorted({Role[role] for role in roles}, key=lambda role: role.value)
+            })
+            valid_results.append(result)
+        if not valid:
+            return out
+        session: Session = schema.new_session()
+        try:
+            created: List[bool] = Users.create_many(session, valid, chunk_size)
+        finally:
+            schema.remove_session()
+        for user, result, was_created in zip(valid, valid_results, created):
+            if was_created and user['roles']:
+                # Checks of the user made before it existed may have been cached
+                RoleServices.invalidate_cache(schema, user['username'])
+            if not was_created:
+                result['status'] = 'rejected'
+                result['message'] = 'A user with the given username already exists'
+        return out
@@ -12,3 +12,6 @@ rm -R "${TEMP_DIR}"
 
 # Create admin:admin user
 dms2122auth-create-admin
+
+# Compile the REST API specification
+dms2122auth-build-spec-bundle
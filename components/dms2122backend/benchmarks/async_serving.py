@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+""" Benchmark of the service under many concurrent requests, served with threads and with asyncio.
+
+Starts `dms2122backend` once per server mode (`development`, one thread per request; `production`,
+one Gunicorn worker with a fixed number of threads; `async`, a single aiohttp event loop) against
+the same database, and measures the requests per second and latencies of an operation issued by
+as many concurrent clients as given. Requires the `async` extra (`aiohttp` is also used by the
+client) and, for the `production` mode, the `production` one.
+
+Usage: `python3 benchmarks/async_serving.py [--modes development async] [--concurrency 10 100 1000]
+[--requests 5000] [--path /questions/user1/answers?limit=20] [--db-connection-string URL]`
+"""
+
+import argparse
+import asyncio
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from typing import List, Tuple
+import aiohttp  # type: ignore
+import yaml
+from sqlalchemy import Table  # type: ignore
+from sqlalchemy.orm import class_mapper  # type: ignore
+from dms2122backend.data.config import BackendConfiguration
+from dms2122backend.data.db import Schema
+from dms2122backend.data.db.results import Answer, Question
+
+API_KEY = 'benchmark'
+
+
+def populate(connection_string: str, questions: int) -> None:
+    """ Inserts as many questions as given, each one answered by `user1`.
+
+    Args:
+        - connection_string (str): The database connection string.
+        - questions (int): The number of questions.
+    """
+    cfg: BackendConfiguration = BackendConfiguration()
+    cfg.set_db_connection_string(connection_string)
+    db: Schema = Schema(cfg)
+    session = db.new_session()
+    try:
+        session.execute(class_mapper(Question).local_table.insert(), [{
+            'question': f'Question {i}',
+            'description': f'Description of the question number {i}',
+            'option1': f'Option A{i}',
+            'option2': f'Option B{i}',
+            'true_answer': '1',
+            'correct_question_percentage': 10,
+            'incorrect_question_percentage': 5
+        } for i in range(questions)])
+        answers: Table = class_mapper(Answer).local_table
+        session.execute(answers.insert(), [{
+            'user': 'user1',
+            'answer': '1',
+            'questionId': i + 1
+        } for i in range(questions)])
+        session.commit()
+    finally:
+        db.remove_session()
+    db.dispose_engines()
+
+
+def start_server(mode: str, connection_string: str, port: int, threads: int,
+                 config_home: str) -> subprocess.Popen:
+    """ Starts the service in a subprocess and waits until it accepts connections.
+
+    Args:
+        - mode (str): The server mode.
+        - connection_string (str): The database connection string.
+        - port (int): The service port.
+        - threads (int): Threads of the Gunicorn worker, or of the thread pool in async mode.
+        - config_home (str): A directory for the configuration file.
+
+    Returns:
+        - subprocess.Popen: The service process.
+    """
+    os.makedirs(os.path.join(config_home, 'dms2122backend'), exist_ok=True)
+    with open(os.path.join(config_home, 'dms2122backend', 'config.yml'), 'w') as config_file:
+        yaml.safe_dump({
+            'db_connection_string': connection_string,
+            'service_host': '127.0.0.1',
+            'service_port': port,
+            'authorized_api_keys': [API_KEY],
+            'db_engine': {'pool_size': threads, 'max_overflow': 0},
+            'question_cache': {'max_entries': 0},
+            'server': {'mode': mode, 'workers': 1, 'threads': threads, 'max_requests': 0}
+        }, config_file)
+    script: str = shutil.which('dms2122backend') or os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'bin', 'dms2122backend'
+    )
+    process: subprocess.Popen = subprocess.Popen(
+        [sys.executable, script], env=dict(os.environ, XDG_CONFIG_HOME=config_home),
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline: float = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(urllib.request.Request(
+                f'http://127.0.0.1:{port}/api/v1/', method='HEAD'
+            ), timeout=1).close()
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f'The service did not start in {mode} mode')
+
+
+async def hammer(url: str, concurrency: int, requests: int) -> Tuple[float, List[float], int]:
+    """ Issues requests from concurrent clients, each one waiting for its response to send the next.
+
+    Args:
+        - url (str): The URL requested.
+        - concurrency (int): The number of concurrent clients.
+        - requests (int): The total number of requests.
+
+    Returns:
+        - Tuple[float, List[float], int]: The elapsed seconds, the latencies of the successful
+          requests and the number of failed ones.
+    """
+    latencies: List[float] = []
+    failures: int = 0
+    pending: List[int] = [requests]
+
+    async def client(session: aiohttp.ClientSession) -> None:
+        nonlocal failures
+        while pending[0] > 0:
+            pending[0] -= 1
+            start: float = time.perf_counter()
+            try:
+                async with session.get(url, headers={'X-ApiKey-Backend': API_KEY}) as response:
+                    await response.read()
+                    if response.status != 200:
+                        failures += 1
+                        continue
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                failures += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    connector: aiohttp.TCPConnector = aiohttp.TCPConnector(limit=concurrency)
+    timeout: aiohttp.ClientTimeout = aiohttp.ClientTimeout(total=120)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        start: float = time.perf_counter()
+        await asyncio.gather(*(client(session) for _ in range(concurrency)))
+        elapsed: float = time.perf_counter() - start
+    return (elapsed, sorted(latencies), failures)
+
+
+def main() -> None:
+    """ Runs the benchmark and prints a table with the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--modes', nargs='+', default=['development', 'async'],
+                        choices=['development', 'production', 'async'])
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--path', default='/questions/user1/answers?limit=20')
+    parser.add_argument('--port', type=int, default=5099)
+    parser.add_argument('--db-connection-string', default=None)
+    args = parser.parse_args()
+
+    # Every concurrent client needs a socket in both ends
+    _, hard_limit = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard_limit, hard_limit))
+    workdir: str = tempfile.mkdtemp()
+    connection_string: str = args.db_connection_string \
+        or 'sqlite:///' + os.path.join(workdir, 'backend.sqlite3.db')
+    populate(connection_string, 100)
+
+    url: str = f'http://127.0.0.1:{args.port}/api/v1{args.path}'
+    print(f'{"mode":<12} {"clients":>8} {"req/s":>9} {"p50 ms":>9} {"p99 ms":>9} {"errors":>7}')
+    for mode in args.modes:
+        process: subprocess.Popen = start_server(mode, connection_string, args.port,
+                                                 args.threads, os.path.join(workdir, mode))
+        try:
+            for concurrency in args.concurrency:
+                elapsed, latencies, failures = asyncio.run(
+                    hammer(url, concurrency, args.requests))
+                p50: float = latencies[len(latencies) // 2] * 1000 if latencies else 0.0
+                p99: float = latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0.0
+                print(f'{mode:<12} {concurrency:>8} {len(latencies) / elapsed:>9,.0f} '
+                      f'{p50:>9.1f} {p99:>9.1f} {failures:>7}')
+        finally:
+            process.terminate()
+            process.wait()
+    shutil.rmtree(workdir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+""" Microbenchmark of the JSON serialization of `list_questions` payloads.
+
+Compares the previous Connexion path (Flask's `json` module with `FlaskJSONEncoder`, indented)
+with the stdlib and `orjson` backends of `JSONSerializer`, both serializing the response and
+deserializing it back as a request body would be.
+
+Usage: `python3 benchmarks/json_serialization.py [--rows 1000 10000 100000] [--repeat 5]`
+"""
+
+import argparse
+import os
+import tempfile
+import timeit
+from typing import Callable, Dict, List, Tuple
+import flask
+from connexion.apps.flask_app import FlaskJSONEncoder
+from dms2122backend.data.config import BackendConfiguration
+from dms2122backend.data.db import Schema
+from dms2122backend.service import QuestionServices
+from dms2122common.presentation.rest import JSONSerializer
+
+
+def build_payloads(rows: List[int]) -> Dict[int, List[Dict]]:
+    """ Lists the questions of a temporary database with as many questions as the largest size.
+
+    Args:
+        - rows (List[int]): The payload sizes, in questions.
+
+    Returns:
+        - Dict[int, List[Dict]]: The `list_questions` payload of each size.
+    """
+    handle, path = tempfile.mkstemp(suffix='.sqlite3.db')
+    os.close(handle)
+    cfg: BackendConfiguration = BackendConfiguration()
+    cfg.set_db_connection_string('sqlite:///' + path)
+    db: Schema = Schema(cfg)
+    QuestionServices.create_questions([{
+        'question': f'Question {i}',
+        'description': f'¿Cuál es la respuesta correcta a la pregunta número {i}?',
+        'option1': f'Respuesta A{i}',
+        'option2': f'Respuesta B{i}',
+        'true_answer': '1' if i % 2 else '2',
+        'correct_question_percentage': 10,
+        'incorrect_question_percentage': 5
+    } for i in range(max(rows))], db, chunk_size=5000)
+    payloads: Dict[int, List[Dict]] = {
+        size: QuestionServices.list_questions(db, limit=size) for size in rows
+    }
+    os.remove(path)
+    return payloads
+
+
+def main() -> None:
+    """ Runs the benchmark and prints a table with the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    app = flask.Flask(__name__)
+    app.json_encoder = FlaskJSONEncoder
+    serializers: List[Tuple[str, Callable, Callable]] = [
+        ('flask+FlaskJSONEncoder', lambda data: flask.json.dumps(data, indent=2) + '\n',
+         flask.json.loads)
+    ]
+    for backend in ('stdlib', 'orjson'):
+        try:
+            serializer: JSONSerializer = JSONSerializer(backend)
+        except ImportError:
+            print(f'{backend}: not installed, skipped')
+            continue
+        serializers.append((backend, serializer.dumps, serializer.loads))
+
+    payloads: Dict[int, List[Dict]] = build_payloads(args.rows)
+    print(f'{"rows":>8} {"serializer":<24} {"bytes":>11} {"dumps ms":>10} {"loads ms":>10} '
+          f'{"speedup":>8}')
+    with app.app_context():
+        for size, payload in payloads.items():
+            baseline: float = 0.0
+            for name, dumps, loads in serializers:
+                body = dumps(payload)
+                dumps_time: float = min(timeit.repeat(
+                    lambda: dumps(payload), number=1, repeat=args.repeat))
+                loads_time: float = min(timeit.repeat(
+                    lambda: loads(body), number=1, repeat=args.repeat))
+                baseline = baseline or dumps_time + loads_time
+                print(f'{size:>8} {name:<24} {len(body):>11} {dumps_time * 1000:>10.2f} '
+                      f'{loads_time * 1000:>10.2f} '
+                      f'{baseline / (dumps_time + loads_time):>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+""" Benchmark of the question and answer listings, through the ORM and through Core projections.
+
+Measures the rows per second of plain ORM queries of the questions and of the answers to a
+question (ORM instances converted into dictionaries, as the services used to do) against
+`Questions.list_rows`/`Answers.list_rows_by_question` (Core rows read straight into
+dictionaries). Each listing runs in a fresh session against a temporary SQLite database.
+
+Usage: `python3 benchmarks/list_projection.py [--rows 1000 10000 100000] [--repeat 5]`
+"""
+
+import argparse
+import os
+import tempfile
+import timeit
+from typing import Callable, Dict, List, Tuple
+from sqlalchemy import Table  # type: ignore
+from sqlalchemy.orm import class_mapper  # type: ignore
+from dms2122backend.data.config import BackendConfiguration
+from dms2122backend.data.db import Schema
+from dms2122backend.data.db.results import Answer, Question
+from dms2122backend.data.db.resultsets import Answers, Questions
+from dms2122backend.service import AnswerServices, QuestionServices
+
+
+def populate(db: Schema, rows: int) -> None:
+    """ Inserts as many questions as given, and as many answers to the first one.
+
+    Args:
+        - db (Schema): The database handler.
+        - rows (int): The number of questions and answers.
+    """
+    questions: Table = class_mapper(Question).local_table
+    answers: Table = class_mapper(Answer).local_table
+    session = db.new_session()
+    try:
+        session.execute(questions.insert(), [{
+            'question': f'Question {i}',
+            'description': f'Description of the question number {i}',
+            'option1': f'Option A{i}',
+            'option2': f'Option B{i}',
+            'true_answer': '1',
+            'correct_question_percentage': 10,
+            'incorrect_question_percentage': 5
+        } for i in range(rows)])
+        session.execute(answers.insert(), [{
+            'user': f'user{i:08d}',
+            'answer': '1' if i % 2 else '2',
+            'questionId': 1
+        } for i in range(rows)])
+        session.commit()
+    finally:
+        db.remove_session()
+
+
+def listing(db: Schema, list_rows: Callable) -> Callable[[], int]:
+    """ Wraps a listing to run it in a fresh session.
+
+    Args:
+        - db (Schema): The database handler.
+        - list_rows (Callable): A function listing the rows with the given session.
+
+    Returns:
+        - Callable[[], int]: A function running the listing and returning the number of rows.
+    """
+    def run() -> int:
+        session = db.new_session()
+        try:
+            return len(list_rows(session))
+        finally:
+            db.remove_session()
+    return run
+
+
+def main() -> None:
+    """ Runs the benchmark and prints a table with the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    handle, path = tempfile.mkstemp(suffix='.sqlite3.db')
+    os.close(handle)
+    cfg: BackendConfiguration = BackendConfiguration()
+    cfg.set_db_connection_string('sqlite:///' + path)
+    db: Schema = Schema(cfg)
+    populate(db, max(args.rows))
+
+    print(f'{"rows":>8} {"listing":<10} {"ORM rows/s":>12} {"Core rows/s":>12} {"speedup":>8}')
+    for size in args.rows:
+        paths: Dict[str, Tuple[Callable, Callable]] = {
+            'questions': (
+                lambda session, size=size: [
+                    QuestionServices.question_to_dict(question)
+                    for question in session.query(Question).order_by(
+                        Question.questionId).limit(size)  # type: ignore
+                ],
+                lambda session, size=size: Questions.list_rows(session, limit=size)
+            ),
+            'answers': (
+                lambda session, size=size: [
+                    AnswerServices.answer_to_dict(answer)
+                    for answer in session.query(Answer).filter_by(questionId=1).order_by(
+                        Answer.user).limit(size)  # type: ignore
+                ],
+                lambda session, size=size: [
+                    dict(answer, answered_at=answer['answered_at'].isoformat())
+                    for answer in Answers.list_rows_by_question(session, 1, limit=size)
+                ]
+            )
+        }
+        for name, (orm_path, core_path) in paths.items():
+            rates: List[float] = []
+            for list_rows in (orm_path, core_path):
+                run: Callable[[], int] = listing(db, list_rows)
+                assert run() == size
+                rates.append(size / min(timeit.repeat(run, number=1, repeat=args.repeat)))
+            print(f'{size:>8} {name:<10} {rates[0]:>12,.0f} {rates[1]:>12,.0f} '
+                  f'{rates[1] / rates[0]:>7.1f}x')
+    os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
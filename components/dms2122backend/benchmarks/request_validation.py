@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+""" Benchmark of the validation of the request bodies of the write operations.
+
+Validates valid bodies of `POST /questions/add`, `POST /questions/bulk`, `POST
+/questions/{questionId}/answer/{username}` and `POST /questions/{username}/answers/batch` against
+their schemas in the specification, with the `jsonschema` validator Connexion uses by default and
+with the validators compiled by `SchemaCompiler`, and prints the microseconds per body of both.
+
+Usage: `python3 benchmarks/request_validation.py [--repeat 2000] [--batch-size 100]`
+"""
+
+import argparse
+import inspect
+import os
+import tempfile
+import timeit
+from typing import Any, Callable, Dict, List, Tuple
+from connexion.decorators.validation import (  # type: ignore
+    Draft4RequestValidator, draft4_format_checker
+)
+from dms2122common.presentation.rest import SchemaCompiler, SpecBundle
+import dms2122backend
+
+
+def request_body_schema(specification: Any, path: str) -> Dict:
+    """ Gets the schema of the JSON request body of a `POST` operation.
+
+    Args:
+        - specification (Specification): The Connexion specification.
+        - path (str): The path of the operation.
+
+    Returns:
+        - Dict: The JSON schema, with its `$ref`s resolved.
+    """
+    return specification['paths'][path]['post']['requestBody']['content'][
+        'application/json']['schema']
+
+
+def main() -> None:
+    """ Runs the benchmark and prints a table with the results.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=2000)
+    parser.add_argument('--batch-size', type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        specification: Any = SpecBundle(os.path.join(
+            os.path.dirname(inspect.getfile(dms2122backend)), 'openapi', 'spec.yml'
+        ), cache_dir).compile()
+    question: Dict = {
+        'question': 'Question', 'description': 'Description of the question',
+        'option1': 'Option A', 'option2': 'Option B', 'true_answer': '1',
+        'correct_question_percentage': 10, 'incorrect_question_percentage': 5
+    }
+    cases: List[Tuple[str, str, Any]] = [
+        ('question', '/questions/add', question),
+        (f'{args.batch_size} questions', '/questions/bulk',
+         [question] * args.batch_size),
+        ('answer', '/questions/{questionId}/answer/{username}',
+         {'user': 'user1', 'answer': '1', 'questionId': 1}),
+        (f'{args.batch_size} answers', '/questions/{username}/answers/batch',
+         [{'questionId': i + 1, 'answer': '1'} for i in range(args.batch_size)]),
+    ]
+    compiler: SchemaCompiler = SchemaCompiler(draft4_format_checker)
+    print(f'{"body":<16} {"jsonschema us":>14} {"compiled us":>12} {"speedup":>8}')
+    for name, path, body in cases:
+        schema: Dict = request_body_schema(specification, path)
+        interpreted: Callable[[Any], None] = Draft4RequestValidator(
+            schema, format_checker=draft4_format_checker
+        ).validate
+        compiled: Callable[[Any], None] = compiler.compile(schema)
+        results: List[float] = [
+            min(timeit.repeat(lambda validate=validate: validate(body),
+                              number=args.repeat, repeat=3)) / args.repeat * 1e6
+            for validate in (interpreted, compiled)
+        ]
+        print(f'{name:<16} {results[0]:>14.1f} {results[1]:>12.1f} '
+              f'{results[0] / results[1]:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,7 @@
 """ BackendConfiguration class module.
 """
 
-from typing import Dict
+from typing import Dict, List, Optional
 from dms2122common.data.config import ServiceConfiguration
 
 
@@ -25,6 +25,34 @@ class BackendConfiguration(ServiceConfiguration):
         ServiceConfiguration.__init__(self)
 
         self.set_db_connection_string('sqlite:////tmp/dms2122backend.sqlite3.db')
+        self.set_auto_migrate(True)
+        self.set_db_replica_connection_strings([])
+        self.set_db_replica_selection('round_robin')
+        self.set_db_replica_retry_interval(30)
+        self.set_question_cache({'max_entries': 1024, 'ttl': 60, 'version_check_interval': 1})
+        self.set_server({
+            'mode': 'development',
+            'workers': 2,
+            'threads': 4,
+            'max_requests': 10000,
+            'max_requests_jitter': 1000,
+            'timeout': 30,
+            'graceful_timeout': 30
+        })
+        self.set_db_engine({
+            'pool_size': 5,
+            'max_overflow': 10,
+            'pool_timeout': 30,
+            'pool_pre_ping': False,
+            'pool_recycle': -1,
+            'sqlite': {
+                'journal_mode': 'WAL',
+                'synchronous': 'NORMAL',
+                'cache_size': None,
+                'mmap_size': None,
+                'busy_timeout': 5000
+            }
+        })
         self.set_service_host('127.0.0.1')
         self.set_service_port(5001)
         self.set_debug_flag(True)
@@ -50,6 +78,20 @@ class BackendConfiguration(ServiceConfiguration):
 
         if 'db_connection_string' in values:
             self.set_db_connection_string(values['db_connection_string'])
+        if 'auto_migrate' in values:
+            self.set_auto_migrate(values['auto_migrate'])
+        if 'db_engine' in values:
+            self.set_db_engine(values['db_engine'])
+        if 'db_replica_connection_strings' in values:
+            self.set_db_replica_connection_strings(values['db_replica_connection_strings'])
+        if 'db_replica_selection' in values:
+            self.set_db_replica_selection(values['db_replica_selection'])
+        if 'db_replica_retry_interval' in values:
+            self.set_db_replica_retry_interval(values['db_replica_retry_interval'])
+        if 'question_cache' in values:
+            self.set_question_cache(values['question_cache'])
+        if 'server' in values:
+            self.set_server(values['server'])
         if 'salt' in values:
             self.set_password_salt(values['salt'])
         if 'jws_secret' in values:
@@ -79,6 +121,226 @@ class BackendConfiguration(ServiceConfiguration):
 
         return str(self._values['db_connection_string'])
 
+    def set_auto_migrate(self, auto_migrate: bool) -> None:
+        """ Sets whether the pending schema migrations are applied on startup.
+
+        Args:
+            - auto_migrate: A boolean with the configuration value.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        self._values['auto_migrate'] = bool(auto_migrate)
+
+    def get_auto_migrate(self) -> bool:
+        """ Gets whether the pending schema migrations are applied on startup.
+
+        Returns:
+            - bool: A boolean with the value of auto_migrate.
+        """
+
+        return bool(self._values['auto_migrate'])
+
+    def set_db_replica_connection_strings(self, connection_strings: List[str]) -> None:
+        """ Sets the db_replica_connection_strings configuration value.
+
+        Args:
+            - connection_strings: A list of strings with the connection strings of the read
+              replicas.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        self._values['db_replica_connection_strings'] = [str(cs) for cs in connection_strings]
+
+    def get_db_replica_connection_strings(self) -> List[str]:
+        """ Gets the db_replica_connection_strings configuration value.
+
+        Returns:
+            - List[str]: A list of strings with the value of db_replica_connection_strings.
+        """
+
+        return list(self._values['db_replica_connection_strings'])
+
+    def set_db_replica_selection(self, selection: str) -> None:
+        """ Sets the db_replica_selection configuration value.
+
+        Args:
+            - selection: Either `round_robin` or `least_loaded`.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        if selection not in ('round_robin', 'least_loaded'):
+            raise ValueError(f'Invalid replica selection: {selection}')
+        self._values['db_replica_selection'] = str(selection)
+
+    def get_db_replica_selection(self) -> str:
+        """ Gets the db_replica_selection configuration value.
+
+        Returns:
+            - str: A string with the value of db_replica_selection.
+        """
+
+        return str(self._values['db_replica_selection'])
+
+    def set_db_replica_retry_interval(self, retry_interval: int) -> None:
+        """ Sets the db_replica_retry_interval configuration value.
+
+        Args:
+            - retry_interval: An integer with the seconds a failed replica is left out.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        self._values['db_replica_retry_interval'] = int(retry_interval)
+
+    def get_db_replica_retry_interval(self) -> int:
+        """ Gets the db_replica_retry_interval configuration value.
+
+        Returns:
+            - int: An integer with the value of db_replica_retry_interval.
+        """
+
+        return int(self._values['db_replica_retry_interval'])
+
+    def set_question_cache(self, question_cache: Dict) -> None:
+        """ Sets the question cache configuration value.
+
+        The given values are merged with the current ones.
+
+        Args:
+            - question_cache: A dictionary with the maximum number of cached question reads
+              (`max_entries`, 0 to disable the cache), the seconds they are valid for (`ttl`)
+              and the seconds between reads of the question bank version
+              (`version_check_interval`, 0 to read it on every lookup).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        values: Dict = dict(self._values.get('question_cache', {}))
+        if 'max_entries' in question_cache:
+            values['max_entries'] = int(question_cache['max_entries'])
+        if 'ttl' in question_cache:
+            values['ttl'] = float(question_cache['ttl'])
+        if 'version_check_interval' in question_cache:
+            values['version_check_interval'] = float(question_cache['version_check_interval'])
+        if (values.get('max_entries', 0) < 0 or values.get('ttl', 0) < 0
+                or values.get('version_check_interval', 0) < 0):
+            raise ValueError('The question cache size, TTL and version check interval cannot be '
+                             'negative.')
+        self._values['question_cache'] = values
+
+    def get_question_cache(self) -> Dict:
+        """ Gets the question cache configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of question_cache.
+        """
+
+        return self._values['question_cache']
+
+    def set_server(self, server: Dict) -> None:
+        """ Sets the server configuration value.
+
+        The given values are merged with the current ones.
+
+        Args:
+            - server: A dictionary with the configuration value, with the keys:
+                - mode (str): `development` (the single-process Werkzeug server), `production`
+                  (a pre-fork multi-worker Gunicorn server) or `async` (a single-process aiohttp
+                  server).
+                - workers (int): Worker processes (production mode only).
+                - threads (int): Request handling threads per worker (production mode), or
+                  threads running the operations without an asyncio controller (async mode).
+                - max_requests (int): Requests after which a worker is recycled (0 to never).
+                - max_requests_jitter (int): Random extra requests added to `max_requests` per
+                  worker, so they are not all recycled at once.
+                - timeout (int): Seconds a worker can be silent before it is killed and replaced.
+                - graceful_timeout (int): Seconds the workers have to finish their requests when
+                  restarted or stopped.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        values: Dict = dict(self._values.get('server', {}))
+        if 'mode' in server:
+            if server['mode'] not in ('development', 'production', 'async'):
+                raise ValueError('Unknown server mode: ' + str(server['mode']))
+            values['mode'] = str(server['mode'])
+        for key in ('workers', 'threads', 'max_requests', 'max_requests_jitter', 'timeout',
+                    'graceful_timeout'):
+            if key in server:
+                values[key] = int(server[key])
+        if values.get('workers', 1) < 1 or values.get('threads', 1) < 1:
+            raise ValueError('At least one worker and thread are needed.')
+        if min(values.get(key, 0) for key in ('max_requests', 'max_requests_jitter', 'timeout',
+                                               'graceful_timeout')) < 0:
+            raise ValueError('The server request limits and timeouts cannot be negative.')
+        self._values['server'] = values
+
+    def get_server(self) -> Dict:
+        """ Gets the server configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of server.
+        """
+
+        return self._values['server']
+
+    def set_db_engine(self, db_engine: Dict) -> None:
+        """ Sets the database engine profile configuration value.
+
+        The given values are merged with the current ones, so only those to be changed need to
+        be given.
+
+        Args:
+            - db_engine: A dictionary with the configuration value, with the keys:
+                - pool_size (int): Connections kept open in the pool.
+                - max_overflow (int): Connections that can be opened beyond `pool_size`.
+                - pool_timeout (int): Seconds to wait for a connection before giving up.
+                - pool_pre_ping (bool): Whether connections are tested on checkout.
+                - pool_recycle (int): Seconds after which connections are replaced (-1 to never).
+                - sqlite (Dict): The pragmas applied to every SQLite connection: `journal_mode`,
+                  `synchronous`, `cache_size`, `mmap_size` and `busy_timeout` (`None` to keep
+                  the SQLite default).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        profile: Dict = dict(self._values.get('db_engine', {}))
+        profile['sqlite'] = dict(profile.get('sqlite', {}))
+        for key in ('pool_size', 'max_overflow', 'pool_timeout', 'pool_recycle'):
+            if key in db_engine:
+                profile[key] = int(db_engine[key])
+        if 'pool_pre_ping' in db_engine:
+            profile['pool_pre_ping'] = bool(db_engine['pool_pre_ping'])
+        sqlite: Dict = db_engine.get('sqlite') or {}
+        for key, allowed in (
+            ('journal_mode', ('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF')),
+            ('synchronous', ('OFF', 'NORMAL', 'FULL', 'EXTRA'))
+        ):
+            if key in sqlite:
+                value: Optional[str] = None
+                if sqlite[key] is not None:
+                    value = str(sqlite[key]).upper()
+                    if value not in allowed:
+                        raise ValueError(f'Invalid SQLite {key}: {sqlite[key]}')
+                profile['sqlite'][key] = value
+        for key in ('cache_size', 'mmap_size', 'busy_timeout'):
+            if key in sqlite:
+                profile['sqlite'][key] = int(sqlite[key]) if sqlite[key] is not None else None
+        self._values['db_engine'] = profile
+
+    def get_db_engine(self) -> Dict:
+        """ Gets the database engine profile configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of db_engine.
+        """
+
+        return self._values['db_engine']
+
     def set_password_salt(self, salt: str) -> None:
         """ Sets the password salt configuration value.
 
@@ -1,5 +1,6 @@
 """ Authentication database-related exceptions.
 """
 
+from .answerexistserror import AnswerExistsError
 from .questionexistserror import QuestionExistsError
 from .questionnotfounderror import QuestionNotFoundError
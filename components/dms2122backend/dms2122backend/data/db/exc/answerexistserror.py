@@ -0,0 +1,7 @@
+""" AnswerExistsError class module.
+"""
+
+
+class AnswerExistsError(Exception):
+    """ Error raised when a user attempts to answer a question already answered.
+    """
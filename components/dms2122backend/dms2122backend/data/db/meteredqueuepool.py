@@ -0,0 +1,75 @@
+""" MeteredQueuePool class module.
+"""
+
+from threading import Lock
+from time import perf_counter
+from typing import Dict
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError  # type: ignore
+from sqlalchemy.pool import QueuePool  # type: ignore
+
+
+class MeteredQueuePool(QueuePool):
+    """ Connection pool that measures how long the checkouts wait for a connection.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """ Constructor method.
+
+        Takes the same arguments as `QueuePool`.
+        """
+        super().__init__(*args, **kwargs)
+        self.__lock: Lock = Lock()
+        self.__metrics: Dict = {
+            'checkouts': 0,
+            'timeouts': 0,
+            'wait_seconds_total': 0.0,
+            'wait_seconds_max': 0.0
+        }
+
+    def _do_get(self):
+        """ Checks out a connection, measuring the time spent waiting for it.
+
+        Returns:
+            The pooled connection record.
+        """
+        start: float = perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            with self.__lock:
+                self.__metrics['timeouts'] += 1
+            raise
+        finally:
+            wait: float = perf_counter() - start
+            with self.__lock:
+                self.__metrics['checkouts'] += 1
+                self.__metrics['wait_seconds_total'] += wait
+                self.__metrics['wait_seconds_max'] = max(self.__metrics['wait_seconds_max'], wait)
+
+    def recreate(self) -> 'MeteredQueuePool':
+        """ Creates a new pool with the same configuration (e.g., when the engine is disposed).
+
+        The metrics are kept across the pools.
+
+        Returns:
+            - MeteredQueuePool: The new pool.
+        """
+        pool: MeteredQueuePool = super().recreate()
+        pool.__lock = self.__lock
+        pool.__metrics = self.__metrics
+        return pool
+
+    def get_metrics(self) -> Dict:
+        """ Gets the checkout metrics and the current status of the pool.
+
+        Returns:
+            - Dict: A dictionary with the number of checkouts and timeouts, the total and maximum
+              time waited for a connection (in seconds) and the current size, checked out and
+              overflow connections of the pool.
+        """
+        with self.__lock:
+            metrics: Dict = dict(self.__metrics)
+        metrics['size'] = self.size()
+        metrics['checked_out'] = self.checkedout()
+        metrics['overflow'] = self.overflow()
+        return metrics
@@ -0,0 +1,19 @@
+""" Backend database schema migrations.
+"""
+
+from typing import List
+from .migration import Migration
+from .migrator import Migrator
+from .initialschema import InitialSchema
+from .answersquestionindex import AnswersQuestionIndex
+from .answersgrading import AnswersGrading
+from .questionbankversioning import QuestionBankVersioning
+from .regradejobstable import RegradeJobsTable
+
+MIGRATIONS: List[Migration] = [
+    InitialSchema(),
+    AnswersQuestionIndex(),
+    AnswersGrading(),
+    QuestionBankVersioning(),
+    RegradeJobsTable()
+]
@@ -0,0 +1,68 @@
+""" AnswersGrading class module.
+"""
+
+from datetime import datetime
+from typing import Set
+from sqlalchemy import MetaData, Table, case, func, select, inspect, text  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+from .migration import Migration
+
+
+class AnswersGrading(Migration):
+    """ Adds the answering time and the graded points to the answers, and fills the scores and
+    the answer distribution with the answers given before they existed.
+    """
+
+    version: int = 3
+    description: str = 'Answer grading, scores and answer distribution'
+
+    def upgrade(self, connection: Connection, metadata: MetaData) -> None:
+        """ Upgrades the schema to this migration's version.
+
+        Args:
+            - connection (Connection): The connection to the database, within a transaction.
+            - metadata (MetaData): The current database schema metadata.
+        """
+        answers: Table = metadata.tables['answers']
+        questions: Table = metadata.tables['questions']
+        scores: Table = metadata.tables['scores']
+        answer_stats: Table = metadata.tables['answer_stats']
+        preparer = connection.dialect.identifier_preparer
+        columns: Set[str] = {
+            column['name'] for column in inspect(connection).get_columns('answers')
+        }
+
+        if 'answered_at' not in columns:
+            # Non-constant defaults cannot be used when adding columns (e.g., in SQLite)
+            connection.execute(text(
+                f'ALTER TABLE {preparer.quote(answers.name)} '
+                f'ADD COLUMN {preparer.quote("answered_at")} '
+                f'{answers.c.answered_at.type.compile(dialect=connection.dialect)}'
+            ))
+            connection.execute(answers.update().values(answered_at=datetime.utcnow()))
+        if 'points' not in columns:
+            connection.execute(text(
+                f'ALTER TABLE {preparer.quote(answers.name)} '
+                f'ADD COLUMN {preparer.quote("points")} '
+                f'{answers.c.points.type.compile(dialect=connection.dialect)} NOT NULL DEFAULT 0'
+            ))
+            connection.execute(answers.update().values(points=select([
+                case(
+                    [(answers.c.answer == questions.c.true_answer,
+                      questions.c.correct_question_percentage)],
+                    else_=-questions.c.incorrect_question_percentage
+                )
+            ]).where(questions.c.questionId == answers.c.questionId).as_scalar()))
+
+        if connection.execute(select([func.count()]).select_from(scores)).scalar() == 0:
+            connection.execute(scores.insert().from_select(
+                ['user', 'score', 'answered'],
+                select([answers.c.user, func.sum(answers.c.points), func.count()])
+                .group_by(answers.c.user)
+            ))
+        if connection.execute(select([func.count()]).select_from(answer_stats)).scalar() == 0:
+            connection.execute(answer_stats.insert().from_select(
+                ['questionId', 'answer', 'count'],
+                select([answers.c.questionId, answers.c.answer, func.count()])
+                .group_by(answers.c.questionId, answers.c.answer)
+            ))
@@ -0,0 +1,29 @@
+""" AnswersQuestionIndex class module.
+"""
+
+from sqlalchemy import MetaData, Index, inspect  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+from .migration import Migration
+
+
+class AnswersQuestionIndex(Migration):
+    """ Indexes the answers by question.
+
+    The primary key of the answers, `(user, questionId)`, does not serve lookups by question.
+    """
+
+    version: int = 2
+    description: str = 'Index answers by question'
+
+    def upgrade(self, connection: Connection, metadata: MetaData) -> None:
+        """ Upgrades the schema to this migration's version.
+
+        Args:
+            - connection (Connection): The connection to the database, within a transaction.
+            - metadata (MetaData): The current database schema metadata.
+        """
+        existing = {index['name'] for index in inspect(connection).get_indexes('answers')}
+        index: Index
+        for index in metadata.tables['answers'].indexes:
+            if index.name == 'ix_answers_questionId_user' and index.name not in existing:
+                index.create(connection)
@@ -0,0 +1,28 @@
+""" Migration class module.
+"""
+
+from abc import ABC, abstractmethod
+from sqlalchemy import MetaData  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+
+
+class Migration(ABC):
+    """ Base class for all the schema migrations.
+
+    Migrations are applied in ascending `version` order, each one in its own transaction.
+
+    Fresh databases get the current schema from the first migration, so every later migration
+    must tolerate its changes being already in place (e.g., by inspecting the database first).
+    """
+
+    version: int = 0
+    description: str = ''
+
+    @abstractmethod
+    def upgrade(self, connection: Connection, metadata: MetaData) -> None:
+        """ Upgrades the schema to this migration's version.
+
+        Args:
+            - connection (Connection): The connection to the database, within a transaction.
+            - metadata (MetaData): The current database schema metadata.
+        """
@@ -0,0 +1,30 @@
+""" QuestionBankVersioning class module.
+"""
+
+from sqlalchemy import MetaData, Table, func, select  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+from .migration import Migration
+
+
+class QuestionBankVersioning(Migration):
+    """ Adds the question bank version, used to validate cached copies of the questions.
+    """
+
+    version: int = 4
+    description: str = 'Question bank version'
+
+    def upgrade(self, connection: Connection, metadata: MetaData) -> None:
+        """ Upgrades the schema to this migration's version.
+
+        Args:
+            - connection (Connection): The connection to the database, within a transaction.
+            - metadata (MetaData): The current database schema metadata.
+        """
+        question_bank_version: Table = metadata.tables['question_bank_version']
+        question_bank_version.create(connection, checkfirst=True)
+        # The record is created here, so concurrent question changes only ever need to update it
+        if connection.execute(
+                select([func.count()]).select_from(question_bank_version)).scalar() == 0:
+            connection.execute(
+                question_bank_version.insert().values(questionBankVersionId=1, version=0)
+            )
@@ -0,0 +1,24 @@
+""" RegradeJobsTable class module.
+"""
+
+from sqlalchemy import MetaData  # type: ignore
+from sqlalchemy.engine import Connection  # type: ignore
+from .migration import Migration
+
+
+class RegradeJobsTable(Migration):
+    """ Adds the regrade jobs, so their progress is shared by (and they survive) the server
+    processes.
+    """
+
+    version: int = 5
+    description: str = 'Regrade jobs'
+
+    def upgrade(self, connection: Connection, metadata: MetaData) -> None:
+        """ Upgrades the schema to this migration's version.
+
+        Args:
+            - connection (Connection): The connection to the database, within a transaction.
+            - metadata (MetaData): The current database schema metadata.
+        """
+        metadata.tables['regrade_jobs'].create(connection, checkfirst=True)
@@ -3,3 +3,7 @@
 
 from .question import Question
 from .answer import Answer
+from .score import Score
+from .answerstat import AnswerStat
+from .questionbankversion import QuestionBankVersion
+from .regradejob import RegradeJob
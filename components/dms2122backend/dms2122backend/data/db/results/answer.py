@@ -1,7 +1,8 @@
 """ Answer class module.
 """
 
-from sqlalchemy import Table, MetaData, Column, ForeignKey, String, Integer  # type: ignore
+from datetime import datetime
+from sqlalchemy import Table, MetaData, Column, ForeignKey, String, Integer, Float, DateTime, Index  # type: ignore
 from dms2122backend.data.db.results.resultbase import ResultBase
 
 
@@ -9,7 +10,7 @@ class Answer(ResultBase):
     """ Definition and storage of user role ORM records.
     """
 
-    def __init__(self, user: str, answer: str, questionId: int):
+    def __init__(self, user: str, answer: str, questionId: int, points: float = 0.0):
         """ Constructor method.
 
         Initializes a user role record.
@@ -18,10 +19,13 @@ class Answer(ResultBase):
             - user (str): A string with the user.
             - answer (str): A string with the selected answer by the user.
             - questionId (int): An identifier for the question answered.
+            - points (float): The points the answer was graded with.
         """
         self.user: str = user
         self.answer: str = answer
         self.questionId: int = questionId
+        self.points: float = points
+        self.answered_at: datetime = datetime.utcnow()
 
     @staticmethod
     def _table_definition(metadata: MetaData) -> Table:
@@ -41,5 +45,9 @@ class Answer(ResultBase):
                    primary_key=True),
             Column('answer', String(32), nullable=False),
             Column('questionId', Integer,
-                    ForeignKey('questions.questionId'), primary_key=True)
-        )
\ No newline at end of file
+                    ForeignKey('questions.questionId'), primary_key=True),
+            Column('answered_at', DateTime, nullable=False, default=datetime.utcnow),
+            Column('points', Float, nullable=False, default=0.0),
+            # The primary key only serves lookups by user; this one serves those by question.
+            Index('ix_answers_questionId_user', 'questionId', 'user')
+        )
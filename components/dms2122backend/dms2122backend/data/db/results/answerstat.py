@@ -0,0 +1,47 @@
+""" AnswerStat class module.
+"""
+
+from sqlalchemy import Table, MetaData, Column, String, Integer, ForeignKey  # type: ignore
+from dms2122backend.data.db.results.resultbase import ResultBase
+
+
+class AnswerStat(ResultBase):
+    """ Definition and storage of answer distribution ORM records.
+
+    Each record counts how many times a given answer has been given to a question; the counts
+    are maintained as the answers are stored.
+    """
+
+    def __init__(self, questionId: int, answer: str, count: int = 0):
+        """ Constructor method.
+
+        Initializes an answer distribution record.
+
+        Args:
+            - questionId (int): The question identifier.
+            - answer (str): A string with the answer.
+            - count (int): The number of times the answer has been given to the question.
+        """
+        self.questionId: int = questionId
+        self.answer: str = answer
+        self.count: int = count
+
+    @staticmethod
+    def _table_definition(metadata: MetaData) -> Table:
+        """ Gets the table definition.
+
+        Args:
+            - metadata (MetaData): The database schema metadata
+                        (used to gather the entities' definitions and mapping)
+
+        Returns:
+            - Table: A `Table` object with the table definition.
+        """
+        return Table(
+            'answer_stats',
+            metadata,
+            Column('questionId', Integer,
+                   ForeignKey('questions.questionId'), primary_key=True),
+            Column('answer', String(32), primary_key=True),
+            Column('count', Integer, nullable=False, default=0)
+        )
@@ -0,0 +1,43 @@
+""" QuestionBankVersion class module.
+"""
+
+from sqlalchemy import Table, MetaData, Column, Integer  # type: ignore
+from dms2122backend.data.db.results.resultbase import ResultBase
+
+
+class QuestionBankVersion(ResultBase):
+    """ Definition and storage of the question bank version ORM record.
+
+    The version is increased on every change of the questions, so it identifies the state of
+    the question bank (e.g., to validate cached copies of it).
+    """
+
+    def __init__(self, questionBankVersionId: int = 1, version: int = 0):
+        """ Constructor method.
+
+        Initializes the question bank version record.
+
+        Args:
+            - questionBankVersionId (int): The record identifier (there is a single record).
+            - version (int): The question bank version.
+        """
+        self.questionBankVersionId: int = questionBankVersionId
+        self.version: int = version
+
+    @staticmethod
+    def _table_definition(metadata: MetaData) -> Table:
+        """ Gets the table definition.
+
+        Args:
+            - metadata (MetaData): The database schema metadata
+                        (used to gather the entities' definitions and mapping)
+
+        Returns:
+            - Table: A `Table` object with the table definition.
+        """
+        return Table(
+            'question_bank_version',
+            metadata,
+            Column('questionBankVersionId', Integer, primary_key=True, autoincrement=False),
+            Column('version', Integer, nullable=False, default=0)
+        )
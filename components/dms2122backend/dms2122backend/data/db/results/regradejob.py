@@ -0,0 +1,70 @@
+""" RegradeJob class module.
+"""
+
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Table, MetaData, Column, ForeignKey, String, Integer, DateTime, Text  # type: ignore
+from dms2122backend.data.db.results.resultbase import ResultBase
+
+
+class RegradeJob(ResultBase):
+    """ Definition and storage of the regrade job ORM records.
+
+    There is a record per regraded question, with its latest regrade. Running regrades store the
+    last user regraded (the cursor to resume them from) and refresh their heartbeat on every
+    batch, so those abandoned by a stopped process can be told apart and resumed.
+    """
+
+    def __init__(self, questionId: int, status: str = 'pending', total: int = 0,
+                 processed: int = 0, after: Optional[str] = None, owner: Optional[str] = None,
+                 created_at: Optional[datetime] = None):
+        """ Constructor method.
+
+        Initializes a regrade job record.
+
+        Args:
+            - questionId (int): The identifier of the regraded question.
+            - status (str): The status of the regrade (`pending`, `running`, `done` or `failed`).
+            - total (int): The number of answers to regrade.
+            - processed (int): The number of answers already regraded.
+            - after (Optional[str]): The last user whose answer has been regraded.
+            - owner (Optional[str]): The token of the regrade thread running the job.
+            - created_at (Optional[datetime]): When the regrade was scheduled (UTC).
+        """
+        self.questionId: int = questionId
+        self.status: str = status
+        self.total: int = total
+        self.processed: int = processed
+        self.after: Optional[str] = after
+        self.owner: Optional[str] = owner
+        self.created_at: datetime = created_at or datetime.utcnow()
+        self.heartbeat_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.error: Optional[str] = None
+
+    @staticmethod
+    def _table_definition(metadata: MetaData) -> Table:
+        """ Gets the table definition.
+
+        Args:
+            - metadata (MetaData): The database schema metadata
+                        (used to gather the entities' definitions and mapping)
+
+        Returns:
+            - Table: A `Table` object with the table definition.
+        """
+        return Table(
+            'regrade_jobs',
+            metadata,
+            Column('questionId', Integer,
+                   ForeignKey('questions.questionId'), primary_key=True, autoincrement=False),
+            Column('status', String(16), nullable=False),
+            Column('total', Integer, nullable=False, default=0),
+            Column('processed', Integer, nullable=False, default=0),
+            Column('after', String(32), nullable=True),
+            Column('owner', String(32), nullable=True),
+            Column('created_at', DateTime, nullable=False, default=datetime.utcnow),
+            Column('heartbeat_at', DateTime, nullable=True),
+            Column('finished_at', DateTime, nullable=True),
+            Column('error', Text, nullable=True)
+        )
@@ -0,0 +1,46 @@
+""" Score class module.
+"""
+
+from sqlalchemy import Table, MetaData, Column, String, Integer, Float  # type: ignore
+from dms2122backend.data.db.results.resultbase import ResultBase
+
+
+class Score(ResultBase):
+    """ Definition and storage of user score ORM records.
+
+    Scores are maintained incrementally as the answers are stored, so reading a user's grade
+    does not require going through their answers.
+    """
+
+    def __init__(self, user: str, score: float = 0.0, answered: int = 0):
+        """ Constructor method.
+
+        Initializes a user score record.
+
+        Args:
+            - user (str): A string with the user.
+            - score (float): The sum of the points of every answer given by the user.
+            - answered (int): The number of questions answered by the user.
+        """
+        self.user: str = user
+        self.score: float = score
+        self.answered: int = answered
+
+    @staticmethod
+    def _table_definition(metadata: MetaData) -> Table:
+        """ Gets the table definition.
+
+        Args:
+            - metadata (MetaData): The database schema metadata
+                        (used to gather the entities' definitions and mapping)
+
+        Returns:
+            - Table: A `Table` object with the table definition.
+        """
+        return Table(
+            'scores',
+            metadata,
+            Column('user', String(32), primary_key=True),
+            Column('score', Float, nullable=False, default=0.0),
+            Column('answered', Integer, nullable=False, default=0)
+        )
@@ -3,3 +3,7 @@
 
 from .questions import Questions
 from .answers import Answers
+from .scores import Scores
+from .answerstats import AnswerStats
+from .questionbankversions import QuestionBankVersions
+from .regradejobs import RegradeJobs
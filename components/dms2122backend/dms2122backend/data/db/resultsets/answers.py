@@ -1,19 +1,27 @@
 """ Answers class module.
 """
 
-from typing import Optional, List
+from datetime import datetime
+from collections import Counter
+from typing import Optional, List, Dict, Set, Tuple
+from sqlalchemy import Table, select  # type: ignore
 from sqlalchemy.exc import IntegrityError  # type: ignore
-from sqlalchemy.orm import Session  # type: ignore
+from sqlalchemy.orm import Session, class_mapper  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
-from dms2122backend.data.db.exc import QuestionNotFoundError  # type: ignore
-from dms2122backend.data.db.results import Answer
+from dms2122backend.data.db.exc import AnswerExistsError, QuestionNotFoundError  # type: ignore
+from dms2122backend.data.db.results import Answer, Question
+from dms2122backend.data.db.resultsets.answerstats import AnswerStats
+from dms2122backend.data.db.resultsets.scores import Scores
 
 class Answers():
     """ Class responsible of table-level answers operations.
     """
     @staticmethod
     def create(session: Session, user: str, answer: str, questionId: int) -> Answer:
-        """ Grants a role to a user.
+        """ Stores the answer of a user to a question.
+
+        The answer is graded, and the user's score and the answer distribution of the question
+        are updated within the same transaction.
 
         Note:
             Any existing transaction will be committed.
@@ -27,65 +35,225 @@ class Answers():
         Raises:
             - ValueError: If any field is missing.
             - QuestionNotFoundError: If the question doesn't exist.
+            - AnswerExistsError: If the user had already answered the question.
 
         Returns:
             - Answer: The created `Answer` result.
         """
         if not user or not answer or not questionId:
             raise ValueError('A user, answer and questionId are required.')
+        question: Optional[Question] = session.query(Question).get(questionId)
+        if question is None:
+            raise QuestionNotFoundError()
         try:
-            new_answer = Answer(user, answer, questionId)
+            points: float = Scores.grade(question.true_answer, question.correct_question_percentage,
+                                         question.incorrect_question_percentage, answer)
+            new_answer = Answer(user, answer, questionId, points)
             session.add(new_answer)
+            try:
+                session.flush()
+            except IntegrityError as ex:
+                raise AnswerExistsError() from ex
+            Scores.add(session, user, points)
+            AnswerStats.add(session, questionId, answer)
             session.commit()
             return new_answer
-        except IntegrityError as ex:
-            session.rollback()
-            raise QuestionNotFoundError() from ex
         except:
             session.rollback()
             raise
 
     @staticmethod
-    def list_all_by_question(session: Session, questionId: int) -> List[Answer]:
-        """Lists the `Answer`s assigned to a question.
+    def create_many(session: Session, user: str, answers: List[Dict]) -> List[str]:
+        """ Stores several answers of a user in a single transaction.
+
+        The answers are graded, and the user's score and the answer distribution of the questions
+        are updated within the same transaction.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - user (str): The user name string.
+            - answers (List[Dict]): The answers, each one a dictionary with its `questionId` and
+              its `answer`.
+
+        Raises:
+            - ValueError: If the user is missing.
+
+        Returns:
+            - List[str]: The status of each answer, in the same order as given:
+                - `created` if it was stored.
+                - `invalid` if either the question identifier or the answer is missing.
+                - `not_found` if the question does not exist.
+                - `duplicate` if the user had already answered the question (or the question
+                  appears more than once in the batch).
+        """
+        if not user:
+            raise ValueError('A user is required.')
+        table: Table = class_mapper(Answer).local_table
+        questions_table: Table = class_mapper(Question).local_table
+        question_ids: List[int] = [
+            eachAnswer['questionId'] for eachAnswer in answers if eachAnswer.get('questionId')
+        ]
+        # A concurrent submission may sneak in between the checks and the insertion; in that
+        # case the checks are run once more against the now committed answers.
+        for attempt in range(2):
+            existing: Dict[int, Question] = {
+                eachQuestion.questionId: eachQuestion for eachQuestion in
+                session.query(Question).filter(questions_table.c.questionId.in_(question_ids))
+            }
+            answered: Set[int] = {
+                questionId for (questionId,) in session.execute(
+                    select([table.c.questionId]).where(
+                        (table.c.user == user) & table.c.questionId.in_(question_ids)
+                    )
+                )
+            }
+            statuses: List[str] = []
+            rows: List[Dict] = []
+            points: float = 0.0
+            now: datetime = datetime.utcnow()
+            for eachAnswer in answers:
+                questionId = eachAnswer.get('questionId')
+                if not questionId or not eachAnswer.get('answer'):
+                    statuses.append('invalid')
+                elif questionId not in existing:
+                    statuses.append('not_found')
+                elif questionId in answered:
+                    statuses.append('duplicate')
+                else:
+                    answered.add(questionId)
+                    statuses.append('created')
+                    question: Question = existing[questionId]
+                    answer_points: float = Scores.grade(
+                        question.true_answer, question.correct_question_percentage,
+                        question.incorrect_question_percentage, eachAnswer['answer'])
+                    points += answer_points
+                    rows.append({
+                        'user': user,
+                        'answer': eachAnswer['answer'],
+                        'questionId': questionId,
+                        'answered_at': now,
+                        'points': answer_points
+                    })
+            try:
+                if rows:
+                    session.execute(table.insert(), rows)
+                    Scores.add(session, user, points, len(rows))
+                    given: Counter[Tuple[int, str]] = Counter(
+                        (row['questionId'], row['answer']) for row in rows
+                    )
+                    for (givenQuestionId, givenAnswer), count in given.items():
+                        AnswerStats.add(session, givenQuestionId, givenAnswer, count)
+                session.commit()
+                return statuses
+            except IntegrityError:
+                session.rollback()
+                if attempt > 0:
+                    raise
+            except:
+                session.rollback()
+                raise
+        return statuses
+
+    @staticmethod
+    def list_rows_by_question(session: Session, questionId: int, after: Optional[str] = None,
+                              limit: Optional[int] = None,
+                              since: Optional[datetime] = None) -> List[Dict]:
+        """Lists the data of the answers to a question, ordered by user.
+
+        Pagination is keyset-based: the user of the last answer of a page is the cursor used
+        to request the next one.
+
+        Rows are read with a Core query straight into dictionaries, skipping the ORM instances
+        and their identity map bookkeeping.
 
         Args:
             - session (Session): The session object.
             - questionId (int): The question identifier.
+            - after (Optional[str]): If given, only answers of users sorted after this one are listed.
+            - limit (Optional[int]): If given, the maximum number of answers to list.
+            - since (Optional[datetime]): If given, only answers given from this moment (UTC) on
+              are listed.
 
         Raises:
             - ValueError: If the question is missing.
 
         Returns:
-            - List[Answer]: A list of `Answer` registered with the question.
+            - List[Dict]: A list of dictionaries with the `user`, `questionId`, `answer` and
+              `answered_at` of each answer.
         """
         if not questionId:
             raise ValueError('A questionId is required.')
-        query = session.query(Answer).filter_by(
-            questionId=questionId
-        )
-        return query.all()
+        table: Table = class_mapper(Answer).local_table
+        query = select([table.c.user, table.c.questionId, table.c.answer, table.c.answered_at]) \
+            .where(table.c.questionId == questionId)
+        if since is not None:
+            query = query.where(table.c.answered_at >= since)
+        if after is not None:
+            query = query.where(table.c.user > after)
+        query = query.order_by(table.c.user)
+        if limit is not None:
+            query = query.limit(limit)
+        return Answers.__fetch_rows(session, query)
 
     @staticmethod
-    def list_all_by_user(session: Session, user: str) -> List[Answer]:
-        """Lists the `Answer`s assigned to a certain user.
+    def list_rows_by_user(session: Session, user: str, after: Optional[int] = None,
+                          limit: Optional[int] = None,
+                          since: Optional[datetime] = None) -> List[Dict]:
+        """Lists the data of the answers of a certain user, ordered by question.
+
+        Pagination is keyset-based: the question identifier of the last answer of a page is the
+        cursor used to request the next one.
+
+        Rows are read with a Core query straight into dictionaries, skipping the ORM instances
+        and their identity map bookkeeping.
 
         Args:
             - session (Session): The session object.
             - user (str): The user name string.
+            - after (Optional[int]): If given, only answers to questions with a greater identifier
+              are listed.
+            - limit (Optional[int]): If given, the maximum number of answers to list.
+            - since (Optional[datetime]): If given, only answers given from this moment (UTC) on
+              are listed.
 
         Raises:
             - ValueError: If the user is missing.
 
         Returns:
-            - List[Answer]: A list of `Answer` registers with the user roles.
+            - List[Dict]: A list of dictionaries with the `user`, `questionId`, `answer` and
+              `answered_at` of each answer.
         """
         if not user:
             raise ValueError('A user is required.')
-        query = session.query(Answer).filter_by(
-            user=user
-        )
-        return query.all()
+        table: Table = class_mapper(Answer).local_table
+        query = select([table.c.user, table.c.questionId, table.c.answer, table.c.answered_at]) \
+            .where(table.c.user == user)
+        if since is not None:
+            query = query.where(table.c.answered_at >= since)
+        if after is not None:
+            query = query.where(table.c.questionId > after)
+        query = query.order_by(table.c.questionId)
+        if limit is not None:
+            query = query.limit(limit)
+        return Answers.__fetch_rows(session, query)
+
+    @staticmethod
+    def __fetch_rows(session: Session, query) -> List[Dict]:
+        """Runs a query, converting its rows into dictionaries.
+
+        Args:
+            - session (Session): The session object.
+            - query (Select): The query.
+
+        Returns:
+            - List[Dict]: A dictionary per row, with a key per selected column.
+        """
+        result = session.execute(query)
+        keys: List[str] = list(result.keys())
+        return [dict(zip(keys, row)) for row in result]
 
 
     @staticmethod
@@ -0,0 +1,71 @@
+""" AnswerStats class module.
+"""
+
+from typing import List, Optional, Tuple
+from sqlalchemy import Table, select  # type: ignore
+from sqlalchemy.exc import IntegrityError  # type: ignore
+from sqlalchemy.orm import Session, class_mapper  # type: ignore
+from dms2122backend.data.db.results import AnswerStat, Question
+
+
+class AnswerStats():
+    """ Class responsible of table-level answer distribution operations.
+    """
+    @staticmethod
+    def add(session: Session, questionId: int, answer: str, count: int = 1) -> None:
+        """ Adds to the number of times an answer has been given to a question.
+
+        Note:
+            The changes are not committed, so they take effect within the transaction of the
+            answers being stored. The pending ORM changes of the session are flushed first.
+
+        Args:
+            - session (Session): The session object.
+            - questionId (int): The question identifier.
+            - answer (str): The given answer.
+            - count (int): The number of times to add.
+        """
+        table: Table = class_mapper(AnswerStat).local_table
+        update = table.update().where(
+            (table.c.questionId == questionId) & (table.c.answer == answer)
+        ).values(count=table.c.count + count)
+        session.flush()
+        if session.execute(update).rowcount > 0:
+            return
+        try:
+            with session.begin_nested():
+                session.execute(table.insert().values(questionId=questionId, answer=answer,
+                                                      count=count))
+        except IntegrityError:
+            # The answer was first given to the question by a concurrent transaction meanwhile
+            session.execute(update)
+
+    @staticmethod
+    def list_by_questions(session: Session, questionIds: Optional[List[int]] = None
+                          ) -> List[Tuple[int, Optional[str], Optional[int]]]:
+        """ Lists the answer distribution of several questions in a single query.
+
+        Args:
+            - session (Session): The session object.
+            - questionIds (Optional[List[int]]): The question identifiers. All the questions if
+              not given.
+
+        Returns:
+            - List[Tuple[int, Optional[str], Optional[int]]]: The question identifier, answer and
+              count tuples, ordered by question and answer. Questions without answers appear once,
+              with `None` as answer and count.
+        """
+        questions: Table = class_mapper(Question).local_table
+        answer_stats: Table = class_mapper(AnswerStat).local_table
+        query = select([
+            questions.c.questionId, answer_stats.c.answer, answer_stats.c.count
+        ]).select_from(questions.outerjoin(
+            answer_stats, answer_stats.c.questionId == questions.c.questionId
+        ))
+        if questionIds is not None:
+            query = query.where(questions.c.questionId.in_(questionIds))
+        return [
+            (questionId, answer, count) for (questionId, answer, count) in session.execute(
+                query.order_by(questions.c.questionId, answer_stats.c.answer)
+            )
+        ]
@@ -0,0 +1,46 @@
+""" QuestionBankVersions class module.
+"""
+
+from sqlalchemy import Table, select  # type: ignore
+from sqlalchemy.orm import Session, class_mapper  # type: ignore
+from dms2122backend.data.db.results import QuestionBankVersion
+
+
+class QuestionBankVersions():
+    """ Class responsible of table-level question bank version operations.
+    """
+    @staticmethod
+    def get(session: Session) -> int:
+        """ Gets the question bank version.
+
+        Args:
+            - session (Session): The session object.
+
+        Returns:
+            - int: The question bank version (0 if the questions have never been changed).
+        """
+        table: Table = class_mapper(QuestionBankVersion).local_table
+        return session.execute(
+            select([table.c.version]).where(table.c.questionBankVersionId == 1)
+        ).scalar() or 0
+
+    @staticmethod
+    def bump(session: Session) -> None:
+        """ Increases the question bank version.
+
+        Note:
+            The changes are not committed, so they take effect within the transaction of the
+            questions being changed.
+
+            The version record is created by the schema migrations, so it is only ever
+            updated (concurrent insertions of it would conflict).
+
+        Args:
+            - session (Session): The session object.
+        """
+        table: Table = class_mapper(QuestionBankVersion).local_table
+        session.execute(
+            table.update().where(table.c.questionBankVersionId == 1).values(
+                version=table.c.version + 1
+            )
+        )
@@ -2,13 +2,16 @@
 """
 
 import hashlib
-from typing import Optional, List
+from typing import Optional, List, Iterator, Dict
+from sqlalchemy import Table, select  # type: ignore
 from sqlalchemy.exc import IntegrityError  # type: ignore
+from sqlalchemy.orm import class_mapper  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound # type: ignore
 from dms2122backend.data.db.exc.questionnotfounderror import QuestionNotFoundError  # type: ignore
 from dms2122backend.data.db.results import Question
 from dms2122backend.data.db.exc import QuestionExistsError
+from dms2122backend.data.db.resultsets.questionbankversions import QuestionBankVersions
 
 
 class Questions():
@@ -39,12 +42,13 @@ class Questions():
         Returns:
             - Question: The created `Question` result.
         """
-        if not question or not option1 or not option2 or not true_answer or not correct_question_percentage or not incorrect_question_percentage:
-            raise ValueError('ERROR. The following fields are required:\n-Question\n-Description (optional field) \n-First option\n-Second option\n-True answer\n-Correct question percentage\n-Incorrect question percentage')
+        Questions.validate(question, option1, option2, true_answer,
+                           correct_question_percentage, incorrect_question_percentage)
         try:
             new_question = Question(question, description, option1, option2, 
                                     true_answer, correct_question_percentage, incorrect_question_percentage)
             session.add(new_question)
+            QuestionBankVersions.bump(session)
             session.commit()
             return new_question
         except IntegrityError as ex:
@@ -53,18 +57,135 @@ class Questions():
                 ) from ex
 
     @staticmethod
-    def list_all(session: Session) -> List[Question]:
-        """Lists every question.
+    def create_many(session: Session, questions: List[Dict], chunk_size: int = 500) -> List[bool]:
+        """ Creates several question records at once.
+
+        The records are inserted with a single multi-row statement per chunk, each chunk in its
+        own transaction. If a chunk fails, its records are retried one by one so only the
+        offending ones are left out.
+
+        Note:
+            Any existing transaction will be committed.
 
         Args:
             - session (Session): The session object.
+            - questions (List[Dict]): The already validated questions' data, with a key per
+              `questions` column (except `questionId`).
+            - chunk_size (int): The maximum number of questions inserted per transaction.
 
         Returns:
-            - List[Question]: A list of `Question` registers.
+            - List[bool]: Whether each of the given questions was created (`True`) or not.
         """
-        query = session.query(Question)
-        return query.all()
-    
+        table: Table = class_mapper(Question).local_table
+        created: List[bool] = []
+        for start in range(0, len(questions), chunk_size):
+            chunk: List[Dict] = questions[start:start + chunk_size]
+            try:
+                session.execute(table.insert(), chunk)
+                QuestionBankVersions.bump(session)
+                session.commit()
+                created.extend([True] * len(chunk))
+                continue
+            except IntegrityError:
+                session.rollback()
+            for eachQuestion in chunk:
+                try:
+                    session.execute(table.insert(), eachQuestion)
+                    QuestionBankVersions.bump(session)
+                    session.commit()
+                    created.append(True)
+                except IntegrityError:
+                    session.rollback()
+                    created.append(False)
+        return created
+
+    @staticmethod
+    def validate(question:str, option1:str, option2:str, true_answer:str,
+                 correct_question_percentage:float, incorrect_question_percentage:float) -> None:
+        """ Validates the data of a question.
+
+        Args:
+            - question (str): The question string.
+            - option1 (str): The first option string.
+            - option2 (str): The second option string.
+            - true_answer (str): The true answer string.
+            - correct_question_percentage (float): The correct question percentage value.
+            - incorrect_question_percentage (float): The incorrect question percentage value.
+
+        Raises:
+            - ValueError: If any of the fields are not found.
+        """
+        if not question or not option1 or not option2 or not true_answer or not correct_question_percentage or not incorrect_question_percentage:
+            raise ValueError('ERROR. The following fields are required:\n-Question\n-Description (optional field) \n-First option\n-Second option\n-True answer\n-Correct question percentage\n-Incorrect question percentage')
+
+    @staticmethod
+    def list_rows(session: Session, after: Optional[int] = None,
+                  limit: Optional[int] = None) -> List[Dict]:
+        """Lists the questions' data, ordered by their identifier.
+
+        Pagination is keyset-based: the identifier of the last question of a page is the
+        cursor used to request the next one.
+
+        Rows are read with a Core query straight into dictionaries, skipping the ORM instances
+        and their identity map bookkeeping.
+
+        Args:
+            - session (Session): The session object.
+            - after (Optional[int]): If given, only questions with a greater identifier are listed.
+            - limit (Optional[int]): If given, the maximum number of questions to list.
+
+        Returns:
+            - List[Dict]: A list of dictionaries with a key per `questions` column.
+        """
+        query = Questions.__select_rows(after)
+        if limit is not None:
+            query = query.limit(limit)
+        result = session.execute(query)
+        keys: List[str] = list(result.keys())
+        return [dict(zip(keys, row)) for row in result]
+
+    @staticmethod
+    def iterate_rows(session: Session, after: Optional[int] = None,
+                     batch_size: int = 500) -> Iterator[Dict]:
+        """Iterates over the questions' data, ordered by their identifier.
+
+        Like `list_rows`, but fetching the rows from a server-side cursor in batches.
+
+        Args:
+            - session (Session): The session object.
+            - after (Optional[int]): If given, only questions with a greater identifier are listed.
+            - batch_size (int): The number of rows fetched from the cursor at a time.
+
+        Returns:
+            - Iterator[Dict]: An iterator of dictionaries with a key per `questions` column.
+        """
+        result = session.execute(
+            Questions.__select_rows(after).execution_options(stream_results=True)
+        )
+        keys: List[str] = list(result.keys())
+        while True:
+            rows = result.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(zip(keys, row))
+
+    @staticmethod
+    def __select_rows(after: Optional[int] = None):
+        """Builds the query of the questions listings.
+
+        Args:
+            - after (Optional[int]): If given, only questions with a greater identifier are listed.
+
+        Returns:
+            - Select: The query.
+        """
+        table: Table = class_mapper(Question).local_table
+        query = select([table]).order_by(table.c.questionId)
+        if after is not None:
+            query = query.where(table.c.questionId > after)
+        return query
+
     @staticmethod
     def get_question_id(session: Session, questionId: int) -> Optional[Question]:
         """ Returns a question (if exists).
@@ -120,6 +241,7 @@ class Questions():
             editedQuestion.true_answer = true_answer
             editedQuestion.correct_question_percentage = correct_question_percentage
             editedQuestion.incorrect_question_percentage = incorrect_question_percentage
+            QuestionBankVersions.bump(session)
 
             session.commit()
             return editedQuestion
@@ -0,0 +1,151 @@
+""" RegradeJobs class module.
+"""
+
+from datetime import datetime
+from typing import Dict, Optional
+from sqlalchemy import Table, and_, or_, select  # type: ignore
+from sqlalchemy.exc import IntegrityError  # type: ignore
+from sqlalchemy.orm import Session, class_mapper  # type: ignore
+from dms2122backend.data.db.results import RegradeJob
+
+
+class RegradeJobs():
+    """ Class responsible of table-level regrade job operations.
+
+    Jobs are claimed by setting their owner token; every later change of a job is conditioned on
+    the owner not having changed, so a job rescheduled or taken over by another process is just
+    abandoned by its former owner.
+    """
+    @staticmethod
+    def schedule(session: Session, questionId: int) -> RegradeJob:
+        """ Schedules the regrade of a question, replacing its latest regrade.
+
+        If a regrade of the question is already waiting to be run, that one is kept instead.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - questionId (int): The question identifier.
+
+        Raises:
+            - ValueError: If the question identifier is missing.
+
+        Returns:
+            - RegradeJob: The pending `RegradeJob` result.
+        """
+        if not questionId:
+            raise ValueError('A questionId is required.')
+        table: Table = class_mapper(RegradeJob).local_table
+        # Two processes may insert the first regrade of a question at once; the loser reschedules
+        # over the winner's one.
+        for attempt in range(2):
+            try:
+                job: Optional[RegradeJob] = session.query(RegradeJob).get(questionId)
+                if job is None:
+                    session.add(RegradeJob(questionId))
+                elif job.status != 'pending':
+                    session.execute(table.update().where(table.c.questionId == questionId).values(
+                        status='pending', total=0, processed=0, after=None, owner=None,
+                        created_at=datetime.utcnow(), heartbeat_at=None, finished_at=None,
+                        error=None
+                    ))
+                session.commit()
+                break
+            except IntegrityError:
+                session.rollback()
+                if attempt > 0:
+                    raise
+            except:
+                session.rollback()
+                raise
+        session.expire_all()
+        return session.query(RegradeJob).get(questionId)
+
+    @staticmethod
+    def get(session: Session, questionId: int) -> Optional[RegradeJob]:
+        """ Gets the latest regrade of a question.
+
+        Args:
+            - session (Session): The session object.
+            - questionId (int): The question identifier.
+
+        Returns:
+            - Optional[RegradeJob]: The `RegradeJob` result, or `None` if the question has never
+              been regraded.
+        """
+        return session.query(RegradeJob).get(questionId)
+
+    @staticmethod
+    def claim(session: Session, owner: str, stale_before: datetime) -> Optional[RegradeJob]:
+        """ Claims the oldest regrade waiting to be run, or abandoned while running.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - owner (str): The token identifying the claimer.
+            - stale_before (datetime): Running regrades whose heartbeat is older than this
+              (UTC) are considered abandoned.
+
+        Returns:
+            - Optional[RegradeJob]: The claimed `RegradeJob` result, now running, or `None` if
+              there is none to run.
+        """
+        table: Table = class_mapper(RegradeJob).local_table
+        while True:
+            candidate = session.execute(
+                select([table.c.questionId, table.c.owner]).where(or_(
+                    table.c.status == 'pending',
+                    and_(table.c.status == 'running', table.c.heartbeat_at < stale_before)
+                )).order_by(table.c.created_at).limit(1)
+            ).first()
+            if candidate is None:
+                session.commit()
+                return None
+            questionId, former_owner = candidate
+            try:
+                # Claimed only if nobody else has in the meantime
+                result = session.execute(table.update().where(and_(
+                    table.c.questionId == questionId,
+                    table.c.owner.is_(None) if former_owner is None
+                    else table.c.owner == former_owner
+                )).values(status='running', owner=owner, heartbeat_at=datetime.utcnow()))
+                session.commit()
+            except:
+                session.rollback()
+                raise
+            if result.rowcount == 1:
+                session.expire_all()
+                return session.query(RegradeJob).get(questionId)
+
+    @staticmethod
+    def update(session: Session, questionId: int, owner: str, values: Dict) -> bool:
+        """ Updates a regrade, refreshing its heartbeat, as long as it is still claimed by the
+        given owner.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - questionId (int): The question identifier.
+            - owner (str): The token identifying the claimer.
+            - values (Dict): The new values of the regrade fields.
+
+        Returns:
+            - bool: `False` if the regrade is no longer claimed by the owner (it has been
+              rescheduled or taken over), so it must be abandoned.
+        """
+        table: Table = class_mapper(RegradeJob).local_table
+        try:
+            result = session.execute(table.update().where(and_(
+                table.c.questionId == questionId, table.c.owner == owner
+            )).values(heartbeat_at=datetime.utcnow(), **values))
+            session.commit()
+        except:
+            session.rollback()
+            raise
+        return result.rowcount == 1
@@ -0,0 +1,152 @@
+""" Scores class module.
+"""
+
+from typing import List, Optional
+from sqlalchemy import Table, and_, case, func, select  # type: ignore
+from sqlalchemy.exc import IntegrityError  # type: ignore
+from sqlalchemy.orm import Session, class_mapper  # type: ignore
+from dms2122backend.data.db.results import Answer, Score
+
+
+class Scores():
+    """ Class responsible of table-level scores operations.
+    """
+    @staticmethod
+    def grade(true_answer: str, correct_question_percentage: float,
+              incorrect_question_percentage: float, answer: str) -> float:
+        """ Computes the points an answer to a question is worth.
+
+        Args:
+            - true_answer (str): The true answer of the question.
+            - correct_question_percentage (float): The points added if the answer is correct.
+            - incorrect_question_percentage (float): The points substracted if it is incorrect.
+            - answer (str): The given answer.
+
+        Returns:
+            - float: The points of the answer (negative if incorrect).
+        """
+        if answer == true_answer:
+            return float(correct_question_percentage)
+        return -float(incorrect_question_percentage)
+
+    @staticmethod
+    def add(session: Session, user: str, points: float, answered: int = 1) -> None:
+        """ Adds points (and answered questions) to the score of a user.
+
+        Note:
+            The changes are not committed, so they take effect within the transaction of the
+            answers being stored. The pending ORM changes of the session are flushed first.
+
+        Args:
+            - session (Session): The session object.
+            - user (str): The user name string.
+            - points (float): The points to add (negative to substract).
+            - answered (int): The number of answered questions to add.
+        """
+        table: Table = class_mapper(Score).local_table
+        update = table.update().where(table.c.user == user).values(
+            score=table.c.score + points,
+            answered=table.c.answered + answered
+        )
+        session.flush()
+        if session.execute(update).rowcount > 0:
+            return
+        try:
+            with session.begin_nested():
+                session.execute(table.insert().values(user=user, score=points, answered=answered))
+        except IntegrityError:
+            # The first score of the user was inserted by a concurrent transaction meanwhile
+            session.execute(update)
+
+    @staticmethod
+    def get(session: Session, user: str) -> Optional[Score]:
+        """ Gets the score of a user.
+
+        Args:
+            - session (Session): The session object.
+            - user (str): The user name string.
+
+        Raises:
+            - ValueError: If the user is missing.
+
+        Returns:
+            - Optional[Score]: The `Score` of the user, or `None` if the user has not answered
+              any question yet.
+        """
+        if not user:
+            raise ValueError('A user is required.')
+        return session.query(Score).get(user)
+
+    @staticmethod
+    def count_graded(session: Session, questionId: int) -> int:
+        """ Counts the answers given to a question, i.e., the rows a regrade has to go through.
+
+        Args:
+            - session (Session): The session object.
+            - questionId (int): The question identifier.
+
+        Returns:
+            - int: The number of answers to the question.
+        """
+        answers: Table = class_mapper(Answer).local_table
+        return session.execute(
+            select([func.count()]).where(answers.c.questionId == questionId)
+        ).scalar()
+
+    @staticmethod
+    def regrade(session: Session, questionId: int, true_answer: str,
+                correct_question_percentage: float, incorrect_question_percentage: float,
+                after: Optional[str] = None, batch_size: int = 500) -> List[str]:
+        """ Regrades a batch of the answers to a question and fixes the affected scores.
+
+        The whole batch is graded by two set-based statements (one for the scores, one for the
+        answers) instead of loading and updating each row, and committed on its own, so that a
+        regrade over many answers never holds the database for long.
+
+        Note:
+            Any existing transaction will be committed.
+
+            As scores are corrected by the difference between the new and the stored points,
+            regrading the same answers twice is harmless.
+
+        Args:
+            - session (Session): The session object.
+            - questionId (int): The question identifier.
+            - true_answer (str): The (new) true answer of the question.
+            - correct_question_percentage (float): The (new) points of a correct answer.
+            - incorrect_question_percentage (float): The (new) points substracted if incorrect.
+            - after (Optional[str]): Only regrade the answers of users after this one.
+            - batch_size (int): The maximum number of answers to regrade.
+
+        Returns:
+            - List[str]: The users whose answers have been regraded, in ascending order. An
+              empty list once there is nothing left to regrade.
+        """
+        answers: Table = class_mapper(Answer).local_table
+        scores: Table = class_mapper(Score).local_table
+        query = select([answers.c.user]).where(answers.c.questionId == questionId)
+        if after is not None:
+            query = query.where(answers.c.user > after)
+        users: List[str] = [
+            user for (user,) in session.execute(query.order_by(answers.c.user).limit(batch_size))
+        ]
+        if not users:
+            return users
+        new_points = case(
+            [(answers.c.answer == true_answer, float(correct_question_percentage))],
+            else_=-float(incorrect_question_percentage)
+        )
+        in_batch = and_(answers.c.questionId == questionId, answers.c.user.in_(users))
+        try:
+            delta = select([new_points - answers.c.points]).where(and_(
+                answers.c.questionId == questionId, answers.c.user == scores.c.user
+            )).as_scalar()
+            session.execute(
+                scores.update().where(scores.c.user.in_(users)).values(score=scores.c.score + delta)
+            )
+            session.execute(answers.update().where(in_batch).values(points=new_points))
+            session.commit()
+        except:
+            session.rollback()
+            raise
+        return users
@@ -1,43 +1,75 @@
 """ Schema class module.
 """
 
+from itertools import count
+from threading import Lock
+from time import monotonic
+from typing import Callable, Dict, Iterator, List, Optional
 from sqlalchemy import create_engine, event  # type: ignore
 from sqlalchemy.engine import Engine  # type: ignore
+from sqlalchemy.engine.url import URL, make_url  # type: ignore
+from sqlalchemy.exc import DBAPIError  # type: ignore
 from sqlalchemy.ext.declarative import declarative_base  # type: ignore
 from sqlalchemy.orm import sessionmaker, scoped_session  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2122backend.data.config import BackendConfiguration
-from dms2122backend.data.db.results import Question
+from dms2122backend.data.db.results import (
+    Question, Score, AnswerStat, QuestionBankVersion, RegradeJob
+)
 from dms2122backend.data.db.results.answer import Answer
+from dms2122backend.data.db.meteredqueuepool import MeteredQueuePool
+from dms2122backend.data.db.migrations import MIGRATIONS, Migration, Migrator
 
 
-# Required for SQLite to enforce FK integrity when supported
-@event.listens_for(Engine, 'connect')
-def set_sqlite_pragma(dbapi_connection, connection_record):  # pylint: disable=unused-argument
-    """ Sets the SQLite foreign keys enforcement pragma on connection.
+def sqlite_pragmas_setter(pragmas: Dict) -> Callable:
+    """ Builds a listener that sets the SQLite pragmas on every new connection.
+
+    The foreign keys enforcement pragma is always set, as it is required for SQLite to enforce
+    FK integrity when supported.
 
     Args:
-        - dbapi_connection: The connection to the database API.
+        - pragmas (Dict): The pragma values; those set to `None` are left to the SQLite defaults.
+
+    Returns:
+        - Callable: The `connect` event listener.
     """
-    cursor = dbapi_connection.cursor()
-    cursor.execute('PRAGMA foreign_keys = ON;')
-    cursor.close()
+    def set_sqlite_pragmas(dbapi_connection, connection_record):  # pylint: disable=unused-argument
+        """ Sets the SQLite pragmas on connection.
+
+        Args:
+            - dbapi_connection: The connection to the database API.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA foreign_keys = ON;')
+        for name in ('journal_mode', 'synchronous', 'cache_size', 'mmap_size', 'busy_timeout'):
+            if pragmas.get(name) is not None:
+                cursor.execute(f'PRAGMA {name} = {pragmas[name]};')
+        cursor.close()
+    return set_sqlite_pragmas
 
 
 class Schema():
     """ Class responsible of the schema initialization and session generation.
     """
 
+    ASYNC_DRIVERS: Dict[str, str] = {
+        'sqlite': 'aiosqlite',
+        'postgresql': 'asyncpg',
+        'mysql': 'aiomysql'
+    }
+
     def __init__(self, config: BackendConfiguration):
         """ Constructor method.
 
-        Initializes the schema, deploying it if necessary.
+        Initializes the schema, applying the pending migrations if necessary (and allowed by
+        the `auto_migrate` configuration value).
 
         Args:
             - config (BackendConfiguration): The instance with the schema connection parameters.
 
         Raises:
-            - RuntimeError: When the connection cannot be created/established.
+            - RuntimeError: When the connection cannot be created/established, or the schema is
+              outdated and cannot be migrated automatically.
         """
         self.__declarative_base = declarative_base()
         if config.get_db_connection_string() is None:
@@ -45,12 +77,151 @@ class Schema():
                 'A value for the configuration parameter `db_connection_string` is needed.'
             )
         db_connection_string: str = config.get_db_connection_string() or ''
-        self.__create_engine = create_engine(db_connection_string)
+        self.__create_engine = Schema.__new_engine(db_connection_string, config.get_db_engine())
         self.__session_maker = scoped_session(sessionmaker(bind=self.__create_engine))
 
+        # Replicas are read-only copies of the primary database: journal mode is up to the
+        # primary, and their schema is never migrated.
+        replica_profile: Dict = dict(config.get_db_engine())
+        replica_profile['sqlite'] = dict(replica_profile['sqlite'], journal_mode=None)
+        self.__replica_engines: List[Engine] = [
+            Schema.__new_engine(connection_string, replica_profile)
+            for connection_string in config.get_db_replica_connection_strings()
+        ]
+        self.__replica_selection: str = config.get_db_replica_selection()
+        self.__replica_retry_interval: int = config.get_db_replica_retry_interval()
+        self.__replica_failed_at: Dict[int, float] = {}
+        self.__replica_lock: Lock = Lock()
+        self.__replica_turn: Iterator[int] = count()
+        self.__read_session_maker = scoped_session(sessionmaker())
+        self.__db_connection_string: str = db_connection_string
+        self.__db_engine_profile: Dict = config.get_db_engine()
+        self.__async_engine = None
+        self.__async_session_maker: Optional[Callable] = None
+        self.__async_lock: Lock = Lock()
+
         Question.map(self.__declarative_base.metadata)
         Answer.map(self.__declarative_base.metadata)
-        self.__declarative_base.metadata.create_all(self.__create_engine)
+        Score.map(self.__declarative_base.metadata)
+        AnswerStat.map(self.__declarative_base.metadata)
+        QuestionBankVersion.map(self.__declarative_base.metadata)
+        RegradeJob.map(self.__declarative_base.metadata)
+
+        self.__applied_migrations: List[Migration] = []
+        migrator: Migrator = Migrator(
+            self.__create_engine, self.__declarative_base.metadata, MIGRATIONS
+        )
+        if not migrator.is_current():
+            if not config.get_auto_migrate():
+                raise RuntimeError(
+                    'The database schema is outdated. Run `dms2122backend-migrate-database` or '
+                    'set the configuration parameter `auto_migrate`.'
+                )
+            self.__applied_migrations = migrator.upgrade()
+        self.__schema_version: int = migrator.get_target_version()
+
+    @staticmethod
+    def __new_engine(db_connection_string: str, profile: Dict) -> Engine:
+        """ Creates a database engine tuned as per the given profile.
+
+        Connections are kept in a `MeteredQueuePool`, except for in-memory SQLite databases,
+        which only live as long as their single connection.
+
+        Args:
+            - db_connection_string (str): The database connection string.
+            - profile (Dict): The engine profile, as in the `db_engine` configuration value.
+
+        Returns:
+            - Engine: The new engine.
+        """
+        url: URL = make_url(db_connection_string)
+        sqlite: bool = url.get_backend_name() == 'sqlite'
+        options: Dict = {
+            'pool_pre_ping': profile['pool_pre_ping'],
+            'pool_recycle': profile['pool_recycle']
+        }
+        if not sqlite or url.database not in (None, '', ':memory:'):
+            options['poolclass'] = MeteredQueuePool
+            options['pool_size'] = profile['pool_size']
+            options['max_overflow'] = profile['max_overflow']
+            options['pool_timeout'] = profile['pool_timeout']
+            if sqlite:
+                # Pooled connections are handed over between threads, never shared at once
+                options['connect_args'] = {'check_same_thread': False}
+        engine: Engine = create_engine(db_connection_string, **options)
+        if sqlite:
+            event.listen(engine, 'connect', sqlite_pragmas_setter(profile['sqlite']))
+        return engine
+
+    @staticmethod
+    def __new_async_engine(db_connection_string: str, profile: Dict):
+        """ Creates an asyncio database engine tuned as per the given profile.
+
+        The database driver is replaced by its asyncio counterpart (`aiosqlite`, `asyncpg` or
+        `aiomysql`), which must be installed.
+
+        Args:
+            - db_connection_string (str): The database connection string.
+            - profile (Dict): The engine profile, as in the `db_engine` configuration value.
+
+        Raises:
+            - RuntimeError: If there is no known asyncio driver for the database.
+
+        Returns:
+            - AsyncEngine: The new engine.
+        """
+        # pylint: disable=import-outside-toplevel
+        from sqlalchemy.ext.asyncio import create_async_engine  # type: ignore
+        from sqlalchemy.pool import AsyncAdaptedQueuePool  # type: ignore
+
+        url: URL = make_url(db_connection_string)
+        backend: str = url.get_backend_name()
+        driver: Optional[str] = Schema.ASYNC_DRIVERS.get(backend)
+        if driver is None:
+            raise RuntimeError(f'There is no known asyncio driver for `{backend}` databases.')
+        url = url.set(drivername=f'{backend}+{driver}')
+        sqlite: bool = backend == 'sqlite'
+        options: Dict = {
+            'pool_pre_ping': profile['pool_pre_ping'],
+            'pool_recycle': profile['pool_recycle']
+        }
+        if not sqlite or url.database not in (None, '', ':memory:'):
+            options['poolclass'] = AsyncAdaptedQueuePool
+            options['pool_size'] = profile['pool_size']
+            options['max_overflow'] = profile['max_overflow']
+            options['pool_timeout'] = profile['pool_timeout']
+        engine = create_async_engine(url, **options)
+        if sqlite:
+            event.listen(engine.sync_engine, 'connect', sqlite_pragmas_setter(profile['sqlite']))
+        return engine
+
+    def get_pool_metrics(self) -> Optional[Dict]:
+        """ Gets the connection pool checkout metrics.
+
+        Returns:
+            - Optional[Dict]: A dictionary with the pool metrics, or `None` if the connections
+              are not metered.
+        """
+        pool = self.__create_engine.pool
+        if isinstance(pool, MeteredQueuePool):
+            return pool.get_metrics()
+        return None
+
+    def get_schema_version(self) -> int:
+        """ Gets the version of the database schema.
+
+        Returns:
+            - int: The schema version.
+        """
+        return self.__schema_version
+
+    def get_applied_migrations(self) -> List[Migration]:
+        """ Gets the migrations applied when initializing the schema.
+
+        Returns:
+            - List[Migration]: The applied migrations, in order.
+        """
+        return self.__applied_migrations
 
     def new_session(self) -> Session:
         """ Constructs a new session.
@@ -60,7 +231,135 @@ class Schema():
         """
         return self.__session_maker()
 
+    def new_async_session(self):
+        """ Constructs a new asyncio session on the primary database.
+
+        The asyncio engine is created on first use; it requires SQLAlchemy 1.4 or newer and the
+        asyncio driver of the database. Read replicas are not used by asyncio sessions.
+
+        Returns:
+            - AsyncSession: A new session, to be used as an asynchronous context manager (which
+              closes it). Its objects are not expired on commit.
+        """
+        with self.__async_lock:
+            if self.__async_session_maker is None:
+                # pylint: disable=import-outside-toplevel
+                from sqlalchemy.ext.asyncio import AsyncSession  # type: ignore
+                self.__async_engine = Schema.__new_async_engine(self.__db_connection_string,
+                                                                self.__db_engine_profile)
+                self.__async_session_maker = sessionmaker(
+                    self.__async_engine,
+                    class_=AsyncSession,
+                    expire_on_commit=False
+                )
+        return self.__async_session_maker()
+
+    def new_read_session(self) -> Session:
+        """ Constructs a new session for read-only operations.
+
+        The session is bound to one of the read replicas, if any, falling back to the primary
+        database when every replica is failing. Failing replicas are left out of the selection
+        for `db_replica_retry_interval` seconds.
+
+        Note:
+            Replicas may lag behind the primary, so the data just written might not be read yet.
+
+        Returns:
+            - Session: A new `Session` object.
+        """
+        if self.__read_session_maker.registry.has():
+            return self.__read_session_maker()
+        for index in self.__replica_candidates():
+            session: Session = self.__read_session_maker(bind=self.__replica_engines[index])
+            try:
+                session.connection()
+                return session
+            except DBAPIError:
+                self.__read_session_maker.remove()
+                with self.__replica_lock:
+                    self.__replica_failed_at[index] = monotonic()
+        return self.new_session()
+
+    def __replica_candidates(self) -> List[int]:
+        """ Sorts the healthy replicas by preference, as per the selection policy.
+
+        Returns:
+            - List[int]: The indices of the replica engines to try, in order.
+        """
+        with self.__replica_lock:
+            now: float = monotonic()
+            for index, failed_at in list(self.__replica_failed_at.items()):
+                if now - failed_at >= self.__replica_retry_interval:
+                    del self.__replica_failed_at[index]
+            healthy: List[int] = [
+                index for index in range(len(self.__replica_engines))
+                if index not in self.__replica_failed_at
+            ]
+            if not healthy:
+                return healthy
+            turn: int = next(self.__replica_turn) % len(healthy)
+        candidates: List[int] = healthy[turn:] + healthy[:turn]
+        if self.__replica_selection == 'least_loaded':
+            candidates.sort(key=lambda index: Schema.__checked_out(self.__replica_engines[index]))
+        return candidates
+
+    @staticmethod
+    def __checked_out(engine: Engine) -> int:
+        """ Gets the load of an engine.
+
+        Args:
+            - engine (Engine): The engine.
+
+        Returns:
+            - int: The number of connections of the engine in use.
+        """
+        pool = engine.pool
+        return pool.checkedout() if isinstance(pool, MeteredQueuePool) else 0
+
+    def get_replica_metrics(self) -> List[Dict]:
+        """ Gets the status and connection pool metrics of the read replicas.
+
+        Returns:
+            - List[Dict]: A dictionary per replica, with its (password-masked) URL, whether it is
+              currently considered healthy and its pool metrics.
+        """
+        with self.__replica_lock:
+            failed: List[int] = list(self.__replica_failed_at)
+        metrics: List[Dict] = []
+        for index, engine in enumerate(self.__replica_engines):
+            pool = engine.pool
+            metrics.append({
+                'url': repr(engine.url),
+                'healthy': index not in failed,
+                'pool': pool.get_metrics() if isinstance(pool, MeteredQueuePool) else None
+            })
+        return metrics
+
+    def dispose_engines(self) -> None:
+        """ Discards the pooled connections of every engine, which will open new ones on demand.
+
+        Must be called in the processes forked after the schema initialization, so they do not
+        share the connections inherited from their parent.
+        """
+        self.__create_engine.dispose()
+        for engine in self.__replica_engines:
+            engine.dispose()
+
+    async def dispose_async_engine(self) -> None:
+        """ Closes the pooled connections of the asyncio engine, if created.
+
+        Must be awaited before the event loop is closed, as some asyncio drivers keep a thread per
+        connection that would otherwise prevent the process from exiting.
+        """
+        with self.__async_lock:
+            engine = self.__async_engine
+            self.__async_engine = None
+            self.__async_session_maker = None
+        if engine is not None:
+            await engine.dispose()
+
     def remove_session(self) -> None:
-        """ Frees the existing thread-local session.
+        """ Frees the existing thread-local sessions (both the read-write and read-only ones).
         """
         self.__session_maker.remove()
+        self.__read_session_maker.remove()
@@ -0,0 +1,19 @@
+""" Asyncio REST API controllers, used when serving the API with aiohttp.
+
+Operations without an asyncio controller here are served by their `rest` controller in a thread
+pool (see `AsyncResolver`).
+"""
+
+from typing import TYPE_CHECKING
+from dms2122common.lazyexports import LazyExports
+
+if TYPE_CHECKING:
+    from .asyncapi import AsyncApi
+    from .asyncresolver import AsyncResolver
+
+_exports = LazyExports(__name__, {
+    'AsyncApi': 'asyncapi',
+    'AsyncResolver': 'asyncresolver'
+})
+__getattr__ = _exports.get_attribute
+__dir__ = _exports.list_attributes
@@ -0,0 +1,133 @@
+""" Asyncio REST API controllers responsible of handling the answer operations.
+"""
+
+from http import HTTPStatus
+from typing import Dict, List, Optional, Tuple, Union
+from flask import current_app
+from dms2122backend.data.db import Schema
+from dms2122backend.data.db.exc import AnswerExistsError, QuestionNotFoundError
+from dms2122backend.presentation.rest.answer import (
+    _body_matches_path, _next_cursor_headers, _parse_since
+)
+from dms2122backend.service import AsyncAnswerServices
+
+
+async def create_answer(questionId: int, username: str, body: Dict,
+                        token_info: Dict) -> Tuple[Union[Dict, str], Optional[int]]:
+    """Answers a question.
+
+    Args:
+        - questionId (int): The question identifier.
+        - username (str): The user answering.
+        - body (Dict): A dictionary with the new answer's data.
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+
+    Returns:
+        - Tuple[Union[Dict, str], Optional[int]]: As the `create_answer` controller of the
+          `rest` package.
+    """
+    if not _body_matches_path(questionId, username, body):
+        return ('The user or question of the answer do not match the path',
+                HTTPStatus.BAD_REQUEST.value)
+    db: Schema = current_app.db
+    try:
+        newAnswer: Dict = await AsyncAnswerServices.create(username, body['answer'], questionId,
+                                                           db)
+    except ValueError:
+        return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
+    except QuestionNotFoundError:
+        return ('The question does not exist', HTTPStatus.NOT_FOUND.value)
+    except AnswerExistsError:
+        return ('The question has already been answered', HTTPStatus.CONFLICT.value)
+    return (newAnswer, HTTPStatus.OK.value)
+
+async def create_answers(username: str, body: List[Dict],
+                         token_info: Dict) -> Tuple[Union[List[Dict], str], Optional[int]]:
+    """Answers several questions at once.
+
+    Args:
+        - username (str): The user answering.
+        - body (List[Dict]): A list of dictionaries with each answer's `questionId` and `answer`.
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+
+    Returns:
+        - Tuple[Union[List[Dict], str], Optional[int]]: As the `create_answers` controller of the
+          `rest` package.
+    """
+    db: Schema = current_app.db
+    try:
+        results: List[Dict] = await AsyncAnswerServices.create_many(username, body, db)
+    except ValueError:
+        return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
+    return (results, HTTPStatus.OK.value)
+
+async def list_answers_by_question(questionId: int, limit: Optional[int] = None,
+                                   after: Optional[str] = None, since: Optional[str] = None
+                                   ) -> Tuple[Union[List[Dict], str], Optional[int], Dict]:
+    """Lists the existing answers by question.
+
+    Args:
+        - questionId (int): The question identifier.
+        - limit (Optional[int]): The maximum number of answers in the page.
+        - after (Optional[str]): The cursor (last user seen) to start the page after.
+        - since (Optional[str]): An ISO 8601 date-time; only answers given from then on are listed.
+
+    Returns:
+        - Tuple[Union[List[Dict], str], Optional[int], Dict]: As the `list_answers_by_question`
+          controller of the `rest` package.
+    """
+    db: Schema = current_app.db
+    try:
+        answersListed: List[Dict] = await AsyncAnswerServices.list_all_by_question(
+            db, questionId, after, limit, _parse_since(since))
+    except ValueError:
+        return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value, {})
+    except QuestionNotFoundError:
+        return ('The question does not exist', HTTPStatus.NOT_FOUND.value, {})
+    return (answersListed, HTTPStatus.OK.value, _next_cursor_headers(answersListed, limit, 'user'))
+
+async def list_answers_by_user(username: str, limit: Optional[int] = None,
+                               after: Optional[int] = None, since: Optional[str] = None
+                               ) -> Tuple[Union[List[Dict], str], Optional[int], Dict]:
+    """Lists the existing answers by user.
+
+    Args:
+        - username (str): The user.
+        - limit (Optional[int]): The maximum number of answers in the page.
+        - after (Optional[int]): The cursor (last question identifier seen) to start the page after.
+        - since (Optional[str]): An ISO 8601 date-time; only answers given from then on are listed.
+
+    Returns:
+        - Tuple[Union[List[Dict], str], Optional[int], Dict]: As the `list_answers_by_user`
+          controller of the `rest` package.
+    """
+    db: Schema = current_app.db
+    try:
+        answersListed: List[Dict] = await AsyncAnswerServices.list_all_by_user(
+            db, username, after, limit, _parse_since(since))
+    except ValueError:
+        return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value, {})
+    except QuestionNotFoundError:
+        return ('The user does not exist', HTTPStatus.NOT_FOUND.value, {})
+    return (answersListed, HTTPStatus.OK.value,
+            _next_cursor_headers(answersListed, limit, 'questionId'))
+
+async def get_answer(username: str, questionId: int) -> Tuple[Union[Dict, str], Optional[int]]:
+    """Gets the answer of a question.
+
+    Args:
+        - username (str): The user.
+        - questionId (int): The question identifier.
+
+    Returns:
+        - Tuple[Union[Dict, str], Optional[int]]: As the `get_answer` controller of the `rest`
+          package.
+    """
+    db: Schema = current_app.db
+    try:
+        answerReturned: Dict = await AsyncAnswerServices.get_answer(db, username, questionId)
+    except ValueError:
+        return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
+    except QuestionNotFoundError:
+        return ('The question does not exist', HTTPStatus.NOT_FOUND.value)
+    return (answerReturned, HTTPStatus.OK.value)
@@ -0,0 +1,29 @@
+""" AsyncApi class module.
+"""
+
+from connexion.apis.aiohttp_api import AioHttpApi  # type: ignore
+
+
+class AsyncApi(AioHttpApi):
+    """ Connexion aiohttp API routing the integer path parameters as Flask does.
+
+    aiohttp routes each request to the first path matching it, whatever the types of its
+    parameters, so `/questions/{username}/answers` would never be reached behind
+    `/questions/{questionId}/answers`. Integer path parameters are thus only matched by digits, as
+    with the `int` converter of Flask.
+    """
+
+    def _add_operation_internal(self, method, path, operation):
+        """ Adds an operation to the routes of the API.
+
+        Args:
+            - method (str): The HTTP method of the operation.
+            - path (str): The path of the operation, with its parameters between braces.
+            - operation (AbstractOperation): The operation.
+        """
+        for eachParameter in operation.parameters:
+            if eachParameter['in'] == 'path' \
+                    and eachParameter.get('schema', {}).get('type') == 'integer':
+                path = path.replace('{' + eachParameter['name'] + '}',
+                                    '{' + eachParameter['name'] + r':\d+}')
+        AioHttpApi._add_operation_internal(self, method, path, operation)
@@ -0,0 +1,72 @@
+""" AsyncResolver class module.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from connexion.resolver import Resolver  # type: ignore
+from flask import Flask
+
+
+class AsyncResolver(Resolver):
+    """ Resolves the API operations to their asyncio controllers.
+
+    Operations are declared with the controllers of the `rest` package. Those with a namesake
+    coroutine in the `aiorest` package are resolved to it; the rest are run in a thread pool,
+    within an application context of the Flask application holding the service state.
+    """
+
+    def __init__(self, app: Flask, executor: ThreadPoolExecutor):
+        """ Constructor method.
+
+        Args:
+            - app (Flask): The application whose context the threaded controllers run within.
+            - executor (ThreadPoolExecutor): The thread pool of the threaded controllers.
+        """
+        Resolver.__init__(self)
+        self.__app: Flask = app
+        self.__executor: ThreadPoolExecutor = executor
+
+    def resolve_function_from_operation_id(self, operation_id: str) -> Callable:
+        """ Resolves an operation to its controller.
+
+        Args:
+            - operation_id (str): The operation identifier (the path of its `rest` controller).
+
+        Returns:
+            - Callable: The coroutine function handling the operation.
+        """
+        async_operation_id: str = operation_id.replace(
+            '.presentation.rest.', '.presentation.aiorest.', 1
+        )
+        if async_operation_id != operation_id:
+            try:
+                return self.function_resolver(async_operation_id)
+            except (ImportError, AttributeError):
+                pass
+        return self.__threaded(Resolver.resolve_function_from_operation_id(self, operation_id))
+
+    def __threaded(self, function: Callable) -> Callable:
+        """ Wraps a controller to be run in the thread pool.
+
+        Args:
+            - function (Callable): The controller.
+
+        Returns:
+            - Callable: A coroutine function with the same signature, so Connexion passes it the
+              same arguments.
+        """
+        app: Flask = self.__app
+        executor: ThreadPoolExecutor = self.__executor
+
+        def call(*args, **kwargs):
+            with app.app_context():
+                return function(*args, **kwargs)
+
+        @functools.wraps(function)
+        async def controller(*args, **kwargs):
+            return await asyncio.get_running_loop().run_in_executor(
+                executor, functools.partial(call, *args, **kwargs)
+            )
+        return controller
@@ -0,0 +1,77 @@
+""" Asyncio REST API controllers responsible of handling the question operations.
+"""
+
+from http import HTTPStatus
+from typing import Dict, List, Optional, Tuple, Union
+from aiohttp import web  # type: ignore
+from flask import current_app
+from werkzeug.http import parse_etags  # type: ignore
+from dms2122backend.data.db import Schema
+from dms2122backend.data.db.exc import QuestionNotFoundError
+from dms2122backend.presentation.rest.question import _etag_headers
+from dms2122backend.service import AsyncQuestionServices
+
+
+async def list_questions(request: web.Request, limit: Optional[int] = None,
+                         after: Optional[int] = None, stream: bool = False
+                         ) -> Union[web.StreamResponse,
+                                    Tuple[Optional[List[Dict]], Optional[int], Dict]]:
+    """Lists the existing questions.
+
+    Args:
+        - request (web.Request): The request.
+        - limit (Optional[int]): The maximum number of questions in the page.
+        - after (Optional[int]): The cursor (last question identifier seen) to start the page after.
+        - stream (bool): Whether to stream every question (after the cursor) as NDJSON.
+
+    Returns:
+        - Union[web.StreamResponse, Tuple[Optional[List[Dict]], Optional[int], Dict]]: As the
+          `list_questions` controller of the `rest` package.
+    """
+    db: Schema = current_app.db
+    if stream:
+        serializer = current_app.serializer
+        response: web.StreamResponse = web.StreamResponse(
+            headers={'Content-Type': 'application/x-ndjson'}
+        )
+        await response.prepare(request)
+        async for eachQuestion in AsyncQuestionServices.stream_questions(db, after):
+            await response.write(serializer.dumps(eachQuestion))
+        await response.write_eof()
+        return response
+    version, questionsListed = await AsyncQuestionServices.list_questions_versioned(
+        db, after, limit)
+    headers: Dict = _etag_headers(version)
+    if limit is not None and len(questionsListed) == limit:
+        headers['X-Next-Cursor'] = str(questionsListed[-1]['questionId'])
+    if parse_etags(request.headers.get('If-None-Match')).contains_weak(
+            headers['ETag'].strip('"')):
+        return (None, HTTPStatus.NOT_MODIFIED.value, headers)
+    return (questionsListed, HTTPStatus.OK.value, headers)
+
+async def get_question_id(request: web.Request, questionId: int,
+                          token_info: Dict) -> Tuple[Union[Dict, str, None], Optional[int], Dict]:
+    """Get a question using the id.
+
+    Args:
+        - request (web.Request): The request.
+        - questionId (int): Question identifier.
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+
+    Returns:
+        - Tuple[Union[Dict, str, None], Optional[int], Dict]: As the `get_question_id` controller
+          of the `rest` package.
+    """
+    db: Schema = current_app.db
+    try:
+        version, questionReturned = await AsyncQuestionServices.get_question_id_versioned(
+            questionId, db)
+    except ValueError:
+        return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value, {})
+    except QuestionNotFoundError:
+        return ('The question does not exist', HTTPStatus.NOT_FOUND.value, {})
+    headers: Dict = _etag_headers(version)
+    if parse_etags(request.headers.get('If-None-Match')).contains_weak(
+            headers['ETag'].strip('"')):
+        return (None, HTTPStatus.NOT_MODIFIED.value, headers)
+    return (questionReturned, HTTPStatus.OK.value, headers)
@@ -1,80 +1,136 @@
 """ REST API controllers responsible of handling the answer operations.
 """
 
+from datetime import datetime, timezone
 from typing import Tuple, Union, Optional, List, Dict
 from http import HTTPStatus
 from flask import current_app # type: ignore
-from dms2122backend.data.db.exc import QuestionNotFoundError
+from dms2122backend.data.db.exc import AnswerExistsError, QuestionNotFoundError
 from dms2122backend.service import AnswerServices
 from dms2122backend.data.db.results import Answer
 from dms2122common.data.role import Role
 
 
-def create_answer(body: Dict, token_info: Dict) -> Tuple[Union[Dict, str], Optional[int]]:
+def create_answer(questionId: int, username: str, body: Dict,
+                  token_info: Dict) -> Tuple[Union[Dict, str], Optional[int]]:
     """Answers a question.
 
     Args:
+        - questionId (int): The question identifier.
+        - username (str): The user answering.
         - body (Dict): A dictionary with the new answer's data.
         - token_info (Dict): A dictionary of information provided by the security schema handlers.
 
     Returns:
         - Tuple[Union[Dict, str], Optional[int]]: A tuple with no content and codes:
             - 200 OK if the question is answered.
-            - 400 BAD REQUEST when a mandatory argument is missing.
+            - 400 BAD REQUEST when a mandatory argument is missing, or the user or question of
+              the body are not those of the path.
             - 404 NOT FOUND if the question doesn't exist.
+            - 409 CONFLICT if the user had already answered the question.
     """
+    if not _body_matches_path(questionId, username, body):
+        return ('The user or question of the answer do not match the path',
+                HTTPStatus.BAD_REQUEST.value)
     with current_app.app_context():
         try:
-            newAnswer: Dict = AnswerServices.create(body['user'], body['answer'], 
-                                        body['questionId'], current_app.db)
-            
+            newAnswer: Dict = AnswerServices.create(username, body['answer'], questionId,
+                                                    current_app.db)
         except ValueError:
             return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
         except QuestionNotFoundError:
             return ('The question does not exist', HTTPStatus.NOT_FOUND.value)
+        except AnswerExistsError:
+            return ('The question has already been answered', HTTPStatus.CONFLICT.value)
     return (newAnswer, HTTPStatus.OK.value)
 
-def list_answers_by_question(questionId: int) -> Tuple[Union[List[Dict], str], Optional[int]]:
+def create_answers(username: str, body: List[Dict],
+                   token_info: Dict) -> Tuple[Union[List[Dict], str], Optional[int]]:
+    """Answers several questions at once.
+
+    Args:
+        - username (str): The user answering.
+        - body (List[Dict]): A list of dictionaries with each answer's `questionId` and `answer`.
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+
+    Returns:
+        - Tuple[Union[List[Dict], str], Optional[int]]: A tuple with the per-answer results (in the
+          same order as given) and a code 200 OK, or a description message and code:
+            - 400 BAD REQUEST when a mandatory argument is missing.
+    """
+    with current_app.app_context():
+        try:
+            results: List[Dict] = AnswerServices.create_many(username, body, current_app.db)
+        except ValueError:
+            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
+    return (results, HTTPStatus.OK.value)
+
+def list_answers_by_question(questionId: int, limit: Optional[int] = None,
+                             after: Optional[str] = None, since: Optional[str] = None
+                             ) -> Tuple[Union[List[Dict], str], Optional[int], Dict]:
     """Lists the existing answers by question.
 
+    Args:
+        - questionId (int): The question identifier.
+        - limit (Optional[int]): The maximum number of answers in the page.
+        - after (Optional[str]): The cursor (last user seen) to start the page after.
+        - since (Optional[str]): An ISO 8601 date-time; only answers given from then on are listed.
+
     Returns:
-        - Tuple[Union[List[Dict], str], Optional[int]]: A tuple with a list of dictionaries for the answers' data
-          and code:
+        - Tuple[Union[List[Dict], str], Optional[int], Dict]: A tuple with a list of dictionaries
+          for the answers' data, the code and the headers (`X-Next-Cursor` holds the cursor of
+          the next page when there may be more answers):
         - 200 OK if the answers have been returned.
-        - 400 BAD REQUEST when a mandatory argument is missing.
+        - 400 BAD REQUEST when a mandatory argument is missing or malformed.
         - 404 NOT FOUND if the question doesn't exist.
     """
     with current_app.app_context():
         try:
-            answersListed: List[Dict] = AnswerServices.list_all_by_question(current_app.db, questionId)
+            answersListed: List[Dict] = AnswerServices.list_all_by_question(
+                current_app.db, questionId, after, limit, _parse_since(since))
         except ValueError:
-            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
+            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value, {})
         except QuestionNotFoundError:
-            return ('The question does not exist', HTTPStatus.NOT_FOUND.value)
-    return (answersListed, HTTPStatus.OK.value)
+            return ('The question does not exist', HTTPStatus.NOT_FOUND.value, {})
+    return (answersListed, HTTPStatus.OK.value, _next_cursor_headers(answersListed, limit, 'user'))
 
-def list_answers_by_user(user: str) -> Tuple[Union[List[Dict], str], Optional[int]]:
+def list_answers_by_user(username: str, limit: Optional[int] = None,
+                         after: Optional[int] = None, since: Optional[str] = None
+                         ) -> Tuple[Union[List[Dict], str], Optional[int], Dict]:
     """Lists the existing answers by user.
 
+    Args:
+        - username (str): The user.
+        - limit (Optional[int]): The maximum number of answers in the page.
+        - after (Optional[int]): The cursor (last question identifier seen) to start the page after.
+        - since (Optional[str]): An ISO 8601 date-time; only answers given from then on are listed.
+
     Returns:
-        - Tuple[Union[List[Dict], str], Optional[int]]: A tuple with a list of dictionaries for the answers' data
-          and code:
+        - Tuple[Union[List[Dict], str], Optional[int], Dict]: A tuple with a list of dictionaries
+          for the answers' data, the code and the headers (`X-Next-Cursor` holds the cursor of
+          the next page when there may be more answers):
         - 200 OK if the answers have been returned.
-        - 400 BAD REQUEST when a mandatory argument is missing.
+        - 400 BAD REQUEST when a mandatory argument is missing or malformed.
         - 404 NOT FOUND if the user doesn't exist.
     """
     with current_app.app_context():
         try:
-            answersListed: List[Dict] = AnswerServices.list_all_by_user(current_app.db, user)
+            answersListed: List[Dict] = AnswerServices.list_all_by_user(
+                current_app.db, username, after, limit, _parse_since(since))
         except ValueError:
-            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
+            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value, {})
         except QuestionNotFoundError:
-            return ('The user does not exist', HTTPStatus.NOT_FOUND.value)
-    return (answersListed, HTTPStatus.OK.value)
+            return ('The user does not exist', HTTPStatus.NOT_FOUND.value, {})
+    return (answersListed, HTTPStatus.OK.value,
+            _next_cursor_headers(answersListed, limit, 'questionId'))
 
-def get_answer(user: str, questionId: int) -> Tuple[Union[Dict, str], Optional[int]]:
+def get_answer(username: str, questionId: int) -> Tuple[Union[Dict, str], Optional[int]]:
     """Gets the answer of a question.
 
+    Args:
+        - username (str): The user.
+        - questionId (int): The question identifier.
+
     Returns:
         - Tuple[Union[Dict, str], Optional[int]]: A tuple with a list of dictionaries for the answers' data
           and code:
@@ -84,9 +140,90 @@ def get_answer(user: str, questionId: int) -> Tuple[Union[Dict, str], Optional[i
     """
     with current_app.app_context():
         try:
-            answerReturned: Dict = AnswerServices.get_answer(current_app.db, user, questionId)
+            answerReturned: Dict = AnswerServices.get_answer(current_app.db, username, questionId)
         except ValueError:
             return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
         except QuestionNotFoundError:
             return ('The question does not exist', HTTPStatus.NOT_FOUND.value)
-    return (answerReturned, HTTPStatus.OK.value)
\ No newline at end of file
+    return (answerReturned, HTTPStatus.OK.value)
+
+def get_answer_stats(questionId: int) -> Tuple[Union[Dict, str], Optional[int]]:
+    """Gets how many times each answer has been given to a question.
+
+    Args:
+        - questionId (int): The question identifier.
+
+    Returns:
+        - Tuple[Union[Dict, str], Optional[int]]: A tuple with a dictionary of the answer
+          distribution and code 200 OK, or a description message and code:
+            - 404 NOT FOUND if the question doesn't exist.
+    """
+    with current_app.app_context():
+        try:
+            stats: Dict = AnswerServices.get_answer_stats(current_app.db, questionId)
+        except QuestionNotFoundError:
+            return ('The question does not exist', HTTPStatus.NOT_FOUND.value)
+    return (stats, HTTPStatus.OK.value)
+
+def list_answer_stats(questionIds: Optional[List[int]] = None) -> Tuple[List[Dict], Optional[int]]:
+    """Lists how many times each answer has been given to several questions.
+
+    Args:
+        - questionIds (Optional[List[int]]): The question identifiers. All the questions if not
+          given.
+
+    Returns:
+        - Tuple[List[Dict], Optional[int]]: A tuple with a list of dictionaries with the answer
+          distribution of each existing question and code 200 OK.
+    """
+    with current_app.app_context():
+        stats: List[Dict] = AnswerServices.list_answer_stats(current_app.db, questionIds)
+    return (stats, HTTPStatus.OK.value)
+
+def _body_matches_path(questionId: int, username: str, body: Dict) -> bool:
+    """Checks that an answer body refers to the user and question of the request path.
+
+    Args:
+        - questionId (int): The question identifier of the path.
+        - username (str): The user of the path.
+        - body (Dict): A dictionary with the answer's data.
+
+    Returns:
+        - bool: `True` if the body has no other user or question than those of the path.
+    """
+    return (body.get('user', username) == username
+            and body.get('questionId', questionId) == questionId)
+
+def _parse_since(since: Optional[str]) -> Optional[datetime]:
+    """Parses the `since` filter of the listings.
+
+    Args:
+        - since (Optional[str]): An ISO 8601 date-time. Naive values are considered UTC.
+
+    Raises:
+        - ValueError: If the value is malformed.
+
+    Returns:
+        - Optional[datetime]: The naive UTC date-time, or `None` if no filter was given.
+    """
+    if not since:
+        return None
+    parsed: datetime = datetime.fromisoformat(since.replace('Z', '+00:00'))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+def _next_cursor_headers(page: List[Dict], limit: Optional[int], key: str) -> Dict:
+    """Builds the pagination headers of a listing page.
+
+    Args:
+        - page (List[Dict]): The page of results.
+        - limit (Optional[int]): The requested page size.
+        - key (str): The key of the results holding the cursor value.
+
+    Returns:
+        - Dict: A dictionary with the `X-Next-Cursor` header if the page is full; empty otherwise.
+    """
+    if limit is not None and len(page) == limit:
+        return {'X-Next-Cursor': str(page[-1][key])}
+    return {}
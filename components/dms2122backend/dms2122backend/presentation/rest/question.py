@@ -1,12 +1,12 @@
 """ REST API controllers responsible of handling the question operations.
 """
 
-from typing import Tuple, Union, Optional, List, Dict
+from typing import Tuple, Union, Optional, List, Dict, Iterator
 from http import HTTPStatus
 from dms2122backend.data.db.exc.questionnotfounderror import QuestionNotFoundError
-from flask import current_app # type: ignore
+from flask import current_app, request, Response, stream_with_context # type: ignore
 from dms2122backend.data.db.exc import QuestionExistsError
-from dms2122backend.service import QuestionServices 
+from dms2122backend.service import QuestionServices, RegradeServices
 from dms2122backend.data.db.results import Question
 from dms2122common.data.role import Role
 
@@ -36,18 +36,60 @@ def create_question(body: Dict, token_info: Dict) -> Tuple[Union[Dict, str], Opt
             return ('The question already exists', HTTPStatus.CONFLICT.value)
     return (newQuestion, HTTPStatus.OK.value)
 
-def list_questions() -> Tuple[List[Dict], Optional[int]]:
+def create_questions(body: List[Dict], token_info: Dict) -> Tuple[List[Dict], Optional[int]]:
+    """Creates several questions at once.
+
+    Args:
+        - body (List[Dict]): A list of dictionaries with the new questions' data.
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+
+    Returns:
+        - Tuple[List[Dict], Optional[int]]: A tuple with the per-question results (in the same
+          order as given) and a code 200 OK.
+    """
+    with current_app.app_context():
+        results: List[Dict] = QuestionServices.create_questions(body, current_app.db)
+    return (results, HTTPStatus.OK.value)
+
+def list_questions(limit: Optional[int] = None, after: Optional[int] = None,
+                   stream: bool = False
+                   ) -> Union[Response, Tuple[Optional[List[Dict]], Optional[int], Dict]]:
     """Lists the existing questions.
 
+    Args:
+        - limit (Optional[int]): The maximum number of questions in the page.
+        - after (Optional[int]): The cursor (last question identifier seen) to start the page after.
+        - stream (bool): Whether to stream every question (after the cursor) as NDJSON.
+
     Returns:
-        - Tuple[List[Dict], Optional[int]]: A tuple with a list of dictionaries for the questions' data
-          and a code 200 OK.
+        - Union[Response, Tuple[Optional[List[Dict]], Optional[int], Dict]]: If streaming, a response yielding
+          one JSON document per line. Otherwise, a tuple with a list of dictionaries for the
+          questions' data, a code 200 OK and the headers. When there may be more questions, the
+          `X-Next-Cursor` header holds the cursor of the next page. The `ETag` header identifies
+          the question bank version; if it matches `If-None-Match`, the list is not sent and
+          the code is 304 NOT MODIFIED.
     """
     with current_app.app_context():
-        questionsListed: List[Dict] = QuestionServices.list_questions(current_app.db)
-    return (questionsListed, HTTPStatus.OK.value)
+        if stream:
+            questionsStreamed: Iterator[Dict] = QuestionServices.stream_questions(
+                current_app.db, after)
+            serializer = current_app.serializer
+            return Response(
+                stream_with_context(serializer.dumps(eachQuestion)
+                                    for eachQuestion in questionsStreamed),
+                mimetype='application/x-ndjson'
+            )
+        version, questionsListed = QuestionServices.list_questions_versioned(
+            current_app.db, after, limit)
+    headers: Dict = _etag_headers(version)
+    if limit is not None and len(questionsListed) == limit:
+        headers['X-Next-Cursor'] = str(questionsListed[-1]['questionId'])
+    if request.if_none_match.contains_weak(headers['ETag'].strip('"')):
+        return (None, HTTPStatus.NOT_MODIFIED.value, headers)
+    return (questionsListed, HTTPStatus.OK.value, headers)
 
-def get_question_id(questionId: int, token_info: Dict) -> Tuple[Union[Dict, str], Optional[int]]:
+def get_question_id(questionId: int,
+                    token_info: Dict) -> Tuple[Union[Dict, str, None], Optional[int], Dict]:
     """Get a question using the id.
 
     Args:
@@ -55,20 +97,26 @@ def get_question_id(questionId: int, token_info: Dict) -> Tuple[Union[Dict, str]
         - token_info (Dict): A dictionary of information provided by the security schema handlers.
 
     Returns:
-        - Tuple[Union[Dict, str], Optional[int]]: On success, a tuple with the dictionary of the
-          new question data and a code 200 OK. On error, a description message and code:
+        - Tuple[Union[Dict, str, None], Optional[int], Dict]: On success, a tuple with the
+          dictionary of the new question data, a code 200 OK and the headers, with an `ETag` identifying the
+          question bank version (if it matches `If-None-Match`, the question is not sent and the
+          code is 304 NOT MODIFIED). On error, a description message and code:
             - 400 BAD REQUEST when a mandatory argument is missing.
             - 404 NOT FOUND when the question doesn't exist.
     """
     with current_app.app_context():
         try:
-            questionReturned: Dict = QuestionServices.get_question_id(questionId, current_app.db)
+            version, questionReturned = QuestionServices.get_question_id_versioned(
+                questionId, current_app.db)
             
         except ValueError:
-            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
+            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value, {})
         except QuestionNotFoundError:
-            return ('The question does not exist', HTTPStatus.NOT_FOUND.value)
-    return (questionReturned, HTTPStatus.OK.value)
+            return ('The question does not exist', HTTPStatus.NOT_FOUND.value, {})
+    headers: Dict = _etag_headers(version)
+    if request.if_none_match.contains_weak(headers['ETag'].strip('"')):
+        return (None, HTTPStatus.NOT_MODIFIED.value, headers)
+    return (questionReturned, HTTPStatus.OK.value, headers)
 
 def edit_question(body: Dict, questionId: int, token_info: Dict) -> Tuple[Union[Dict, str], Optional[int]]:
     """Edits a question if the user has the teacher role.
@@ -95,4 +143,55 @@ def edit_question(body: Dict, questionId: int, token_info: Dict) -> Tuple[Union[
             return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
         except QuestionNotFoundError:
             return ('The question does not exist', HTTPStatus.NOT_FOUND.value)
-    return (questionEdited, HTTPStatus.OK.value)
\ No newline at end of file
+    return (questionEdited, HTTPStatus.OK.value)
+
+def regrade_question(questionId: int, token_info: Dict) -> Tuple[Union[Dict, str], Optional[int]]:
+    """Schedules the regrade of the answers to a question.
+
+    Args:
+        - questionId (int): Question identifier.
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+
+    Returns:
+        - Tuple[Union[Dict, str], Optional[int]]: On success, a tuple with the dictionary of the
+          regrade progress and a code 202 ACCEPTED. On error, a description message and code:
+            - 404 NOT FOUND if the question doesn't exist.
+    """
+    with current_app.app_context():
+        if not QuestionServices.get_question_id(questionId, current_app.db):
+            return ('The question does not exist', HTTPStatus.NOT_FOUND.value)
+        regrade: Dict = RegradeServices.start_regrade(questionId, current_app.db)
+    return (regrade, HTTPStatus.ACCEPTED.value)
+
+def get_regrade(questionId: int) -> Tuple[Union[Dict, str], Optional[int]]:
+    """Gets the progress of the latest regrade of the answers to a question.
+
+    Args:
+        - questionId (int): Question identifier.
+
+    Returns:
+        - Tuple[Union[Dict, str], Optional[int]]: On success, a tuple with the dictionary of the
+          regrade progress and a code 200 OK. On error, a description message and code:
+            - 404 NOT FOUND if the question has never been regraded.
+    """
+    with current_app.app_context():
+        regrade: Optional[Dict] = RegradeServices.get_regrade(questionId, current_app.db)
+    if regrade is None:
+        return ('The question has not been regraded', HTTPStatus.NOT_FOUND.value)
+    return (regrade, HTTPStatus.OK.value)
+
+def _etag_headers(version: int) -> Dict:
+    """Builds the conditional request headers of a question bank version.
+
+    Args:
+        - version (int): The question bank version.
+
+    Returns:
+        - Dict: The `ETag` and `Cache-Control` headers, so that clients revalidate their copies
+          on every use. The ETag is weakened if the response is compressed, so `If-None-Match`
+          is compared weakly.
+    """
+    return {
+        'ETag': f'"qb-{version}"',
+        'Cache-Control': 'no-cache'
+    }
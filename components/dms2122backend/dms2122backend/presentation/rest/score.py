@@ -0,0 +1,26 @@
+""" REST API controllers responsible of handling the score operations.
+"""
+
+from typing import Tuple, Union, Optional, Dict
+from http import HTTPStatus
+from flask import current_app # type: ignore
+from dms2122backend.service import ScoreServices
+
+
+def get_score(username: str) -> Tuple[Union[Dict, str], Optional[int]]:
+    """Gets the score of a user.
+
+    Args:
+        - username (str): The user.
+
+    Returns:
+        - Tuple[Union[Dict, str], Optional[int]]: A tuple with a dictionary of the user's score
+          and code 200 OK, or a description message and code:
+            - 400 BAD REQUEST when a mandatory argument is missing.
+    """
+    with current_app.app_context():
+        try:
+            score: Dict = ScoreServices.get_score(username, current_app.db)
+        except ValueError:
+            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
+    return (score, HTTPStatus.OK.value)
@@ -5,6 +5,7 @@ from typing import Dict, Tuple, Optional
 from http import HTTPStatus
 from flask import current_app
 from itsdangerous import TimedJSONWebSignatureSerializer
+from dms2122backend.service import QuestionServices
 
 
 def health_test() -> Tuple[None, Optional[int]]:
@@ -14,3 +15,20 @@ def health_test() -> Tuple[None, Optional[int]]:
         - Tuple[None, Optional[int]]: A tuple of no content and code 204 No Content.
     """
     return (None, HTTPStatus.NO_CONTENT.value)
+
+
+def get_metrics() -> Tuple[Dict, Optional[int]]:
+    """Gets the service performance metrics.
+
+    Returns:
+        - Tuple[Dict, Optional[int]]: A tuple with a dictionary of metrics and code 200 OK.
+    """
+    with current_app.app_context():
+        metrics: Dict = {
+            'db_pool': current_app.db.get_pool_metrics(),
+            'db_replicas': current_app.db.get_replica_metrics(),
+            'question_cache': QuestionServices.get_cache_metrics(current_app.db),
+            'compression': current_app.compressor.get_metrics()
+            if hasattr(current_app, 'compressor') else {}
+        }
+    return (metrics, HTTPStatus.OK.value)
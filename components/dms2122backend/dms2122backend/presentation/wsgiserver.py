@@ -0,0 +1,58 @@
+""" WSGIServer class module.
+"""
+
+from typing import Callable, Dict, Optional
+from gunicorn.app.base import BaseApplication  # type: ignore
+
+
+class WSGIServer(BaseApplication):  # pylint: disable=abstract-method
+    """ Pre-fork multi-worker WSGI server for production deployments, based on Gunicorn.
+
+    The application is loaded once, in the master process, and inherited by the workers when
+    forked. Sending `SIGHUP` to the master process gracefully replaces the workers, and `SIGTERM`
+    stops them gracefully.
+
+    Note:
+        Gunicorn is an optional dependency (`pip install dms2122backend[production]`).
+    """
+
+    def __init__(self, app: Callable, host: str, port: int, server: Dict,
+                 post_fork: Optional[Callable[[], None]] = None):
+        """ Constructor method.
+
+        Args:
+            - app (Callable): The WSGI application.
+            - host (str): The host to listen at.
+            - port (int): The port to listen at.
+            - server (Dict): The server configuration, as in `BackendConfiguration.get_server`.
+            - post_fork (Optional[Callable[[], None]]): A function to run in every worker process
+              right after it is forked (e.g., to re-create its database connections).
+        """
+        self.__app: Callable = app
+        self.__options: Dict = {
+            'bind': f'{host}:{port}',
+            'workers': server['workers'],
+            'threads': server['threads'],
+            'max_requests': server['max_requests'],
+            'max_requests_jitter': server['max_requests_jitter'],
+            'timeout': server['timeout'],
+            'graceful_timeout': server['graceful_timeout'],
+            'preload_app': True
+        }
+        if post_fork is not None:
+            self.__options['post_fork'] = lambda arbiter, worker: post_fork()
+        BaseApplication.__init__(self)
+
+    def load_config(self) -> None:
+        """ Loads the server configuration into Gunicorn.
+        """
+        for key, value in self.__options.items():
+            self.cfg.set(key, value)
+
+    def load(self) -> Callable:
+        """ Loads the WSGI application.
+
+        Returns:
+            - Callable: The WSGI application.
+        """
+        return self.__app
@@ -1,5 +1,24 @@
 """ Backend service-layer classes
 """
 
-from .answerservices import AnswerServices
-from .questionservices import QuestionServices
\ No newline at end of file
+from typing import TYPE_CHECKING
+from dms2122common.lazyexports import LazyExports
+
+if TYPE_CHECKING:
+    from .answerservices import AnswerServices
+    from .asyncanswerservices import AsyncAnswerServices
+    from .asyncquestionservices import AsyncQuestionServices
+    from .questionservices import QuestionServices
+    from .regradeservices import RegradeServices
+    from .scoreservices import ScoreServices
+
+_exports = LazyExports(__name__, {
+    'AnswerServices': 'answerservices',
+    'AsyncAnswerServices': 'asyncanswerservices',
+    'AsyncQuestionServices': 'asyncquestionservices',
+    'QuestionServices': 'questionservices',
+    'RegradeServices': 'regradeservices',
+    'ScoreServices': 'scoreservices'
+})
+__getattr__ = _exports.get_attribute
+__dir__ = _exports.list_attributes
@@ -1,11 +1,13 @@
 """ AnswerServices class module.
 """
 
-from typing import Dict, Union, List
+from datetime import datetime
+from typing import Dict, Union, List, Optional
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2122backend.data.db import Schema
+from dms2122backend.data.db.exc import QuestionNotFoundError
 from dms2122backend.data.db.results import Answer
-from dms2122backend.data.db.resultsets import Answers
+from dms2122backend.data.db.resultsets import Answers, AnswerStats
 
 
 class AnswerServices():
@@ -45,51 +47,108 @@ class AnswerServices():
         return out
 
     @staticmethod
-    def list_all_by_question(schema: Schema, questionId: int) -> List[Dict]:
+    def create_many(user: str, answers: List[Dict], schema: Schema) -> List[Dict]:
+        """Answers several questions at once.
+
+        Args:
+            - user (str): The user name string.
+            - answers (List[Dict]): The answers, each one a dictionary with its `questionId` and
+              its `answer`.
+            - schema (Schema): A database handler where answers are mapped into.
+
+        Raises:
+            - ValueError: If the user is missing.
+
+        Returns:
+            - List[Dict]: A dictionary per given answer (in the same order) with its `index`, its
+              `questionId` and its `status` (`created`, `invalid`, `not_found` or `duplicate`).
+        """
+        session: Session = schema.new_session()
+        try:
+            statuses: List[str] = Answers.create_many(session, user, answers)
+        finally:
+            schema.remove_session()
+        out: List[Dict] = []
+        for index, (eachAnswer, status) in enumerate(zip(answers, statuses)):
+            out.append({
+                'index': index,
+                'questionId': eachAnswer.get('questionId'),
+                'status': status
+            })
+        return out
+
+    @staticmethod
+    def list_all_by_question(schema: Schema, questionId: int, after: Optional[str] = None,
+                             limit: Optional[int] = None,
+                             since: Optional[datetime] = None) -> List[Dict]:
         """Lists the `Answer`s assigned to a question.
 
         Args:
             - schema (Schema): A database handler where questions and answers are mapped into.
             - questionId (int): The question identifier.
+            - after (Optional[str]): The cursor (last user seen) to start the listing after.
+            - limit (Optional[int]): If given, the maximum number of answers to list.
+            - since (Optional[datetime]): If given, only answers given from this moment (UTC) on
+              are listed.
 
         Returns:
             - List[Answer]: The list of answers.
         """
-        session: Session = schema.new_session()
+        session: Session = schema.new_read_session()
         out: List[Dict] = []
-        answersReturned: List[Answer] = Answers.list_all_by_question(session, questionId)
-        for eachAnswer in answersReturned:
-            out.append({
-                'user': eachAnswer.user,
-                'questionId': eachAnswer.questionId,
-                'answer': eachAnswer.answer
-            })
-        schema.remove_session()
+        try:
+            out = Answers.list_rows_by_question(session, questionId, after, limit, since)
+            for eachAnswer in out:
+                eachAnswer['answered_at'] = eachAnswer['answered_at'].isoformat()
+        finally:
+            schema.remove_session()
         return out
 
     @staticmethod
-    def list_all_by_user(schema: Schema, user: str) -> List[Dict]:
+    def list_all_by_user(schema: Schema, user: str, after: Optional[int] = None,
+                         limit: Optional[int] = None,
+                         since: Optional[datetime] = None) -> List[Dict]:
         """Lists the `Answer`s assigned to a certain user.
 
         Args:
             - schema (Schema): A database handler where questions and answers are mapped into.
             - user (str): The user.
+            - after (Optional[int]): The cursor (last question identifier seen) to start the
+              listing after.
+            - limit (Optional[int]): If given, the maximum number of answers to list.
+            - since (Optional[datetime]): If given, only answers given from this moment (UTC) on
+              are listed.
 
         Returns:
             - List[Answer]: The list of answers.
         """
-        session: Session = schema.new_session()
+        session: Session = schema.new_read_session()
         out: List[Dict] = []
-        answersReturned: List[Answer] = Answers.list_all_by_user(session, user)
-        for eachAnswer in answersReturned:
-            out.append({
-                'user': eachAnswer.user,
-                'questionId': eachAnswer.questionId,
-                'answer': eachAnswer.answer
-            })
-        schema.remove_session()
+        try:
+            out = Answers.list_rows_by_user(session, user, after, limit, since)
+            for eachAnswer in out:
+                eachAnswer['answered_at'] = eachAnswer['answered_at'].isoformat()
+        finally:
+            schema.remove_session()
         return out
 
+    @staticmethod
+    def answer_to_dict(answer: Answer) -> Dict:
+        """Converts an answer record into a dictionary.
+
+        Args:
+            - answer (Answer): The answer record.
+
+        Returns:
+            - Dict: A dictionary with the answer's data.
+        """
+        return {
+            'user': answer.user,
+            'questionId': answer.questionId,
+            'answer': answer.answer,
+            'answered_at': answer.answered_at.isoformat()
+        }
+
     @staticmethod
     def get_answer(schema: Schema, user: str, questionId: int) -> Dict:
         """Returns an answer (if exists).
@@ -106,7 +165,7 @@ class AnswerServices():
             - out: Dictionary with all the answer's data.
             - None: If the answer doesn't exists.
         """
-        session: Session = schema.new_session()
+        session: Session = schema.new_read_session()
         out: Dict = {}
         try:
             questionAnswered = Answers.get_answer(session, user, questionId)
@@ -118,4 +177,50 @@ class AnswerServices():
             raise ex
         finally:
             schema.remove_session()
-        return out
\ No newline at end of file
+        return out
+
+    @staticmethod
+    def list_answer_stats(schema: Schema, questionIds: Optional[List[int]] = None) -> List[Dict]:
+        """Lists how many times each answer has been given to several questions.
+
+        Args:
+            - schema (Schema): A database handler where questions and answers are mapped into.
+            - questionIds (Optional[List[int]]): The question identifiers. All the questions if
+              not given.
+
+        Returns:
+            - List[Dict]: A dictionary per existing question, ordered by question identifier, with
+              the total number of answers and the number of times each answer was given.
+        """
+        session: Session = schema.new_read_session()
+        out: List[Dict] = []
+        try:
+            for questionId, answer, count in AnswerStats.list_by_questions(session, questionIds):
+                if not out or out[-1]['questionId'] != questionId:
+                    out.append({'questionId': questionId, 'total': 0, 'counts': {}})
+                if answer is not None:
+                    out[-1]['total'] += count
+                    out[-1]['counts'][answer] = count
+        finally:
+            schema.remove_session()
+        return out
+
+    @staticmethod
+    def get_answer_stats(schema: Schema, questionId: int) -> Dict:
+        """Gets how many times each answer has been given to a question.
+
+        Args:
+            - schema (Schema): A database handler where questions and answers are mapped into.
+            - questionId (int): The question identifier.
+
+        Raises:
+            - QuestionNotFoundError: If the question does not exist.
+
+        Returns:
+            - Dict: A dictionary with the total number of answers to the question and the number
+              of times each answer was given.
+        """
+        stats: List[Dict] = AnswerServices.list_answer_stats(schema, [questionId])
+        if not stats:
+            raise QuestionNotFoundError()
+        return stats[0]
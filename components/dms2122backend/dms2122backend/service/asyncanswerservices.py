@@ -0,0 +1,155 @@
+""" AsyncAnswerServices class module.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2122backend.data.db import Schema
+from dms2122backend.data.db.resultsets import Answers
+
+
+class AsyncAnswerServices():
+    """ Monostate class that provides the answer use cases of `AnswerServices` as coroutines.
+
+    The database is accessed through the asyncio sessions of the schema, so no thread is blocked
+    while waiting for it.
+    """
+
+    @staticmethod
+    async def create(user: str, answer: str, questionId: int, schema: Schema) -> Dict:
+        """Answer a question.
+
+        Args:
+            - user (str): The user name string.
+            - answer (str): The answer to the question.
+            - questionId (int): Question answered.
+            - schema (Schema): A database handler where answers are mapped into.
+
+        Raises:
+            - ValueError: If a mandatory argument is missing.
+            - QuestionNotFoundError: If the question does not exist.
+            - AnswerExistsError: If the user had already answered the question.
+
+        Returns:
+            - Dict: A dictionary with the new answer's data.
+        """
+        def create(session: Session) -> Dict:
+            newAnswer = Answers.create(session, user, answer, questionId)
+            if newAnswer is None:
+                return {}
+            return {
+                'user': newAnswer.user,
+                'questionId': newAnswer.questionId,
+                'answer': newAnswer.answer
+            }
+
+        async with schema.new_async_session() as session:
+            return await session.run_sync(create)
+
+    @staticmethod
+    async def create_many(user: str, answers: List[Dict], schema: Schema) -> List[Dict]:
+        """Answers several questions at once.
+
+        Args:
+            - user (str): The user name string.
+            - answers (List[Dict]): The answers, each one a dictionary with its `questionId` and
+              its `answer`.
+            - schema (Schema): A database handler where answers are mapped into.
+
+        Raises:
+            - ValueError: If the user is missing.
+
+        Returns:
+            - List[Dict]: A dictionary per given answer (in the same order) with its `index`, its
+              `questionId` and its `status` (`created`, `invalid`, `not_found` or `duplicate`).
+        """
+        async with schema.new_async_session() as session:
+            statuses: List[str] = await session.run_sync(
+                lambda sync_session: Answers.create_many(sync_session, user, answers)
+            )
+        return [{
+            'index': index,
+            'questionId': eachAnswer.get('questionId'),
+            'status': status
+        } for index, (eachAnswer, status) in enumerate(zip(answers, statuses))]
+
+    @staticmethod
+    async def list_all_by_question(schema: Schema, questionId: int, after: Optional[str] = None,
+                                   limit: Optional[int] = None,
+                                   since: Optional[datetime] = None) -> List[Dict]:
+        """Lists the answers to a question.
+
+        Args:
+            - schema (Schema): A database handler where questions and answers are mapped into.
+            - questionId (int): The question identifier.
+            - after (Optional[str]): The cursor (last user seen) to start the listing after.
+            - limit (Optional[int]): If given, the maximum number of answers to list.
+            - since (Optional[datetime]): If given, only answers given from this moment (UTC) on
+              are listed.
+
+        Returns:
+            - List[Dict]: The list of answers.
+        """
+        async with schema.new_async_session() as session:
+            out: List[Dict] = await session.run_sync(
+                lambda sync_session: Answers.list_rows_by_question(
+                    sync_session, questionId, after, limit, since)
+            )
+        for eachAnswer in out:
+            eachAnswer['answered_at'] = eachAnswer['answered_at'].isoformat()
+        return out
+
+    @staticmethod
+    async def list_all_by_user(schema: Schema, user: str, after: Optional[int] = None,
+                               limit: Optional[int] = None,
+                               since: Optional[datetime] = None) -> List[Dict]:
+        """Lists the answers of a certain user.
+
+        Args:
+            - schema (Schema): A database handler where questions and answers are mapped into.
+            - user (str): The user.
+            - after (Optional[int]): The cursor (last question identifier seen) to start the
+              listing after.
+            - limit (Optional[int]): If given, the maximum number of answers to list.
+            - since (Optional[datetime]): If given, only answers given from this moment (UTC) on
+              are listed.
+
+        Returns:
+            - List[Dict]: The list of answers.
+        """
+        async with schema.new_async_session() as session:
+            out: List[Dict] = await session.run_sync(
+                lambda sync_session: Answers.list_rows_by_user(
+                    sync_session, user, after, limit, since)
+            )
+        for eachAnswer in out:
+            eachAnswer['answered_at'] = eachAnswer['answered_at'].isoformat()
+        return out
+
+    @staticmethod
+    async def get_answer(schema: Schema, user: str, questionId: int) -> Dict:
+        """Returns an answer (if exists).
+
+        Args:
+            - schema (Schema): A database handler where the questions are mapped into.
+            - user (str): The user that has answered the question.
+            - questionId (int): Question identifier.
+
+        Raises:
+            - ValueError: If the user is missing.
+
+        Returns:
+            - Dict: A dictionary with the answer's data, empty if the answer doesn't exist.
+        """
+        def get(session: Session) -> Dict:
+            questionAnswered = Answers.get_answer(session, user, questionId)
+            if questionAnswered is None:
+                return {}
+            return {
+                'user': questionAnswered.user,
+                'questionId': questionAnswered.questionId,
+                'answer': questionAnswered.answer
+            }
+
+        async with schema.new_async_session() as session:
+            return await session.run_sync(get)
@@ -0,0 +1,109 @@
+""" AsyncQuestionServices class module.
+"""
+
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2122backend.data.db import Schema
+from dms2122backend.data.db.resultsets import Questions, QuestionBankVersions
+from dms2122backend.service.questionservices import QuestionServices
+
+
+class AsyncQuestionServices():
+    """ Monostate class that provides the question reads of `QuestionServices` as coroutines.
+
+    The database is accessed through the asyncio sessions of the schema, so no thread is blocked
+    while waiting for it. Reads share the question cache of `QuestionServices`.
+    """
+
+    @staticmethod
+    async def list_questions_versioned(schema: Schema, after: Optional[int] = None,
+                                       limit: Optional[int] = None) -> Tuple[int, List[Dict]]:
+        """Lists the existing questions along with the question bank version.
+
+        Args:
+            - schema (Schema): A database handler where the questions are mapped into.
+            - after (Optional[int]): If given, only questions with a greater identifier are listed.
+            - limit (Optional[int]): If given, the maximum number of questions to list.
+
+        Returns:
+            - Tuple[int, List[Dict]]: The question bank version and a list of dictionaries with
+              the questions' data (not to be modified, as it may be cached).
+        """
+        def load(session: Session) -> Tuple[int, List[Dict]]:
+            version: int = QuestionBankVersions.get(session)
+            return (version, Questions.list_rows(session, after, limit))
+
+        async def load_async() -> Tuple[int, List[Dict]]:
+            async with schema.new_async_session() as session:
+                return await session.run_sync(load)
+        return await QuestionServices.get_cache(schema).get_async(
+            ('list', after, limit), load_async,
+            lambda: AsyncQuestionServices.__load_version(schema)
+        )
+
+    @staticmethod
+    async def stream_questions(schema: Schema, after: Optional[int] = None,
+                               batch_size: int = 500) -> AsyncIterator[Dict]:
+        """Iterates over the existing questions without loading all of them at once.
+
+        The questions are read in pages of `batch_size`, each one in its own session.
+
+        Args:
+            - schema (Schema): A database handler where the questions are mapped into.
+            - after (Optional[int]): If given, only questions with a greater identifier are listed.
+            - batch_size (int): The number of questions read from the database at a time.
+
+        Returns:
+            - AsyncIterator[Dict]: An asynchronous iterator of dictionaries with the questions'
+              data.
+        """
+        while True:
+            async with schema.new_async_session() as session:
+                page: List[Dict] = await session.run_sync(
+                    lambda sync_session: Questions.list_rows(sync_session, after, batch_size)
+                )
+            for eachQuestion in page:
+                yield eachQuestion
+            if len(page) < batch_size:
+                break
+            after = page[-1]['questionId']
+
+    @staticmethod
+    async def get_question_id_versioned(questionId: int, schema: Schema) -> Tuple[int, Dict]:
+        """Returns a question (if exists) along with the question bank version.
+
+        Args:
+            - questionId (int): Question identifier.
+            - schema (Schema): A database handler where the questions are mapped into.
+
+        Returns:
+            - Tuple[int, Dict]: The question bank version and a dictionary with all the question
+              data, empty if the question doesn't exist (not to be modified, as it may be cached).
+        """
+        def load(session: Session) -> Tuple[int, Dict]:
+            version: int = QuestionBankVersions.get(session)
+            questionReturned = Questions.get_question_id(session, questionId)
+            if questionReturned is None:
+                return (version, {})
+            return (version, QuestionServices.question_to_dict(questionReturned))
+
+        async def load_async() -> Tuple[int, Dict]:
+            async with schema.new_async_session() as session:
+                return await session.run_sync(load)
+        return await QuestionServices.get_cache(schema).get_async(
+            ('question', questionId), load_async,
+            lambda: AsyncQuestionServices.__load_version(schema)
+        )
+
+    @staticmethod
+    async def __load_version(schema: Schema) -> int:
+        """Reads the question bank version.
+
+        Args:
+            - schema (Schema): A database handler where the questions are mapped into.
+
+        Returns:
+            - int: The question bank version.
+        """
+        async with schema.new_async_session() as session:
+            return await session.run_sync(QuestionBankVersions.get)
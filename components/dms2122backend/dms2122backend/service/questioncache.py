@@ -0,0 +1,255 @@
+""" QuestionCache class module.
+"""
+
+import asyncio
+from collections import OrderedDict
+from threading import Event, Lock
+from time import monotonic
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class QuestionCache():
+    """ In-process LRU cache with expiration of the question reads.
+
+    Concurrent misses of the same key are coalesced: only the first caller loads the value
+    while the rest wait for it (single-flight), so a cold cache does not flood the database.
+
+    The writes in this process invalidate the cache at once. Those made by other processes are
+    detected through the question bank version, a database counter increased on every change of
+    the questions: it is read at most once per check interval, and the whole cache is discarded
+    when it has moved on.
+
+    Note:
+        The cached values are shared by every caller, so they must not be modified.
+
+        Other processes' changes may thus be seen up to a check interval late.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 60.0,
+                 version_check_interval: float = 1.0):
+        """ Constructor method.
+
+        Args:
+            - max_entries (int): The maximum number of cached values (0 disables the cache).
+            - ttl (float): The seconds a cached value is valid for.
+            - version_check_interval (float): The seconds between reads of the question bank
+              version (0 reads it on every lookup).
+        """
+        self.__max_entries: int = max_entries
+        self.__ttl: float = ttl
+        self.__version_check_interval: float = version_check_interval
+        self.__version: Optional[int] = None
+        self.__version_checked_at: float = 0.0
+        self.__lock: Lock = Lock()
+        self.__entries: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self.__loading: Dict[Hashable, Dict] = {}
+        self.__async_loading: Dict[Hashable, 'asyncio.Future[Any]'] = {}
+        self.__generation: int = 0
+        self.__metrics: Dict = {
+            'hits': 0,
+            'misses': 0,
+            'coalesced': 0,
+            'invalidations': 0,
+            'version_invalidations': 0
+        }
+
+    def get(self, key: Hashable, loader: Callable[[], Any],
+            version_loader: Callable[[], int]) -> Any:
+        """ Gets a cached value, loading it on a miss.
+
+        Args:
+            - key (Hashable): The key of the value.
+            - loader (Callable[[], Any]): A function returning the value to cache.
+            - version_loader (Callable[[], int]): A function returning the current question bank
+              version.
+
+        Raises:
+            - Exception: Whatever the loader or the version loader raise (the former also in the
+              coalesced callers).
+
+        Returns:
+            - Any: The value.
+        """
+        if self.__max_entries > 0 and self.__version_check_due():
+            checked_at: float = monotonic()
+            self.__check_version(version_loader(), checked_at)
+        leader: bool = False
+        generation: int = 0
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[0] > monotonic():
+                self.__entries.move_to_end(key)
+                self.__metrics['hits'] += 1
+                return entry[1]
+            if entry is not None:
+                del self.__entries[key]
+            flight = self.__loading.get(key)
+            if flight is not None:
+                self.__metrics['coalesced'] += 1
+            else:
+                flight = {'done': Event(), 'value': None, 'error': None}
+                self.__loading[key] = flight
+                self.__metrics['misses'] += 1
+                generation = self.__generation
+                leader = True
+        if not leader:
+            flight['done'].wait()
+            if flight['error'] is not None:
+                raise flight['error']
+            return flight['value']
+        try:
+            flight['value'] = loader()
+        except Exception as ex:
+            flight['error'] = ex
+            raise
+        finally:
+            with self.__lock:
+                if self.__loading.get(key) is flight:
+                    del self.__loading[key]
+                # Values loaded across an invalidation might be stale already
+                if (flight['error'] is None and generation == self.__generation
+                        and self.__max_entries > 0):
+                    self.__entries[key] = (monotonic() + self.__ttl, flight['value'])
+                    while len(self.__entries) > self.__max_entries:
+                        self.__entries.popitem(last=False)
+            flight['done'].set()
+        return flight['value']
+
+    async def get_async(self, key: Hashable, loader: Callable[[], Awaitable[Any]],
+                        version_loader: Callable[[], Awaitable[int]]) -> Any:
+        """ Gets a cached value, loading it asynchronously on a miss.
+
+        Like `get`, but the concurrent misses wait for the first one's load without blocking the
+        event loop. Every caller must run in the same event loop.
+
+        Args:
+            - key (Hashable): The key of the value.
+            - loader (Callable[[], Awaitable[Any]]): A coroutine function returning the value
+              to cache.
+            - version_loader (Callable[[], Awaitable[int]]): A coroutine function returning the
+              current question bank version.
+
+        Raises:
+            - Exception: Whatever the loader or the version loader raise (the former also in the
+              coalesced callers).
+
+        Returns:
+            - Any: The value.
+        """
+        if self.__max_entries > 0 and self.__version_check_due():
+            checked_at: float = monotonic()
+            self.__check_version(await version_loader(), checked_at)
+        leader: bool = False
+        generation: int = 0
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[0] > monotonic():
+                self.__entries.move_to_end(key)
+                self.__metrics['hits'] += 1
+                return entry[1]
+            if entry is not None:
+                del self.__entries[key]
+            flight = self.__async_loading.get(key)
+            if flight is not None:
+                self.__metrics['coalesced'] += 1
+            else:
+                flight = asyncio.get_running_loop().create_future()
+                self.__async_loading[key] = flight
+                self.__metrics['misses'] += 1
+                generation = self.__generation
+                leader = True
+        if not leader:
+            try:
+                return await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    raise
+            # The first caller was cancelled before loading the value
+            return await self.get_async(key, loader, version_loader)
+        try:
+            value: Any = await loader()
+        except asyncio.CancelledError:
+            self.__end_async_load(key, flight)
+            flight.cancel()
+            raise
+        except Exception as ex:
+            self.__end_async_load(key, flight)
+            flight.set_exception(ex)
+            flight.exception()  # Retrieved, even if no caller was waiting for it
+            raise
+        self.__end_async_load(key, flight)
+        with self.__lock:
+            # Values loaded across an invalidation might be stale already
+            if generation == self.__generation and self.__max_entries > 0:
+                self.__entries[key] = (monotonic() + self.__ttl, value)
+                while len(self.__entries) > self.__max_entries:
+                    self.__entries.popitem(last=False)
+        flight.set_result(value)
+        return value
+
+    def __end_async_load(self, key: Hashable, flight: 'asyncio.Future[Any]') -> None:
+        """ Stops coalescing the misses of a key into an asynchronous load.
+
+        Args:
+            - key (Hashable): The key of the value.
+            - flight (asyncio.Future[Any]): The future of the load.
+        """
+        with self.__lock:
+            if self.__async_loading.get(key) is flight:
+                del self.__async_loading[key]
+
+    def __version_check_due(self) -> bool:
+        """ Checks whether the question bank version has to be read again.
+
+        Returns:
+            - bool: `True` if the last read is older than the check interval.
+        """
+        return monotonic() - self.__version_checked_at >= self.__version_check_interval
+
+    def __check_version(self, version: int, checked_at: float) -> None:
+        """ Discards every cached value if the question bank version has changed since the last
+        check.
+
+        Args:
+            - version (int): The current question bank version.
+            - checked_at (float): The monotonic time the version was read at.
+        """
+        with self.__lock:
+            self.__version_checked_at = checked_at
+            if self.__version is not None and version != self.__version:
+                self.__discard()
+                self.__metrics['version_invalidations'] += 1
+            self.__version = version
+
+    def invalidate(self) -> None:
+        """ Discards every cached value.
+        """
+        with self.__lock:
+            self.__discard()
+            self.__metrics['invalidations'] += 1
+
+    def __discard(self) -> None:
+        """ Discards every cached value. The lock must be held.
+        """
+        self.__entries.clear()
+        # Callers arriving from now on must not wait for loads started before
+        self.__loading.clear()
+        self.__async_loading.clear()
+        self.__generation += 1
+
+    def get_metrics(self) -> Dict:
+        """ Gets the cache usage metrics.
+
+        Returns:
+            - Dict: A dictionary with the number of hits, misses, coalesced misses (callers that
+              waited for another one's load) and invalidations (by question writes in this
+              process, and by changes of the question bank version), and the current and maximum
+              number of entries.
+        """
+        with self.__lock:
+            metrics: Dict = dict(self.__metrics)
+            metrics['entries'] = len(self.__entries)
+        metrics['max_entries'] = self.__max_entries
+        metrics['ttl'] = self.__ttl
+        metrics['version_check_interval'] = self.__version_check_interval
+        return metrics
@@ -1,18 +1,68 @@
 """ QuestionServices class module.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator, Tuple
+from weakref import WeakKeyDictionary
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2122backend.data.config import BackendConfiguration
 from dms2122backend.data.db import Schema
 from dms2122backend.data.db.results import Question
-from dms2122backend.data.db.resultsets import Questions
+from dms2122backend.data.db.resultsets import Questions, QuestionBankVersions
+from dms2122backend.service.questioncache import QuestionCache
+from dms2122backend.service.regradeservices import RegradeServices
 
 
 class QuestionServices():
     """ Monostate class that provides high-level services to handle question-related use cases.
+
+    Question reads are served through a `QuestionCache` per schema, which the question writes
+    invalidate (and those of other processes through the question bank version).
     """
 
+    __caches: 'WeakKeyDictionary[Schema, QuestionCache]' = WeakKeyDictionary()
+
+    @staticmethod
+    def configure_cache(schema: Schema, max_entries: int, ttl: float,
+                        version_check_interval: float = 1.0) -> None:
+        """Sets up the question cache of a schema, discarding the current one.
+
+        Args:
+            - schema (Schema): A database handler where the questions are mapped into.
+            - max_entries (int): The maximum number of cached reads (0 disables the cache).
+            - ttl (float): The seconds a cached read is valid for.
+            - version_check_interval (float): The seconds between reads of the question bank
+              version, to detect the changes made by other processes.
+        """
+        QuestionServices.__caches[schema] = QuestionCache(max_entries, ttl,
+                                                          version_check_interval)
+
+    @staticmethod
+    def get_cache_metrics(schema: Schema) -> Dict:
+        """Gets the usage metrics of the question cache of a schema.
+
+        Args:
+            - schema (Schema): A database handler where the questions are mapped into.
+
+        Returns:
+            - Dict: A dictionary with the cache metrics.
+        """
+        return QuestionServices.get_cache(schema).get_metrics()
+
+    @staticmethod
+    def get_cache(schema: Schema) -> QuestionCache:
+        """Gets the question cache of a schema, setting up a default one if needed.
+
+        Args:
+            - schema (Schema): A database handler where the questions are mapped into.
+
+        Returns:
+            - QuestionCache: The question cache.
+        """
+        cache: Optional[QuestionCache] = QuestionServices.__caches.get(schema)
+        if cache is None:
+            cache = QuestionServices.__caches.setdefault(schema, QuestionCache())
+        return cache
+
     @staticmethod
     def create_question(question:str, description:str, option1:str, option2:str, true_answer:str,
                         correct_question_percentage:float, incorrect_question_percentage:float, 
@@ -52,35 +102,152 @@ class QuestionServices():
             raise ex
         finally:
             schema.remove_session()
+            QuestionServices.get_cache(schema).invalidate()
         return out
 
     @staticmethod
-    def list_questions(schema: Schema) -> List[Dict]:
-        """Lists the existing questions.
+    def create_questions(questions: List[Dict], schema: Schema, chunk_size: int = 500) -> List[Dict]:
+        """Creates several questions at once.
+
+        Every question is validated before inserting any of them; the valid ones are then
+        inserted in chunked transactions.
 
         Args:
+            - questions (List[Dict]): The questions' data, with the same keys as the arguments
+              of `create_question`.
             - schema (Schema): A database handler where the questions are mapped into.
+            - chunk_size (int): The maximum number of questions inserted per transaction.
 
         Returns:
-            - List[Dict]: A list of dictionaries with the questions' data.
+            - List[Dict]: A dictionary per given question (in the same order) with its `index`,
+              its `status` (`created`, `invalid` or `rejected`) and a `message` on error.
         """
         out: List[Dict] = []
-        session: Session = schema.new_session()
-        questionsReturned: List[Question] = Questions.list_all(session)
-        for eachQuestion in questionsReturned:
-            out.append({
-                'questionId': eachQuestion.questionId, #type: ignore
-                'question': eachQuestion.question,
-                'description': eachQuestion.description,
-                'option1': eachQuestion.option1,
-                'option2': eachQuestion.option2,
-                'true_answer': eachQuestion.true_answer,
-                'correct_question_percentage': eachQuestion.correct_question_percentage,
-                'incorrect_question_percentage': eachQuestion.incorrect_question_percentage
+        valid: List[Dict] = []
+        valid_results: List[Dict] = []
+        for index, eachQuestion in enumerate(questions):
+            result: Dict = {'index': index, 'status': 'created'}
+            out.append(result)
+            try:
+                Questions.validate(eachQuestion.get('question', ''), eachQuestion.get('option1', ''),
+                                   eachQuestion.get('option2', ''), eachQuestion.get('true_answer', ''),
+                                   eachQuestion.get('correct_question_percentage', 0),
+                                   eachQuestion.get('incorrect_question_percentage', 0))
+            except ValueError as ex:
+                result['status'] = 'invalid'
+                result['message'] = str(ex)
+                continue
+            valid.append({
+                'question': eachQuestion['question'],
+                'description': eachQuestion.get('description'),
+                'option1': eachQuestion['option1'],
+                'option2': eachQuestion['option2'],
+                'true_answer': eachQuestion['true_answer'],
+                'correct_question_percentage': eachQuestion['correct_question_percentage'],
+                'incorrect_question_percentage': eachQuestion['incorrect_question_percentage']
             })
-        schema.remove_session()
+            valid_results.append(result)
+        if not valid:
+            return out
+        session: Session = schema.new_session()
+        try:
+            created: List[bool] = Questions.create_many(session, valid, chunk_size)
+        finally:
+            schema.remove_session()
+            QuestionServices.get_cache(schema).invalidate()
+        for result, was_created in zip(valid_results, created):
+            if not was_created:
+                result['status'] = 'rejected'
+                result['message'] = 'The question could not be stored'
         return out
 
+    @staticmethod
+    def list_questions(schema: Schema, after: Optional[int] = None,
+                       limit: Optional[int] = None) -> List[Dict]:
+        """Lists the existing questions.
+
+        Args:
+            - schema (Schema): A database handler where the questions are mapped into.
+            - after (Optional[int]): If given, only questions with a greater identifier are listed.
+            - limit (Optional[int]): If given, the maximum number of questions to list.
+
+        Returns:
+            - List[Dict]: A list of dictionaries with the questions' data (not to be modified, as
+              it may be cached).
+        """
+        return QuestionServices.list_questions_versioned(schema, after, limit)[1]
+
+    @staticmethod
+    def list_questions_versioned(schema: Schema, after: Optional[int] = None,
+                                 limit: Optional[int] = None) -> Tuple[int, List[Dict]]:
+        """Lists the existing questions along with the question bank version.
+
+        The version is read before the questions, so it is never newer than them.
+
+        Args:
+            - schema (Schema): A database handler where the questions are mapped into.
+            - after (Optional[int]): If given, only questions with a greater identifier are listed.
+            - limit (Optional[int]): If given, the maximum number of questions to list.
+
+        Returns:
+            - Tuple[int, List[Dict]]: The question bank version and a list of dictionaries with
+              the questions' data (not to be modified, as it may be cached).
+        """
+        def load() -> Tuple[int, List[Dict]]:
+            out: List[Dict] = []
+            session: Session = schema.new_read_session()
+            try:
+                version: int = QuestionBankVersions.get(session)
+                out = Questions.list_rows(session, after, limit)
+            finally:
+                schema.remove_session()
+            return (version, out)
+        return QuestionServices.get_cache(schema).get(
+            ('list', after, limit), load, lambda: QuestionServices.__load_version(schema)
+        )
+
+    @staticmethod
+    def stream_questions(schema: Schema, after: Optional[int] = None,
+                         batch_size: int = 500) -> Iterator[Dict]:
+        """Iterates over the existing questions without loading all of them at once.
+
+        The session is kept open until the iteration finishes (or the iterator is closed).
+
+        Args:
+            - schema (Schema): A database handler where the questions are mapped into.
+            - after (Optional[int]): If given, only questions with a greater identifier are listed.
+            - batch_size (int): The number of questions fetched from the database at a time.
+
+        Returns:
+            - Iterator[Dict]: An iterator of dictionaries with the questions' data.
+        """
+        session: Session = schema.new_read_session()
+        try:
+            yield from Questions.iterate_rows(session, after, batch_size)
+        finally:
+            schema.remove_session()
+
+    @staticmethod
+    def question_to_dict(question: Question) -> Dict:
+        """Converts a question record into a dictionary.
+
+        Args:
+            - question (Question): The question record.
+
+        Returns:
+            - Dict: A dictionary with the question's data.
+        """
+        return {
+            'questionId': question.questionId, #type: ignore
+            'question': question.question,
+            'description': question.description,
+            'option1': question.option1,
+            'option2': question.option2,
+            'true_answer': question.true_answer,
+            'correct_question_percentage': question.correct_question_percentage,
+            'incorrect_question_percentage': question.incorrect_question_percentage
+        }
+
     @staticmethod
     def get_question_id(questionId: int, schema: Schema) -> Dict:
         """Returns a question (if exists).
@@ -93,27 +260,65 @@ class QuestionServices():
             - ex: If the question can't be created.
 
         Returns:
-            - out: Dictionary with all the question data.
+            - out: Dictionary with all the question data (not to be modified, as it may be
+              cached).
             - None: If the question doesn't exists.
         """
-        session: Session = schema.new_session()
-        out: Dict = {}
+        return QuestionServices.get_question_id_versioned(questionId, schema)[1]
+
+    @staticmethod
+    def get_question_id_versioned(questionId: int, schema: Schema) -> Tuple[int, Dict]:
+        """Returns a question (if exists) along with the question bank version.
+
+        The version is read before the question, so it is never newer than it.
+
+        Args:
+            - questionId (int): Question identifier.
+            - schema (Schema): A database handler where the questions are mapped into.
+
+        Returns:
+            - Tuple[int, Dict]: The question bank version and a dictionary with all the question
+              data, empty if the question doesn't exist (not to be modified, as it may be cached).
+        """
+        def load() -> Tuple[int, Dict]:
+            session: Session = schema.new_read_session()
+            out: Dict = {}
+            try:
+                version: int = QuestionBankVersions.get(session)
+                questionReturned = Questions.get_question_id(session, questionId)
+                if questionReturned is not None:
+                    out['questionId'] = questionReturned.questionId #type: ignore
+                    out['question'] = questionReturned.question
+                    out['description'] = questionReturned.description
+                    out['option1'] = questionReturned.option1
+                    out['option2'] = questionReturned.option2
+                    out['true_answer'] = questionReturned.true_answer
+                    out['correct_question_percentage'] = questionReturned.correct_question_percentage
+                    out['incorrect_question_percentage'] = questionReturned.incorrect_question_percentage
+            except Exception as ex:
+                raise ex
+            finally:
+                schema.remove_session()
+            return (version, out)
+        return QuestionServices.get_cache(schema).get(
+            ('question', questionId), load, lambda: QuestionServices.__load_version(schema)
+        )
+
+    @staticmethod
+    def __load_version(schema: Schema) -> int:
+        """Reads the question bank version, from the same database as the cached reads.
+
+        Args:
+            - schema (Schema): A database handler where the questions are mapped into.
+
+        Returns:
+            - int: The question bank version.
+        """
+        session: Session = schema.new_read_session()
         try:
-            questionReturned = Questions.get_question_id(session, questionId)
-            if questionReturned is not None:
-                out['questionId'] = questionReturned.questionId #type: ignore
-                out['question'] = questionReturned.question
-                out['description'] = questionReturned.description
-                out['option1'] = questionReturned.option1
-                out['option2'] = questionReturned.option2
-                out['true_answer'] = questionReturned.true_answer
-                out['correct_question_percentage'] = questionReturned.correct_question_percentage
-                out['incorrect_question_percentage'] = questionReturned.incorrect_question_percentage
-        except Exception as ex:
-            raise ex
+            return QuestionBankVersions.get(session)
         finally:
             schema.remove_session()
-        return out
 
     @staticmethod
     def edit_question(questionId: int, question:str, description:str, option1:str, option2:str, true_answer:str,
@@ -132,6 +337,9 @@ class QuestionServices():
             - incorrect_question_percentage (float): A float with the percentage to be substracted in case of having the incorrect answer.
             - schema (Schema): A database handler where the users are mapped into.
 
+        If the true answer or the grading percentages change, the answers already given to the
+        question are regraded in the background.
+
         Raises:
             - ex: If the question can't be edited.
 
@@ -140,7 +348,15 @@ class QuestionServices():
         """
         session: Session = schema.new_session()
         out: Dict = {}
+        regrade: bool = False
         try:
+            currentQuestion: Optional[Question] = Questions.get_question_id(session, questionId)
+            if currentQuestion is not None:
+                regrade = (currentQuestion.true_answer,
+                           currentQuestion.correct_question_percentage,
+                           currentQuestion.incorrect_question_percentage) != (
+                               true_answer, correct_question_percentage,
+                               incorrect_question_percentage)
             editedQuestion: Question = Questions.edit(session, questionId, question, description, option1, option2, true_answer, 
                                         correct_question_percentage, incorrect_question_percentage)
             out['questionId'] = editedQuestion.questionId # type: ignore
@@ -155,4 +371,7 @@ class QuestionServices():
             raise ex
         finally:
             schema.remove_session()
-        return out
\ No newline at end of file
+            QuestionServices.get_cache(schema).invalidate()
+        if regrade:
+            RegradeServices.start_regrade(questionId, schema)
+        return out
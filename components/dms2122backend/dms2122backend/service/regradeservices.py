@@ -0,0 +1,221 @@
+""" RegradeServices class module.
+"""
+
+from datetime import datetime, timedelta
+from threading import Event, Lock, Thread
+from typing import Dict, Optional, Tuple
+from uuid import uuid4
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2122backend.data.db import Schema
+from dms2122backend.data.db.exc import QuestionNotFoundError
+from dms2122backend.data.db.results import Question, RegradeJob
+from dms2122backend.data.db.resultsets import Questions, RegradeJobs, Scores
+
+
+class RegradeServices():
+    """ Monostate class that provides high-level services to regrade the answers to a question.
+
+    Regrades run in the background, one at a time per process, in a worker thread; they are
+    stored in the database, so the progress of the latest regrade of each question can be
+    queried from any process while it runs.
+
+    The regrades scheduled by any process are run by whichever worker thread claims them first.
+    A running regrade records its progress after every batch, so if its process stops (e.g., a
+    production mode worker being recycled), it is resumed from the last batch by another worker
+    thread once its heartbeat is `STALE_AFTER` seconds old.
+    """
+
+    BATCH_SIZE: int = 500
+    POLL_INTERVAL: float = 5.0
+    STALE_AFTER: float = 60.0
+
+    __workers: Dict[Schema, Tuple[Thread, Event]] = {}
+    __workers_lock: Lock = Lock()
+
+    @staticmethod
+    def start_worker(schema: Schema) -> None:
+        """Starts the worker thread running the regrades of a schema in this process, if not
+        running yet.
+
+        The worker thread is also started on demand, but starting it along with the process
+        makes it resume the regrades abandoned by other processes straight away.
+
+        Args:
+            - schema (Schema): A database handler where the answers and scores are mapped into.
+        """
+        RegradeServices.__wake_worker(schema)
+
+    @staticmethod
+    def start_regrade(questionId: int, schema: Schema) -> Dict:
+        """Schedules the regrade of the answers to a question.
+
+        If a regrade of the question is already waiting to be run, that one is returned instead of
+        scheduling a new one (it will use the grading of the question when it starts). A running
+        one is abandoned in favour of the new one.
+
+        Args:
+            - questionId (int): The question identifier.
+            - schema (Schema): A database handler where the answers and scores are mapped into.
+
+        Returns:
+            - Dict: A dictionary with the regrade progress.
+        """
+        session: Session = schema.new_session()
+        try:
+            job: RegradeJob = RegradeJobs.schedule(session, questionId)
+            out: Dict = RegradeServices.__job_to_dict(job)
+        finally:
+            schema.remove_session()
+        RegradeServices.__wake_worker(schema)
+        return out
+
+    @staticmethod
+    def get_regrade(questionId: int, schema: Schema) -> Optional[Dict]:
+        """Gets the progress of the latest regrade of a question.
+
+        Args:
+            - questionId (int): The question identifier.
+            - schema (Schema): A database handler where the answers and scores are mapped into.
+
+        Returns:
+            - Optional[Dict]: A dictionary with the regrade progress, or `None` if the question
+              has never been regraded.
+        """
+        session: Session = schema.new_session()
+        try:
+            job: Optional[RegradeJob] = RegradeJobs.get(session, questionId)
+            return RegradeServices.__job_to_dict(job) if job is not None else None
+        finally:
+            schema.remove_session()
+
+    @staticmethod
+    def __job_to_dict(job: RegradeJob) -> Dict:
+        """ Converts a regrade job record into a dictionary.
+
+        Args:
+            - job (RegradeJob): The regrade job record.
+
+        Returns:
+            - Dict: A dictionary with the regrade progress.
+        """
+        return {
+            'questionId': job.questionId,
+            'status': job.status,
+            'total': job.total,
+            'processed': job.processed,
+            'created_at': job.created_at.isoformat(),
+            'finished_at': job.finished_at.isoformat() if job.finished_at is not None else None,
+            'error': job.error
+        }
+
+    @staticmethod
+    def __wake_worker(schema: Schema) -> None:
+        """ Makes the worker thread of a schema look for regrades, starting it if needed.
+
+        Args:
+            - schema (Schema): A database handler where the answers and scores are mapped into.
+        """
+        with RegradeServices.__workers_lock:
+            worker: Optional[Tuple[Thread, Event]] = RegradeServices.__workers.get(schema)
+            # Threads do not survive forks, so an inherited worker is not alive
+            if worker is None or not worker[0].is_alive():
+                wakeup: Event = Event()
+                thread: Thread = Thread(
+                    target=RegradeServices.__work, args=(schema, wakeup), name='regrade-worker',
+                    daemon=True
+                )
+                worker = (thread, wakeup)
+                RegradeServices.__workers[schema] = worker
+                thread.start()
+            worker[1].set()
+
+    @staticmethod
+    def __work(schema: Schema, wakeup: Event) -> None:
+        """ Runs the scheduled regrades, forever.
+
+        Args:
+            - schema (Schema): A database handler where the answers and scores are mapped into.
+            - wakeup (Event): An event set when a regrade is scheduled by this process.
+        """
+        while True:
+            wakeup.wait(RegradeServices.POLL_INTERVAL)
+            wakeup.clear()
+            try:
+                while RegradeServices.__run_next(schema):
+                    pass
+            except Exception:  # pylint: disable=broad-except
+                # The database may be unavailable for a while; it is retried on the next poll
+                pass
+
+    @staticmethod
+    def __run_next(schema: Schema) -> bool:
+        """ Claims and runs a scheduled or abandoned regrade.
+
+        Args:
+            - schema (Schema): A database handler where the answers and scores are mapped into.
+
+        Returns:
+            - bool: `True` if a regrade was run, `False` if there was none to run.
+        """
+        owner: str = uuid4().hex
+        session: Session = schema.new_session()
+        try:
+            job: Optional[RegradeJob] = RegradeJobs.claim(
+                session, owner,
+                datetime.utcnow() - timedelta(seconds=RegradeServices.STALE_AFTER)
+            )
+            if job is None:
+                return False
+            RegradeServices.__regrade(session, job, owner)
+            return True
+        finally:
+            schema.remove_session()
+
+    @staticmethod
+    def __regrade(session: Session, job: RegradeJob, owner: str) -> None:
+        """ Regrades the answers to a question in batches, updating the job progress.
+
+        The regrade is resumed after the last batch recorded, if any. It is abandoned as soon
+        as the job is no longer claimed by the given owner.
+
+        Args:
+            - session (Session): The session object.
+            - job (RegradeJob): The claimed job to run.
+            - owner (str): The token the job was claimed with.
+        """
+        questionId: int = job.questionId
+        after: Optional[str] = job.after
+        processed: int = job.processed
+        try:
+            question: Optional[Question] = Questions.get_question_id(session, questionId)
+            if question is None:
+                raise QuestionNotFoundError()
+            true_answer: str = question.true_answer
+            correct: float = question.correct_question_percentage
+            incorrect: float = question.incorrect_question_percentage
+            if after is None:
+                processed = 0
+                total: int = Scores.count_graded(session, questionId)
+                session.commit()
+                if not RegradeJobs.update(session, questionId, owner,
+                                          {'total': total, 'processed': processed}):
+                    return
+            while True:
+                users = Scores.regrade(session, questionId, true_answer, correct, incorrect,
+                                       after, RegradeServices.BATCH_SIZE)
+                if not users:
+                    break
+                after = users[-1]
+                processed += len(users)
+                if not RegradeJobs.update(session, questionId, owner,
+                                          {'after': after, 'processed': processed}):
+                    return
+            RegradeJobs.update(session, questionId, owner,
+                               {'status': 'done', 'finished_at': datetime.utcnow()})
+        except Exception as ex:  # pylint: disable=broad-except
+            session.rollback()
+            RegradeJobs.update(session, questionId, owner, {
+                'status': 'failed',
+                'error': str(ex) or type(ex).__name__,
+                'finished_at': datetime.utcnow()
+            })
@@ -0,0 +1,39 @@
+""" ScoreServices class module.
+"""
+
+from typing import Dict, Optional
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2122backend.data.db import Schema
+from dms2122backend.data.db.results import Score
+from dms2122backend.data.db.resultsets import Scores
+
+
+class ScoreServices():
+    """ Monostate class that provides high-level services to handle score-related use cases.
+    """
+
+    @staticmethod
+    def get_score(user: str, schema: Schema) -> Dict:
+        """Returns the score of a user.
+
+        Args:
+            - user (str): The user name string.
+            - schema (Schema): A database handler where the scores are mapped into.
+
+        Raises:
+            - ValueError: If the user is missing.
+
+        Returns:
+            - Dict: A dictionary with the user, its score and the number of questions answered.
+              Users who have not answered any question yet have a score of zero.
+        """
+        session: Session = schema.new_read_session()
+        out: Dict = {'user': user, 'score': 0.0, 'answered': 0}
+        try:
+            score: Optional[Score] = Scores.get(session, user)
+            if score is not None:
+                out['score'] = score.score
+                out['answered'] = score.answered
+        finally:
+            schema.remove_session()
+        return out
@@ -11,3 +11,6 @@ popd
 rm -R "${TEMP_DIR}"
 
 dms2122backend-create-database-of-questions
+
+# Compile the REST API specification
+dms2122backend-build-spec-bundle
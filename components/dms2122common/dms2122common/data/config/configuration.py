@@ -4,7 +4,7 @@
 import os
 from abc import ABC, abstractmethod
 from typing import Dict
-from appdirs import user_config_dir  # type: ignore
+from appdirs import user_cache_dir, user_config_dir  # type: ignore
 import yaml
 
 
@@ -31,6 +31,15 @@ class Configuration(ABC):
 
         return os.path.join(user_config_dir(self._component_name()), 'config.yml')
 
+    def default_cache_dir(self) -> str:
+        """ Path of the default cache directory.
+
+        Returns:
+            - str: A string with the path of the directory for the component cached files.
+        """
+
+        return user_cache_dir(self._component_name())
+
     def __init__(self):
         """ Initialization/constructor method.
         """
@@ -16,6 +16,17 @@ class ServiceConfiguration(Configuration):
         Configuration.__init__(self)
 
         self.set_authorized_api_keys([])
+        self.set_json_serializer('auto')
+        self.set_compression({
+            'min_size': 1024,
+            'level': 6,
+            'algorithms': ['zstd', 'br', 'gzip']
+        })
+        self.set_validation({
+            'compiled': True,
+            'responses': False,
+            'skip_responses': []
+        })
 
     def _set_values(self, values: Dict) -> None:
         """Sets/merges a collection of configuration values.
@@ -31,6 +42,12 @@ class ServiceConfiguration(Configuration):
             self.set_debug_flag(values['debug'])
         if 'authorized_api_keys' in values:
             self.set_authorized_api_keys(values['authorized_api_keys'])
+        if 'json_serializer' in values:
+            self.set_json_serializer(values['json_serializer'])
+        if 'compression' in values:
+            self.set_compression(values['compression'])
+        if 'validation' in values:
+            self.set_validation(values['validation'])
 
     def set_service_host(self, service_host: str) -> None:
         """ Sets the service_host configuration value.
@@ -111,3 +128,100 @@ class ServiceConfiguration(Configuration):
         """
 
         return self._values['authorized_api_keys']
+
+    def set_json_serializer(self, json_serializer: str) -> None:
+        """ Sets the json_serializer configuration value.
+
+        Args:
+            - json_serializer: The JSON library used for the request and response bodies:
+              `orjson`, `stdlib` or `auto` (`orjson` if installed, `stdlib` otherwise).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        if json_serializer not in ('auto', 'orjson', 'stdlib'):
+            raise ValueError('Unknown JSON serializer: ' + str(json_serializer))
+        self._values['json_serializer'] = str(json_serializer)
+
+    def get_json_serializer(self) -> str:
+        """ Gets the json_serializer configuration value.
+
+        Returns:
+            - str: A string with the value of json_serializer.
+        """
+
+        return str(self._values['json_serializer'])
+
+    def set_compression(self, compression: Dict) -> None:
+        """ Sets the response compression configuration value.
+
+        The given values are merged with the current ones.
+
+        Args:
+            - compression: A dictionary with the minimum size in bytes of the responses to be
+              compressed (`min_size`), the gzip-equivalent compression level (`level`, 1 to 9)
+              and the content codings to offer, by preference (`algorithms`; an empty list
+              disables the compression).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        values: Dict = dict(self._values.get('compression', {}))
+        if 'min_size' in compression:
+            values['min_size'] = int(compression['min_size'])
+        if 'level' in compression:
+            values['level'] = int(compression['level'])
+        if 'algorithms' in compression:
+            values['algorithms'] = [str(algorithm) for algorithm in compression['algorithms']]
+        if values.get('min_size', 0) < 0:
+            raise ValueError('The minimum size of the compressed responses cannot be negative.')
+        if not 1 <= values.get('level', 1) <= 9:
+            raise ValueError('The compression level must be between 1 and 9.')
+        unknown: List[str] = [
+            algorithm for algorithm in values.get('algorithms', [])
+            if algorithm not in ('gzip', 'br', 'zstd')
+        ]
+        if unknown:
+            raise ValueError('Unknown compression algorithms: ' + ', '.join(unknown))
+        self._values['compression'] = values
+
+    def get_compression(self) -> Dict:
+        """ Gets the response compression configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of compression.
+        """
+
+        return self._values['compression']
+
+    def set_validation(self, validation: Dict) -> None:
+        """ Sets the REST API validation configuration value.
+
+        The given values are merged with the current ones.
+
+        Args:
+            - validation: A dictionary with whether the request and response bodies are validated
+              with compiled validators (`compiled`) instead of the generic JSON schema ones,
+              whether the responses are validated (`responses`) and the operations whose
+              responses are never validated (`skip_responses`; operation identifiers, or their
+              trailing `module.function` part).
+        """
+        values: Dict = dict(self._values.get('validation', {}))
+        if 'compiled' in validation:
+            values['compiled'] = bool(validation['compiled'])
+        if 'responses' in validation:
+            values['responses'] = bool(validation['responses'])
+        if 'skip_responses' in validation:
+            values['skip_responses'] = [
+                str(operation) for operation in validation['skip_responses']
+            ]
+        self._values['validation'] = values
+
+    def get_validation(self) -> Dict:
+        """ Gets the REST API validation configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of validation.
+        """
+
+        return self._values['validation']
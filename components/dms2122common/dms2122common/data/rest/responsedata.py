@@ -1,7 +1,7 @@
 """ ResponseData class module.
 """
 
-from typing import List
+from typing import List, Optional
 
 
 class ResponseData():
@@ -14,6 +14,7 @@ class ResponseData():
         """
         self.set_successful(True)
         self.set_content(None)
+        self.set_next_cursor(None)
         self.__messages: List[str] = []
 
     def set_successful(self, successful: bool):
@@ -48,6 +49,23 @@ class ResponseData():
         """
         return self.__content
 
+    def set_next_cursor(self, next_cursor: Optional[str]):
+        """ Sets the cursor of the next page, when the content is a page of a longer listing.
+
+        Args:
+            - next_cursor (Optional[str]): The cursor of the next page, or `None` if there are no
+              more pages.
+        """
+        self.__next_cursor: Optional[str] = next_cursor
+
+    def get_next_cursor(self) -> Optional[str]:
+        """ Gets the cursor of the next page, when the content is a page of a longer listing.
+
+        Returns:
+            - Optional[str]: The cursor of the next page, or `None` if there are no more pages.
+        """
+        return self.__next_cursor
+
     def add_message(self, message: str):
         """ Appends a message to the list of messages after processing a response.
 
@@ -0,0 +1,59 @@
+""" LazyExports class module.
+"""
+
+import importlib
+from typing import Any, Dict, List
+
+
+class LazyExports():
+    """ Attributes of a package imported from its modules on first access (PEP 562).
+
+    A package re-exporting the classes of its modules makes importing any of them import all the
+    others, and their dependencies, too. Instead, the package declares where each attribute comes
+    from and delegates its module-level `__getattr__` and `__dir__` to an instance of this class:
+
+        _exports = LazyExports(__name__, {'SomeClass': 'somemodule'})
+        __getattr__ = _exports.get_attribute
+        __dir__ = _exports.list_attributes
+
+    `from package import SomeClass` then imports just `package.somemodule`.
+    """
+
+    def __init__(self, package: str, exports: Dict[str, str]):
+        """ Constructor method.
+
+        Args:
+            - package (str): The name of the package.
+            - exports (Dict[str, str]): The module (relative to the package) each attribute is
+              imported from, by attribute name.
+        """
+        self.__package: str = package
+        self.__exports: Dict[str, str] = exports
+
+    def get_attribute(self, name: str) -> Any:
+        """ Imports an attribute of the package, caching it in the package.
+
+        Args:
+            - name (str): The attribute name.
+
+        Raises:
+            - AttributeError: If the package does not export the attribute.
+
+        Returns:
+            - Any: The attribute value.
+        """
+        if name not in self.__exports:
+            raise AttributeError(f'module {self.__package!r} has no attribute {name!r}')
+        module = importlib.import_module('.' + self.__exports[name], self.__package)
+        value: Any = getattr(module, name)
+        # Later accesses find it in the package and do not get here
+        setattr(importlib.import_module(self.__package), name, value)
+        return value
+
+    def list_attributes(self) -> List[str]:
+        """ Lists the attributes of the package, imported or not.
+
+        Returns:
+            - List[str]: The attribute names.
+        """
+        return sorted(set(vars(importlib.import_module(self.__package))) | set(self.__exports))
@@ -0,0 +1,2 @@
+""" Common presentation layer modules to be used by the different services.
+"""
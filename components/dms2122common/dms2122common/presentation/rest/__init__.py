@@ -0,0 +1,22 @@
+""" Common REST presentation utilities.
+"""
+
+from typing import TYPE_CHECKING
+from dms2122common.lazyexports import LazyExports
+
+if TYPE_CHECKING:
+    from .jsonserializer import JSONSerializer
+    from .operationvalidators import OperationValidators
+    from .responsecompressor import ResponseCompressor
+    from .schemacompiler import SchemaCompiler
+    from .specbundle import SpecBundle
+
+_exports = LazyExports(__name__, {
+    'JSONSerializer': 'jsonserializer',
+    'OperationValidators': 'operationvalidators',
+    'ResponseCompressor': 'responsecompressor',
+    'SchemaCompiler': 'schemacompiler',
+    'SpecBundle': 'specbundle'
+})
+__getattr__ = _exports.get_attribute
+__dir__ = _exports.list_attributes
@@ -0,0 +1,4 @@
+""" Common REST presentation exceptions.
+"""
+
+from .schemavalidationerror import SchemaValidationError
@@ -0,0 +1,20 @@
+""" SchemaValidationError class module.
+"""
+
+from typing import Sequence, Tuple, Union
+
+
+class SchemaValidationError(ValueError):
+    """ Error raised when a value does not conform to a JSON schema.
+    """
+
+    def __init__(self, message: str, path: Sequence[Union[str, int]] = ()):
+        """ Constructor method.
+
+        Args:
+            - message (str): The description of the error.
+            - path (Sequence[Union[str, int]]): The keys and indices leading to the invalid value.
+        """
+        ValueError.__init__(self, message)
+        self.message: str = message
+        self.path: Tuple[Union[str, int], ...] = tuple(path)
@@ -0,0 +1,146 @@
+""" JSONSerializer class module.
+"""
+
+import datetime
+import json
+import uuid
+from typing import Any, Union
+
+
+class JSONSerializer():
+    """ Serializes the response bodies and deserializes the request bodies of a Connexion
+    application.
+
+    The `orjson` backend is several times faster than the standard library one, but requires the
+    optional `orjson` package. Both produce compact JSON, serializing dates and times as ISO 8601
+    strings (naive ones assumed to be UTC) and UUIDs as strings.
+    """
+
+    BACKENDS = ('auto', 'orjson', 'stdlib')
+
+    def __init__(self, backend: str = 'auto'):
+        """ Constructor method.
+
+        Args:
+            - backend (str): The JSON library to use: `orjson`, `stdlib` or `auto` (`orjson` if
+              installed, `stdlib` otherwise).
+
+        Raises:
+            - ValueError: If the backend is unknown.
+            - ImportError: If the `orjson` backend is requested but not installed.
+        """
+        if backend not in JSONSerializer.BACKENDS:
+            raise ValueError('Unknown JSON serializer: ' + str(backend))
+        self.__orjson = None
+        if backend != 'stdlib':
+            try:
+                import orjson  # type: ignore # pylint: disable=import-outside-toplevel
+                self.__orjson = orjson
+            except ImportError:
+                if backend == 'orjson':
+                    raise
+        self.__options: int = 0
+        if self.__orjson is not None:
+            self.__options = self.__orjson.OPT_APPEND_NEWLINE | self.__orjson.OPT_NAIVE_UTC \
+                | self.__orjson.OPT_UTC_Z | self.__orjson.OPT_NON_STR_KEYS
+
+    def get_backend(self) -> str:
+        """ Gets the JSON library in use.
+
+        Returns:
+            - str: `orjson` or `stdlib`.
+        """
+        return 'orjson' if self.__orjson is not None else 'stdlib'
+
+    def dumps(self, data: Any) -> bytes:
+        """ Serializes a value.
+
+        Args:
+            - data (Any): The value.
+
+        Raises:
+            - TypeError: If the value contains objects that cannot be serialized.
+
+        Returns:
+            - bytes: The UTF-8 encoded JSON document, followed by a new line.
+        """
+        if self.__orjson is not None:
+            return self.__orjson.dumps(data, default=JSONSerializer.__default,
+                                       option=self.__options)
+        return (json.dumps(data, default=JSONSerializer.__default, separators=(',', ':'))
+                + '\n').encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """ Deserializes a JSON document.
+
+        Args:
+            - data (Union[bytes, str]): The JSON document.
+
+        Raises:
+            - ValueError: If the document is not valid JSON.
+
+        Returns:
+            - Any: The value.
+        """
+        if self.__orjson is not None:
+            return self.__orjson.loads(data)
+        return json.loads(data)
+
+    def install(self, app) -> None:
+        """ Serializes and deserializes the JSON bodies of a Connexion application from now on.
+
+        Note:
+            Connexion keeps the serializer in its API class, so it is replaced for every
+            application of the process.
+
+        Args:
+            - app (AbstractApp): The Connexion application (Flask or aiohttp).
+        """
+        serializer: JSONSerializer = self
+        if not hasattr(app.app, 'request_class'):
+            # aiohttp applications parse the request bodies with the jsonifier, which must then
+            # return the bodies that are not JSON as text for the validation to reject them
+
+            class _Jsonifier():
+                dumps = serializer.dumps
+
+                @staticmethod
+                def loads(data: Union[bytes, str]) -> Any:
+                    if isinstance(data, bytes):
+                        data = data.decode('utf-8', 'replace')
+                    try:
+                        return serializer.loads(data)
+                    except ValueError:
+                        return data
+
+            app.api_cls.jsonifier = _Jsonifier()
+            return
+        app.api_cls.jsonifier = self
+
+        class _Request(app.app.request_class):  # type: ignore
+            json_module = serializer
+
+        app.app.request_class = _Request
+
+    @staticmethod
+    def __default(value: Any) -> Any:
+        """ Serializes the values not supported natively.
+
+        Args:
+            - value (Any): The value.
+
+        Raises:
+            - TypeError: If the value cannot be serialized.
+
+        Returns:
+            - Any: A serializable representation of the value.
+        """
+        if isinstance(value, datetime.datetime):
+            if value.tzinfo is None:
+                return value.isoformat('T') + 'Z'
+            return value.isoformat('T')
+        if isinstance(value, datetime.date):
+            return value.isoformat()
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        raise TypeError('Object of type ' + type(value).__name__ + ' is not JSON serializable')
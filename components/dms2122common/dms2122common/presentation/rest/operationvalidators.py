@@ -0,0 +1,107 @@
+""" OperationValidators class module.
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+from .exc import SchemaValidationError
+from .schemacompiler import SchemaCompiler
+
+
+class OperationValidators():
+    """ Request and response validators of the operations of a Connexion API.
+
+    Connexion validates every body by interpreting its JSON schema with `jsonschema`. With
+    `compiled` validators, the schemas are instead compiled into Python functions when the
+    operations are added (see `SchemaCompiler`), and every body is validated by its operation's
+    function, reporting the same errors. Schemas that cannot be compiled are still validated by
+    `jsonschema`.
+
+    Response validation (when enabled in the API) can also be skipped for some operations.
+    """
+
+    def __init__(self, compiled: bool = True, skip_responses: Optional[List[str]] = None):
+        """ Constructor method.
+
+        Args:
+            - compiled (bool): Whether the bodies are validated with compiled validators.
+            - skip_responses (Optional[List[str]]): The operations whose responses are not
+              validated; operation identifiers, or their trailing `module.function` part.
+        """
+        self.__compiled: bool = compiled
+        self.__skip_responses: List[str] = list(skip_responses or [])
+
+    def get_validator_map(self) -> Dict[str, Any]:
+        """ Gets the validators to add the API with.
+
+        Returns:
+            - Dict[str, Any]: The `validator_map` argument of `add_api`.
+        """
+        # pylint: disable=import-outside-toplevel
+        from connexion.decorators.response import ResponseValidator  # type: ignore
+        from connexion.decorators.validation import (  # type: ignore
+            Draft4RequestValidator, Draft4ResponseValidator, RequestBodyValidator,
+            draft4_format_checker
+        )
+        request_validator: Any = None
+        response_validator: Any = None
+        if self.__compiled:
+            compiler: SchemaCompiler = SchemaCompiler(draft4_format_checker)
+            request_validator = OperationValidators.__compiled_validator(
+                compiler, Draft4RequestValidator
+            )
+            response_validator = OperationValidators.__compiled_validator(
+                compiler, Draft4ResponseValidator
+            )
+        skip_responses: List[str] = self.__skip_responses
+
+        class _RequestBodyValidator(RequestBodyValidator):  # type: ignore
+            def __init__(self, *args, **kwargs):
+                kwargs['validator'] = request_validator
+                RequestBodyValidator.__init__(self, *args, **kwargs)
+
+        class _ResponseValidator(ResponseValidator):  # type: ignore
+            def __init__(self, operation, mimetype, validator=None):
+                ResponseValidator.__init__(self, operation, mimetype,
+                                           validator=response_validator or validator)
+
+            def __call__(self, function):
+                operation_id: str = self.operation.operation_id or ''
+                if any(operation_id == entry or operation_id.endswith('.' + entry)
+                       for entry in skip_responses):
+                    return function
+                return ResponseValidator.__call__(self, function)
+
+        return {'body': _RequestBodyValidator, 'response': _ResponseValidator}
+
+    @staticmethod
+    def __compiled_validator(compiler: SchemaCompiler, fallback: Any) -> Any:
+        """ Builds a `jsonschema` validator class using the compiled schemas.
+
+        Args:
+            - compiler (SchemaCompiler): The compiler of the schemas.
+            - fallback (Any): The `jsonschema` validator class of the schemas that cannot be
+              compiled.
+
+        Returns:
+            - Any: The validator class.
+        """
+        # pylint: disable=import-outside-toplevel
+        from jsonschema import ValidationError  # type: ignore
+
+        class _CompiledValidator():
+            def __init__(self, schema: Dict, format_checker: Any = None):
+                self.__function: Optional[Callable[[Any], None]] = compiler.compile(schema)
+                # The `jsonschema` validator, only built for the schemas that cannot be compiled
+                self.__fallback: Any = None
+                if self.__function is None:
+                    self.__fallback = fallback(schema, format_checker=format_checker)
+
+            def validate(self, instance: Any) -> None:
+                if self.__function is None:
+                    self.__fallback.validate(instance)
+                    return
+                try:
+                    self.__function(instance)
+                except SchemaValidationError as error:
+                    raise ValidationError(error.message, path=error.path) from None
+
+        return _CompiledValidator
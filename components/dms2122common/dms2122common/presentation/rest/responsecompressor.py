@@ -0,0 +1,225 @@
+""" ResponseCompressor class module.
+"""
+
+import gzip
+from threading import Lock
+from time import thread_time
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class ResponseCompressor():
+    """ Compresses the responses of a Flask or aiohttp application as negotiated with the clients.
+
+    `gzip` is always available; `br` and `zstd` are used if the optional `brotli` and
+    `zstandard` packages are installed.
+    """
+
+    def __init__(self, min_size: int = 1024, level: int = 6,
+                 algorithms: Optional[List[str]] = None):
+        """ Constructor method.
+
+        Args:
+            - min_size (int): The minimum size (in bytes) of the responses to be compressed.
+            - level (int): The gzip compression level (1 to 9); the levels of the other algorithms
+              are chosen to match its speed roughly.
+            - algorithms (Optional[List[str]]): The content codings to use, in order of
+              preference when the client accepts several equally. Defaults to `zstd`, `br` and
+              `gzip`; those not available are ignored.
+        """
+        self.__min_size: int = min_size
+        self.__compressors: Dict[str, Callable[[bytes], bytes]] = {}
+        for algorithm in algorithms if algorithms is not None else ['zstd', 'br', 'gzip']:
+            compressor: Optional[Callable[[bytes], bytes]] = \
+                ResponseCompressor.__new_compressor(algorithm, level)
+            if compressor is not None:
+                self.__compressors[algorithm] = compressor
+        self.__lock: Lock = Lock()
+        self.__metrics: Dict[str, Dict] = {}
+
+    @staticmethod
+    def __new_compressor(algorithm: str, level: int) -> Optional[Callable[[bytes], bytes]]:
+        """ Builds the compression function of a content coding.
+
+        Args:
+            - algorithm (str): The content coding.
+            - level (int): The gzip-equivalent compression level.
+
+        Returns:
+            - Optional[Callable[[bytes], bytes]]: The compression function, or `None` if the
+              content coding is not supported or its package is not installed.
+        """
+        if algorithm == 'gzip':
+            return lambda data: gzip.compress(data, compresslevel=level)
+        if algorithm == 'br':
+            try:
+                import brotli  # type: ignore # pylint: disable=import-outside-toplevel
+            except ImportError:
+                return None
+            quality: int = min(11, max(0, level - 2))
+            return lambda data: brotli.compress(data, quality=quality)
+        if algorithm == 'zstd':
+            try:
+                import zstandard  # type: ignore # pylint: disable=import-outside-toplevel
+            except ImportError:
+                return None
+            compressor = zstandard.ZstdCompressor(level=max(1, level // 2))
+            return compressor.compress
+        return None
+
+    def get_algorithms(self) -> List[str]:
+        """ Gets the available content codings.
+
+        Returns:
+            - List[str]: The content codings, in order of preference.
+        """
+        return list(self.__compressors)
+
+    def install(self, app) -> None:
+        """ Compresses the responses of a Flask application from now on.
+
+        Args:
+            - app (Flask): The Flask application.
+        """
+        app.after_request(self.compress)
+
+    def install_aiohttp(self, app) -> None:
+        """ Compresses the responses of an aiohttp application from now on.
+
+        Args:
+            - app (aiohttp.web.Application): The aiohttp application, not yet started.
+        """
+        from aiohttp import web  # type: ignore # pylint: disable=import-outside-toplevel
+
+        @web.middleware
+        async def compress(request, handler):
+            response = await handler(request)
+            # Streamed responses are not buffered to be compressed
+            if type(response) is not web.Response or 'Content-Encoding' in response.headers \
+                    or not isinstance(response.body, bytes):
+                return response
+            if not self.__compressible(response.content_type):
+                return response
+            if 'Accept-Encoding' not in response.headers.getall('Vary', []):
+                response.headers.add('Vary', 'Accept-Encoding')
+            route = request.match_info.route
+            endpoint: str = route.resource.canonical if route.resource is not None \
+                else request.path
+            encoded = self.__encode(request.headers.get('Accept-Encoding', ''), response.body,
+                                    endpoint)
+            if encoded is not None:
+                response.body = encoded[1]
+                ResponseCompressor.__set_encoding(response.headers, encoded[0])
+            return response
+
+        app.middlewares.append(compress)
+
+    def compress(self, response):
+        """ Compresses a response, if accepted by the client and worth it.
+
+        Only complete (i.e., non-streamed), not yet encoded JSON or text responses of at least
+        the minimum size are compressed. As the representation changes, a strong `ETag` of a
+        compressed response is turned into a weak one.
+
+        Args:
+            - response (Response): The Flask response.
+
+        Returns:
+            - Response: The same response, compressed if applicable.
+        """
+        from flask import request  # pylint: disable=import-outside-toplevel
+
+        if response.direct_passthrough or response.is_streamed \
+                or 'Content-Encoding' in response.headers:
+            return response
+        if not self.__compressible(response.mimetype):
+            return response
+        response.vary.add('Accept-Encoding')
+        endpoint: str = request.url_rule.rule if request.url_rule is not None else request.path
+        encoded = self.__encode(request.headers.get('Accept-Encoding', ''), response.get_data(),
+                                endpoint)
+        if encoded is not None:
+            response.set_data(encoded[1])
+            ResponseCompressor.__set_encoding(response.headers, encoded[0])
+        return response
+
+    @staticmethod
+    def __compressible(mimetype: Optional[str]) -> bool:
+        """ Tells whether the responses of a media type are compressed.
+
+        Args:
+            - mimetype (Optional[str]): The media type of the response.
+
+        Returns:
+            - bool: Whether it is JSON or text.
+        """
+        return mimetype == 'application/json' or (mimetype or '').startswith('text/')
+
+    def __encode(self, accept_encoding: str, data: bytes,
+                 endpoint: str) -> Optional[Tuple[str, bytes]]:
+        """ Compresses a response body, if accepted by the client and worth it.
+
+        Args:
+            - accept_encoding (str): The `Accept-Encoding` header of the request.
+            - data (bytes): The response body.
+            - endpoint (str): The endpoint the metrics are accounted to.
+
+        Returns:
+            - Optional[Tuple[str, bytes]]: The content coding and the compressed body, or `None`
+              if the body is not to be compressed.
+        """
+        # pylint: disable=import-outside-toplevel
+        from werkzeug.http import parse_accept_header  # type: ignore
+
+        if len(data) < self.__min_size:
+            return None
+        algorithm: Optional[str] = parse_accept_header(accept_encoding).best_match(
+            list(self.__compressors)
+        )
+        if algorithm is None:
+            return None
+
+        start: float = thread_time()
+        compressed: bytes = self.__compressors[algorithm](data)
+        cpu_seconds: float = thread_time() - start
+        with self.__lock:
+            metrics: Dict = self.__metrics.setdefault(endpoint, {
+                'responses': 0,
+                'bytes_in': 0,
+                'bytes_out': 0,
+                'cpu_seconds': 0.0
+            })
+            metrics['responses'] += 1
+            metrics['bytes_in'] += len(data)
+            metrics['bytes_out'] += len(compressed)
+            metrics['cpu_seconds'] += cpu_seconds
+        return (algorithm, compressed)
+
+    @staticmethod
+    def __set_encoding(headers, algorithm: str) -> None:
+        """ Sets the headers of a compressed response.
+
+        Args:
+            - headers: The response headers.
+            - algorithm (str): The content coding.
+        """
+        headers['Content-Encoding'] = algorithm
+        etag: Optional[str] = headers.get('ETag')
+        if etag is not None and not etag.startswith('W/'):
+            headers['ETag'] = 'W/' + etag
+
+    def get_metrics(self) -> Dict[str, Dict]:
+        """ Gets the compression metrics of each endpoint.
+
+        Returns:
+            - Dict[str, Dict]: A dictionary per endpoint (URL rule) with the number of compressed
+              responses, their total size before and after compression, the resulting ratio and
+              the CPU time spent compressing (in seconds).
+        """
+        with self.__lock:
+            metrics: Dict[str, Dict] = {
+                endpoint: dict(values) for endpoint, values in self.__metrics.items()
+            }
+        for values in metrics.values():
+            values['ratio'] = values['bytes_in'] / values['bytes_out'] if values['bytes_out'] \
+                else None
+        return metrics
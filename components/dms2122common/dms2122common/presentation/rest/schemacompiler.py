@@ -0,0 +1,375 @@
+""" SchemaCompiler class module.
+"""
+
+import json
+import re
+from threading import Lock
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .exc import SchemaValidationError
+
+
+class SchemaCompiler():
+    """ Compiles JSON schemas into Python functions validating values against them.
+
+    Each schema is translated into the source code of a function with every check unrolled, which
+    is compiled once; validating a value then runs no schema interpretation at all. The OpenAPI 3
+    dialect of JSON schema draft 4 is supported, with the semantics Connexion gives it (`nullable`
+    values may be `None`). Compiled functions are cached, so schemas shared by several operations
+    are compiled once.
+    """
+
+    TYPE_CHECKS: Dict[str, str] = {
+        'object': 'isinstance({0}, dict)',
+        'array': 'isinstance({0}, list)',
+        'string': 'isinstance({0}, str)',
+        'integer': '(isinstance({0}, int) and not isinstance({0}, bool))',
+        'number': '(isinstance({0}, (int, float)) and not isinstance({0}, bool))',
+        'boolean': 'isinstance({0}, bool)',
+        'null': '{0} is None'
+    }
+
+    KEYWORDS: Tuple[str, ...] = (
+        'type', 'nullable', 'x-nullable', 'enum', 'allOf', 'anyOf', 'oneOf',
+        'properties', 'required', 'additionalProperties', 'minProperties', 'maxProperties',
+        'items', 'minItems', 'maxItems', 'minLength', 'maxLength', 'pattern', 'format',
+        'minimum', 'maximum', 'exclusiveMinimum', 'exclusiveMaximum'
+    )
+
+    ANNOTATIONS: Tuple[str, ...] = (
+        'title', 'description', 'default', 'example', 'examples', 'deprecated', 'externalDocs',
+        'xml', 'discriminator'
+    )
+
+    def __init__(self, format_checker: Any = None):
+        """ Constructor method.
+
+        Args:
+            - format_checker (Any): The `jsonschema.FormatChecker` checking the `format` keyword.
+              If not given, formats are not checked.
+        """
+        self.__format_checker: Any = format_checker
+        self.__cache: Dict[str, Optional[Callable[[Any], None]]] = {}
+        self.__cache_by_id: Dict[int, Tuple[Dict, Optional[Callable[[Any], None]]]] = {}
+        self.__lock: Lock = Lock()
+
+    def compile(self, schema: Dict) -> Optional[Callable[[Any], None]]:
+        """ Compiles a schema.
+
+        Args:
+            - schema (Dict): The JSON schema, with its `$ref`s already resolved.
+
+        Returns:
+            - Optional[Callable[[Any], None]]: A function raising a `SchemaValidationError` when
+              the value given does not conform to the schema, or `None` if the schema uses
+              keywords that cannot be compiled (such as `not`, `multipleOf`, `uniqueItems`,
+              `readOnly` or `writeOnly`).
+        """
+        with self.__lock:
+            cached = self.__cache_by_id.get(id(schema))
+        if cached is not None and cached[0] is schema:
+            return cached[1]
+        key: str = json.dumps(schema, sort_keys=True, default=repr)
+        with self.__lock:
+            if key in self.__cache:
+                function = self.__cache[key]
+            else:
+                try:
+                    function = _Generator(self.__format_checker).build(schema)
+                except NotImplementedError:
+                    function = None
+                self.__cache[key] = function
+            # The schema is kept referenced, so its identifier is not reused by another one
+            self.__cache_by_id[id(schema)] = (schema, function)
+        return function
+
+    def generate(self, schema: Dict) -> str:
+        """ Generates the source code of the function validating a schema.
+
+        Args:
+            - schema (Dict): The JSON schema, with its `$ref`s already resolved.
+
+        Raises:
+            - NotImplementedError: If the schema uses keywords that cannot be compiled.
+
+        Returns:
+            - str: The source code of the `validate` function.
+        """
+        generator: _Generator = _Generator(self.__format_checker)
+        generator.emit_function('validate', schema)
+        return generator.source()
+
+
+class _Generator():
+    """ Generates the source code of the validating functions of a schema.
+    """
+
+    def __init__(self, format_checker: Any):
+        self.__format_checker: Any = format_checker
+        self.lines: List[str] = []
+        self.functions: List[str] = []
+        self.namespace: Dict[str, Any] = {
+            'SchemaValidationError': SchemaValidationError,
+            '_additional_properties_message': _additional_properties_message,
+            '_is_valid': _is_valid
+        }
+        self.__names: int = 0
+        self.__schema: Dict = {}
+        self.__var: str = 'value'
+        self.__path: List[str] = []
+        self.__nullable: bool = False
+        self.__known_types: List[str] = []
+
+    def build(self, schema: Dict) -> Callable[[Any], None]:
+        name: str = self.emit_function('validate', schema)
+        exec(compile(self.source(), '<schema>', 'exec'),  # pylint: disable=exec-used
+             self.namespace)
+        return self.namespace[name]
+
+    def source(self) -> str:
+        return '\n'.join(self.functions)
+
+    def emit_function(self, name: str, schema: Dict) -> str:
+        lines: List[str] = self.lines
+        self.lines = [f'def {name}(value):']
+        self.__emit(schema, 'value', [], 1)
+        self.lines.append('    return None')
+        self.functions.append('\n'.join(self.lines))
+        self.lines = lines
+        return name
+
+    def __name(self, prefix: str) -> str:
+        self.__names += 1
+        return f'{prefix}{self.__names}'
+
+    def __constant(self, value: Any) -> str:
+        name: str = self.__name('_constant')
+        self.namespace[name] = value
+        return name
+
+    def __line(self, indent: int, code: str) -> None:
+        self.lines.append('    ' * indent + code)
+
+    def __raise(self, indent: int, message: str) -> None:
+        keys: str = ''.join(key + ', ' for key in self.__path)
+        self.__line(indent, f'raise SchemaValidationError({message}, ({keys}))')
+
+    def __guard(self, indent: int, kind: str) -> int:
+        # Type-specific keywords only apply to values of that type
+        if kind in self.__known_types or (kind == 'number' and 'integer' in self.__known_types):
+            return indent
+        self.__line(indent, f'if {SchemaCompiler.TYPE_CHECKS[kind].format(self.__var)}:')
+        return indent + 1
+
+    def __emit(self, schema: Dict, var: str, path: List[str], indent: int) -> None:
+        if not isinstance(schema, dict):
+            raise NotImplementedError('Boolean schemas are not supported')
+        unsupported: List[str] = [
+            keyword for keyword in schema
+            if keyword not in SchemaCompiler.KEYWORDS and keyword not in SchemaCompiler.ANNOTATIONS
+            and not (keyword.startswith('x-') and keyword != 'x-writeOnly')
+        ]
+        if unsupported:
+            raise NotImplementedError('Unsupported keywords: ' + ', '.join(unsupported))
+        outer: Tuple[Dict, str, List[str], bool, List[str]] = (
+            self.__schema, self.__var, self.__path, self.__nullable, self.__known_types
+        )
+        self.__schema, self.__var, self.__path = schema, var, path
+        self.__nullable = schema.get('nullable') is True or schema.get('x-nullable') is True
+        self.__known_types = []
+        # Checked in the order of the schema, as jsonschema does, so the first error is the same
+        for keyword in schema:
+            emitter: Optional[Callable[[int], None]] = getattr(
+                self, '_Generator__emit_' + keyword, None
+            )
+            if emitter is not None:
+                emitter(indent)
+        (self.__schema, self.__var, self.__path, self.__nullable,
+         self.__known_types) = outer
+
+    def __emit_type(self, indent: int) -> None:
+        declared: Any = self.__schema['type']
+        types: List[str] = [declared] if isinstance(declared, str) else list(declared)
+        if any(eachType not in SchemaCompiler.TYPE_CHECKS for eachType in types):
+            raise NotImplementedError('Unknown types: ' + repr(types))
+        check: str = ' or '.join(SchemaCompiler.TYPE_CHECKS[eachType].format(self.__var)
+                                 for eachType in types)
+        if self.__nullable:
+            check = f'{self.__var} is None or {check}'
+        self.__line(indent, f'if not ({check}):')
+        self.__raise(indent + 1, f"'%r is not of type %s' % ({self.__var}, "
+                     f"{', '.join(repr(eachType) for eachType in types)!r})")
+        if len(types) == 1 and not self.__nullable:
+            # Later keywords can rely on the type
+            self.__known_types = types
+
+    def __emit_enum(self, indent: int) -> None:
+        if not all(isinstance(value, str) or value is None for value in self.__schema['enum']):
+            raise NotImplementedError('Only string enumerations are supported')
+        enum: str = self.__constant(tuple(self.__schema['enum']))
+        condition: str = f'{self.__var} not in {enum}'
+        if self.__nullable:
+            condition = f'{self.__var} is not None and {condition}'
+        self.__line(indent, f'if {condition}:')
+        self.__raise(indent + 1, f"'%r is not one of %r' % ({self.__var}, list({enum}))")
+
+    def __emit_allOf(self, indent: int) -> None:  # pylint: disable=invalid-name
+        for subschema in self.__schema['allOf']:
+            self.__emit(subschema, self.__var, self.__path, indent)
+
+    def __emit_anyOf(self, indent: int) -> None:  # pylint: disable=invalid-name
+        self.__emit_alternatives(indent, 'anyOf')
+
+    def __emit_oneOf(self, indent: int) -> None:  # pylint: disable=invalid-name
+        self.__emit_alternatives(indent, 'oneOf')
+
+    def __emit_alternatives(self, indent: int, keyword: str) -> None:
+        functions: List[str] = [
+            self.emit_function(self.__name('_subschema'), subschema)
+            for subschema in self.__schema[keyword]
+        ]
+        valid: str = self.__name('_valid')
+        self.__line(indent, f'{valid} = sum(1 for function in ({", ".join(functions)},) '
+                            f'if _is_valid(function, {self.__var}))')
+        self.__line(indent, f'if {valid} == 0:')
+        self.__raise(indent + 1,
+                     f"'%r is not valid under any of the given schemas' % ({self.__var},)")
+        if keyword == 'oneOf':
+            self.__line(indent, f'if {valid} > 1:')
+            self.__raise(indent + 1, f"'%r is valid under more than one of the given schemas' "
+                                     f"% ({self.__var},)")
+
+    def __emit_properties(self, indent: int) -> None:
+        indent = self.__guard(indent, 'object')
+        for name, subschema in self.__schema['properties'].items():
+            item: str = self.__name('_property')
+            self.__line(indent, f'if {name!r} in {self.__var}:')
+            self.__line(indent + 1, f'{item} = {self.__var}[{name!r}]')
+            self.__emit(subschema, item, self.__path + [repr(name)], indent + 1)
+
+    def __emit_required(self, indent: int) -> None:
+        indent = self.__guard(indent, 'object')
+        for name in self.__schema['required']:
+            self.__line(indent, f'if {name!r} not in {self.__var}:')
+            self.__raise(indent + 1, repr(f'{name!r} is a required property'))
+
+    def __emit_additionalProperties(self, indent: int) -> None:  # pylint: disable=invalid-name
+        additional: Any = self.__schema['additionalProperties']
+        if additional is True:
+            return
+        indent = self.__guard(indent, 'object')
+        known: str = self.__constant(frozenset(self.__schema.get('properties', {})))
+        if additional is False:
+            extras: str = self.__name('_extras')
+            self.__line(indent, f'{extras} = [key for key in {self.__var} if key not in {known}]')
+            self.__line(indent, f'if {extras}:')
+            self.__raise(indent + 1, f'_additional_properties_message({extras})')
+        else:
+            key: str = self.__name('_key')
+            item: str = self.__name('_property')
+            self.__line(indent, f'for {key}, {item} in {self.__var}.items():')
+            self.__line(indent + 1, f'if {key} not in {known}:')
+            self.__emit(additional, item, self.__path + [key], indent + 2)
+
+    def __emit_minProperties(self, indent: int) -> None:  # pylint: disable=invalid-name
+        indent = self.__guard(indent, 'object')
+        self.__line(indent, f'if len({self.__var}) < {int(self.__schema["minProperties"])}:')
+        self.__raise(indent + 1, f"'%r does not have enough properties' % ({self.__var},)")
+
+    def __emit_maxProperties(self, indent: int) -> None:  # pylint: disable=invalid-name
+        indent = self.__guard(indent, 'object')
+        self.__line(indent, f'if len({self.__var}) > {int(self.__schema["maxProperties"])}:')
+        self.__raise(indent + 1, f"'%r has too many properties' % ({self.__var},)")
+
+    def __emit_items(self, indent: int) -> None:
+        if not isinstance(self.__schema['items'], dict):
+            raise NotImplementedError('Only single schema items are supported')
+        indent = self.__guard(indent, 'array')
+        index: str = self.__name('_index')
+        item: str = self.__name('_item')
+        self.__line(indent, f'for {index}, {item} in enumerate({self.__var}):')
+        self.__emit(self.__schema['items'], item, self.__path + [index], indent + 1)
+
+    def __emit_minItems(self, indent: int) -> None:  # pylint: disable=invalid-name
+        self.__emit_length(indent, 'array', 'minItems')
+
+    def __emit_maxItems(self, indent: int) -> None:  # pylint: disable=invalid-name
+        self.__emit_length(indent, 'array', 'maxItems')
+
+    def __emit_minLength(self, indent: int) -> None:  # pylint: disable=invalid-name
+        self.__emit_length(indent, 'string', 'minLength')
+
+    def __emit_maxLength(self, indent: int) -> None:  # pylint: disable=invalid-name
+        self.__emit_length(indent, 'string', 'maxLength')
+
+    def __emit_length(self, indent: int, kind: str, keyword: str) -> None:
+        indent = self.__guard(indent, kind)
+        limit: int = int(self.__schema[keyword])
+        if keyword.startswith('min'):
+            self.__line(indent, f'if len({self.__var}) < {limit}:')
+            message: str = 'should be non-empty' if limit == 1 else 'is too short'
+        else:
+            self.__line(indent, f'if len({self.__var}) > {limit}:')
+            message = 'is expected to be empty' if limit == 0 else 'is too long'
+        self.__raise(indent + 1, f"'%r {message}' % ({self.__var},)")
+
+    def __emit_pattern(self, indent: int) -> None:
+        indent = self.__guard(indent, 'string')
+        pattern: str = self.__constant(re.compile(self.__schema['pattern']))
+        self.__line(indent, f'if {pattern}.search({self.__var}) is None:')
+        self.__raise(indent + 1, f"'%r does not match %r' % ({self.__var}, {pattern}.pattern)")
+
+    def __emit_format(self, indent: int) -> None:
+        # As jsonschema, formats unknown to the checker are not checked
+        name: str = self.__schema['format']
+        if self.__format_checker is None or name not in self.__format_checker.checkers:
+            return
+        checker: str = self.__constant(self.__format_checker)
+        self.__line(indent, f'if not {checker}.conforms({self.__var}, {name!r}):')
+        self.__raise(indent + 1, f"'%r is not a %r' % ({self.__var}, {name!r})")
+
+    def __emit_minimum(self, indent: int) -> None:
+        self.__emit_limit(indent, 'minimum', '<', 'less')
+
+    def __emit_maximum(self, indent: int) -> None:
+        self.__emit_limit(indent, 'maximum', '>', 'greater')
+
+    def __emit_limit(self, indent: int, keyword: str, operator: str, description: str) -> None:
+        indent = self.__guard(indent, 'number')
+        limit: str = self.__constant(self.__schema[keyword])
+        exclusive: bool = self.__schema.get('exclusive' + keyword.capitalize()) is True
+        self.__line(indent, f'if {self.__var} {operator}{"=" if exclusive else ""} {limit}:')
+        self.__raise(indent + 1,
+                     f"'%r is {description} than {'or equal to ' if exclusive else ''}"
+                     f"the {keyword} of %r' % ({self.__var}, {limit})")
+
+
+def _additional_properties_message(extras: List[Any]) -> str:
+    """ Describes the properties not allowed in an object.
+
+    Args:
+        - extras (List[Any]): The keys of the properties.
+
+    Returns:
+        - str: The error message.
+    """
+    return 'Additional properties are not allowed (%s %s unexpected)' % (
+        ', '.join(repr(extra) for extra in sorted(extras, key=str)),
+        'was' if len(extras) == 1 else 'were'
+    )
+
+
+def _is_valid(function: Callable[[Any], None], value: Any) -> bool:
+    """ Checks a value with a compiled function.
+
+    Args:
+        - function (Callable[[Any], None]): The compiled function.
+        - value (Any): The value.
+
+    Returns:
+        - bool: Whether the value conforms to the schema of the function.
+    """
+    try:
+        function(value)
+    except SchemaValidationError:
+        return False
+    return True
@@ -0,0 +1,158 @@
+""" SpecBundle class module.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from typing import Any, Optional
+import yaml
+
+
+class SpecBundle():
+    """ OpenAPI specification of a Connexion application, compiled once and cached in a file.
+
+    Connexion parses the YAML specification and validates it against the OpenAPI schema every time
+    an API is added, which accounts for most of the time spent adding it. The bundle holds the
+    specification already parsed, validated and with its `$ref`s resolved, so it is just unpickled
+    at startup. Bundles are named after a hash of the specification and the Connexion version, so a
+    stale bundle is never loaded.
+    """
+
+    def __init__(self, specification_path: str, cache_dir: str):
+        """ Constructor method.
+
+        Args:
+            - specification_path (str): The path of the YAML specification.
+            - cache_dir (str): The directory of the bundle files.
+        """
+        self.__specification_path: str = specification_path
+        self.__cache_dir: str = cache_dir
+        self.__path: Optional[str] = None
+
+    def get_path(self) -> str:
+        """ Gets the path of the bundle file of the current specification.
+
+        Returns:
+            - str: The path of the bundle file, which may not exist yet.
+        """
+        if self.__path is None:
+            import connexion  # type: ignore # pylint: disable=import-outside-toplevel
+            digest = hashlib.sha256()
+            with open(self.__specification_path, 'rb') as specification_file:
+                digest.update(specification_file.read())
+            digest.update(connexion.__version__.encode('utf-8'))
+            digest.update(repr(sys.version_info[:2]).encode('utf-8'))
+            self.__path = os.path.join(
+                self.__cache_dir,
+                os.path.splitext(os.path.basename(self.__specification_path))[0]
+                + '-' + digest.hexdigest()[:16] + '.pickle'
+            )
+        return self.__path
+
+    def compile(self) -> Any:
+        """ Compiles the specification, as Connexion does when adding an API from it.
+
+        Raises:
+            - InvalidSpecification: If the specification is not valid.
+
+        Returns:
+            - Specification: The Connexion specification.
+        """
+        # pylint: disable=import-outside-toplevel
+        import jinja2
+        from connexion.spec import Specification  # type: ignore
+        with open(self.__specification_path, 'rb') as specification_file:
+            template: str = specification_file.read().decode('utf-8', 'replace')
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        return Specification.from_dict(yaml.load(jinja2.Template(template).render(),
+                                                 Loader=loader))
+
+    def build(self) -> str:
+        """ Compiles the specification and writes it to its bundle file.
+
+        Raises:
+            - InvalidSpecification: If the specification is not valid.
+            - OSError: If the bundle file cannot be written.
+
+        Returns:
+            - str: The path of the bundle file.
+        """
+        return self.__write(self.compile())
+
+    def load(self) -> Any:
+        """ Loads the compiled specification from its bundle file.
+
+        When there is no bundle of the current specification yet, it is compiled and written (if
+        the cache directory is writable), so later startups can load it.
+
+        Raises:
+            - InvalidSpecification: If the specification is not valid.
+
+        Returns:
+            - Specification: The Connexion specification.
+        """
+        try:
+            with open(self.get_path(), 'rb') as bundle_file:
+                return pickle.load(bundle_file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            pass
+        specification = self.compile()
+        try:
+            self.__write(specification)
+        except OSError:
+            pass
+        return specification
+
+    def add_api(self, app, **kwargs) -> Any:
+        """ Adds an API to a Connexion application from the bundled specification.
+
+        Args:
+            - app (AbstractApp): The Connexion application.
+            - kwargs: The keyword arguments of `add_api`, but `specification` and `arguments`.
+
+        Returns:
+            - AbstractAPI: The API added.
+        """
+        # pylint: disable=import-outside-toplevel
+        from connexion.apis import abstract  # type: ignore
+        specification = self.load()
+        connexion_specification = abstract.Specification
+
+        class _BundledSpecification(connexion_specification):  # type: ignore
+            @classmethod
+            def load(cls, spec, arguments=None):
+                if spec is specification.raw:
+                    return specification
+                return connexion_specification.load(spec, arguments=arguments)
+
+        # Connexion has no way to pass a compiled specification to the APIs it creates
+        abstract.Specification = _BundledSpecification
+        try:
+            return app.add_api(specification.raw, **kwargs)
+        finally:
+            abstract.Specification = connexion_specification
+
+    def __write(self, specification: Any) -> str:
+        """ Writes a compiled specification to its bundle file, atomically.
+
+        Args:
+            - specification (Specification): The Connexion specification.
+
+        Raises:
+            - OSError: If the bundle file cannot be written.
+
+        Returns:
+            - str: The path of the bundle file.
+        """
+        os.makedirs(self.__cache_dir, exist_ok=True)
+        handle, temporary_path = tempfile.mkstemp(dir=self.__cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as bundle_file:
+                pickle.dump(specification, bundle_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, self.get_path())
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+        return self.get_path()
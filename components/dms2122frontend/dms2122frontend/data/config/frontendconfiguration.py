@@ -38,6 +38,11 @@ class FrontendConfiguration(ServiceConfiguration):
             'port': 5001,
             'apikey_secret': 'This is another frontend API key'
         })
+        self.set_token_verification({
+            'mode': 'remote',
+            'jws_secret': '',
+            'refresh_window': 300
+        })
 
     def _set_values(self, values: Dict) -> None:
         """Sets/merges a collection of configuration values.
@@ -53,6 +58,8 @@ class FrontendConfiguration(ServiceConfiguration):
             self.set_auth_service(values['auth_service'])
         if 'backend_service' in values:
             self.set_backend_service(values['backend_service'])
+        if 'token_verification' in values:
+            self.set_token_verification(values['token_verification'])
 
     def set_app_secret_key(self, app_secret_key: str) -> None:
         """ Sets the app_secret_key configuration value.
@@ -113,3 +120,45 @@ class FrontendConfiguration(ServiceConfiguration):
         """
 
         return self._values['backend_service']
+
+    def set_token_verification(self, token_verification: Dict) -> None:
+        """ Sets how the user session tokens are verified.
+
+        The given values are merged with the current ones.
+
+        Args:
+            - token_verification (Dict): A dictionary with the verification mode (`mode`; `remote`
+              to ask the authentication service on every request, or `local` to check the token
+              signature and expiration here), the secret the authentication service signs the
+              tokens with (`jws_secret`, needed in `local` mode) and the seconds before the
+              expiration of a token from which it is refreshed by the authentication service
+              (`refresh_window`).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        values: Dict = dict(self._values.get('token_verification', {}))
+        if 'mode' in token_verification:
+            if token_verification['mode'] not in ('remote', 'local'):
+                raise ValueError('Unknown token verification mode: '
+                                 + str(token_verification['mode']))
+            values['mode'] = token_verification['mode']
+        if 'jws_secret' in token_verification:
+            values['jws_secret'] = str(token_verification['jws_secret'])
+        if 'refresh_window' in token_verification:
+            refresh_window: int = int(token_verification['refresh_window'])
+            if refresh_window < 0:
+                raise ValueError('The token refresh window cannot be negative')
+            values['refresh_window'] = refresh_window
+        if values['mode'] == 'local' and not values.get('jws_secret'):
+            raise ValueError('Local token verification requires the JWS secret')
+        self._values['token_verification'] = values
+
+    def get_token_verification(self) -> Dict:
+        """ Gets the token verification configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of token_verification.
+        """
+
+        return self._values['token_verification']
@@ -1,5 +1,16 @@
 """ Data layer REST clients.
 """
 
-from .authservice import AuthService
-from .backendservice import BackendService
+from typing import TYPE_CHECKING
+from dms2122common.lazyexports import LazyExports
+
+if TYPE_CHECKING:
+    from .authservice import AuthService
+    from .backendservice import BackendService
+
+_exports = LazyExports(__name__, {
+    'AuthService': 'authservice',
+    'BackendService': 'backendservice'
+})
+__getattr__ = _exports.get_attribute
+__dir__ = _exports.list_attributes
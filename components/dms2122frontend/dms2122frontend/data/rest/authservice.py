@@ -1,8 +1,11 @@
 """ AuthService class module.
 """
 
-from typing import List, Optional, Union
+import time
+from threading import Lock
+from typing import Any, Dict, List, Optional, Union
 import requests
+from urllib3.util import make_headers  # type: ignore
 from dms2122common.data import Role
 from dms2122common.data.rest import ResponseData
 
@@ -15,7 +18,9 @@ class AuthService():
                  host: str, port: int,
                  api_base_path: str = '/api/v1',
                  apikey_header: str = 'X-ApiKey-Auth',
-                 apikey_secret: str = ''
+                 apikey_secret: str = '',
+                 jws_secret: Optional[str] = None,
+                 refresh_window: int = 300
                  ):
         """ Constructor method.
 
@@ -27,12 +32,34 @@ class AuthService():
             - api_base_path (str): The base path that is prepended to every request's path.
             - apikey_header (str): Name of the header with the API key that identifies this client.
             - apikey_secret (str): The API key that identifies this client.
+            - jws_secret (Optional[str]): The secret the authentication service signs the user
+              session tokens with. If given, tokens are verified locally, and only those expiring
+              within the refresh window are sent to the authentication service to be refreshed.
+            - refresh_window (int): Seconds before the expiration of a token from which it is
+              refreshed, when verifying tokens locally.
         """
         self.__host: str = host
         self.__port: int = port
         self.__api_base_path: str = api_base_path
         self.__apikey_header: str = apikey_header
         self.__apikey_secret: str = apikey_secret
+        # Connections are reused, and responses compressed with any content coding that can be
+        # decoded here (gzip and deflate, plus br/zstd if their packages are installed)
+        self.__session: requests.Session = requests.Session()
+        self.__session.headers['Accept-Encoding'] = \
+            make_headers(accept_encoding=True)['accept-encoding']
+        self.__jws: Any = None
+        if jws_secret is not None:
+            # pylint: disable=import-outside-toplevel
+            from itsdangerous import TimedJSONWebSignatureSerializer
+            self.__jws = TimedJSONWebSignatureSerializer(jws_secret)
+        self.__refresh_window: int = refresh_window
+        self.__token_metrics_lock: Lock = Lock()
+        self.__token_metrics: Dict[str, int] = {
+            'verified_locally': 0,
+            'rejected_locally': 0,
+            'verified_remotely': 0
+        }
 
     def __base_url(self) -> str:
         """ Constructs the base URL for the requests.
@@ -52,7 +79,7 @@ class AuthService():
         Returns:
             - ResponseData: If successful, the contents hold a string with the user session token.
         """
-        response: requests.Response = requests.post(
+        response: requests.Response = self.__session.post(
             self.__base_url() + '/auth',
             auth=(username, password),
             headers={
@@ -70,19 +97,36 @@ class AuthService():
     def auth(self, token: Optional[str]) -> ResponseData:
         """ Performs an authentication request to the authentication service.
 
+        When verifying tokens locally, valid tokens not about to expire are accepted as they are,
+        and invalid or expired ones rejected, without requesting the authentication service.
+
         Args:
             - token (Optional[str]): The user session token to validate.
 
         Returns:
-            - ResponseData: If successful, the contents hold a string with a new user session token.
-              Otherwise, the session is rejected (e.g., timed out, was invalidated, was missing)
+            - ResponseData: If successful, the contents hold a string with the user session token
+              (a new one if it was refreshed). Otherwise, the session is rejected (e.g., timed
+              out, was invalidated, was missing)
         """
         response_data: ResponseData = ResponseData()
         if not token:
             response_data.set_successful(False)
             return response_data
 
-        response: requests.Response = requests.post(
+        if self.__jws is not None:
+            expires_in: Optional[float] = self.__expires_in(token)
+            if expires_in is None:
+                self.__count_token_verification('rejected_locally')
+                response_data.set_successful(False)
+                response_data.add_message('Session expired')
+                return response_data
+            if expires_in > self.__refresh_window:
+                self.__count_token_verification('verified_locally')
+                response_data.set_content(token)
+                return response_data
+
+        self.__count_token_verification('verified_remotely')
+        response: requests.Response = self.__session.post(
             self.__base_url() + '/auth',
             headers={
                 'Authorization': f'Bearer {token}',
@@ -96,6 +140,79 @@ class AuthService():
             response_data.add_message('Session expired')
         return response_data
 
+    def __expires_in(self, token: str) -> Optional[float]:
+        """ Verifies the signature and expiration of a token locally.
+
+        Args:
+            - token (str): The user session token.
+
+        Returns:
+            - Optional[float]: The seconds until the token expires, or `None` if it is not valid
+              or has already expired.
+        """
+        # pylint: disable=import-outside-toplevel
+        from itsdangerous import BadSignature
+        try:
+            data, header = self.__jws.loads(token.encode('ascii'), return_header=True)
+        except (BadSignature, UnicodeEncodeError):
+            return None
+        if not isinstance(data, dict) or 'user' not in data:
+            return None
+        return header['exp'] - time.time()
+
+    @staticmethod
+    def get_role_claims(token: str) -> Optional[Dict]:
+        """ Reads the role claims embedded in a user session token.
+
+        The token signature is not verified, so it must come from a trusted source (i.e., from
+        the authentication service, or from a session already verified).
+
+        Args:
+            - token (str): The user session token.
+
+        Returns:
+            - Dict: A dictionary with the list of role names granted to the user (key `roles`) and
+              their version (key `roles_version`).
+            - None: Nothing if the token does not embed them (e.g., issued by an older
+              authentication service) or is malformed.
+        """
+        # pylint: disable=import-outside-toplevel
+        from itsdangerous import BadData, JSONWebSignatureSerializer
+        try:
+            claims: Any = JSONWebSignatureSerializer('').load_payload(token.rsplit('.', 1)[0])
+        except (BadData, UnicodeEncodeError):
+            return None
+        if not isinstance(claims, dict) or 'roles_version' not in claims:
+            return None
+        return {
+            'roles': list(claims.get('roles', [])),
+            'roles_version': claims['roles_version']
+        }
+
+    def __count_token_verification(self, outcome: str) -> None:
+        """ Counts a token verification.
+
+        Args:
+            - outcome (str): The metric counting the outcome of the verification.
+        """
+        with self.__token_metrics_lock:
+            self.__token_metrics[outcome] += 1
+
+    def get_token_metrics(self) -> Dict[str, Any]:
+        """ Gets the metrics of the token verifications.
+
+        Returns:
+            - Dict[str, Any]: The verification mode (`local` or `remote`), and the number of
+              tokens accepted and rejected without requesting the authentication service (the
+              round trips avoided) and verified (or refreshed) by it.
+        """
+        with self.__token_metrics_lock:
+            metrics: Dict[str, Any] = dict(self.__token_metrics)
+        metrics['mode'] = 'local' if self.__jws is not None else 'remote'
+        metrics['avoided_round_trips'] = \
+            metrics['verified_locally'] + metrics['rejected_locally']
+        return metrics
+
     def list_users(self, token: Optional[str]) -> ResponseData:
         """ Requests a list of registered users.
 
@@ -107,7 +224,7 @@ class AuthService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
+        response: requests.Response = self.__session.get(
             self.__base_url() + '/users',
             headers={
                 'Authorization': f'Bearer {token}',
@@ -134,7 +251,7 @@ class AuthService():
             - ResponseData: If successful, the contents hold the new user's data.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
+        response: requests.Response = self.__session.post(
             self.__base_url() + '/user/new',
             json={
                 'username': username,
@@ -164,7 +281,7 @@ class AuthService():
               empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
+        response: requests.Response = self.__session.get(
             self.__base_url() + f'/user/{username}/roles',
             headers={
                 'Authorization': f'Bearer {token}',
@@ -195,7 +312,7 @@ class AuthService():
         if isinstance(role, Role):
             role = role.name
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
+        response: requests.Response = self.__session.post(
             self.__base_url() + f'/user/{username}/role/{role}',
             headers={
                 'Authorization': f'Bearer {token}',
@@ -223,7 +340,7 @@ class AuthService():
         if isinstance(role, Role):
             role = role.name
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.delete(
+        response: requests.Response = self.__session.delete(
             self.__base_url() + f'/user/{username}/role/{role}',
             headers={
                 'Authorization': f'Bearer {token}',
@@ -240,28 +357,30 @@ class AuthService():
                           ) -> ResponseData:
         """ Requests to update several roles on a user at once.
 
-        This is an utility method. If at least one of them fails, all of them are considered failed,
-        though some of the changes may have taken effect. The messages should describe the failure
-        reasons.
+        The changes are applied in a single request and transaction, so either all of them take
+        effect or none does.
 
         Args:
             - token (Optional[str]): The user session token.
             - username (str): The user to have their roles updated.
-            - new_roles (List): A list of roles to update. If present in the list, will be granted;
-              otherwise, they will be revoked.
+            - new_roles (List): A list of roles (or role names) to update. If present in the list,
+              will be granted; otherwise, they will be revoked.
 
         Returns:
-            - ResponseData: Useful to know whether the operation succeeded and its messages.
+            - ResponseData: If successful, the contents hold the resulting list of role names.
         """
-        aggregated_response: ResponseData = ResponseData()
-        aggregated_response.set_successful(True)
-        for role in Role:
-            response: ResponseData
-            if role.name in new_roles:
-                response = self.grant_user_role(token, username, role)
-            else:
-                response = self.revoke_user_role(token, username, role)
-            aggregated_response.add_messages(response.get_messages())
-            aggregated_response.set_successful(
-                aggregated_response.is_successful() & response.is_successful())
-        return aggregated_response
\ No newline at end of file
+        response_data: ResponseData = ResponseData()
+        response: requests.Response = self.__session.put(
+            self.__base_url() + f'/user/{username}/roles',
+            json=[role.name if isinstance(role, Role) else role for role in new_roles],
+            headers={
+                'Authorization': f'Bearer {token}',
+                self.__apikey_header: self.__apikey_secret
+            }
+        )
+        response_data.set_successful(response.ok)
+        if response_data.is_successful():
+            response_data.set_content(response.json())
+        else:
+            response_data.add_message(response.content.decode('ascii'))
+        return response_data
\ No newline at end of file
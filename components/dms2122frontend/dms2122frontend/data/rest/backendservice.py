@@ -1,11 +1,13 @@
 """ BackendService class module.
 """
 
-from typing import Optional
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Optional, Dict, List, Tuple
 import requests
+from urllib3.util import make_headers  # type: ignore
 from dms2122common.data import Role
 from dms2122common.data.rest import ResponseData
-from typing import Optional
 
 class BackendService():
     """ REST client to connect to the backend service.
@@ -15,7 +17,8 @@ class BackendService():
         host: str, port: int,
         api_base_path: str = '/api/v1',
         apikey_header: str = 'X-ApiKey-Backend',
-        apikey_secret: str = ''
+        apikey_secret: str = '',
+        etag_cache_size: int = 256
         ):
         """ Constructor method.
 
@@ -27,19 +30,64 @@ class BackendService():
             - api_base_path (str): The base path that is prepended to every request's path.
             - apikey_header (str): Name of the header with the API key that identifies this client.
             - apikey_secret (str): The API key that identifies this client.
+            - etag_cache_size (int): The maximum number of question responses kept to be
+              revalidated with their ETag instead of being downloaded again.
         """
         self.__host: str = host
         self.__port: int = port
         self.__api_base_path: str = api_base_path
         self.__apikey_header: str = apikey_header
         self.__apikey_secret: str = apikey_secret
+        # Connections are reused, and responses compressed with any content coding that can be
+        # decoded here (gzip and deflate, plus br/zstd if their packages are installed)
+        self.__session: requests.Session = requests.Session()
+        self.__session.headers['Accept-Encoding'] = \
+            make_headers(accept_encoding=True)['accept-encoding']
+        self.__etag_cache_size: int = etag_cache_size
+        self.__etag_cache: 'OrderedDict[str, Tuple[str, Any]]' = OrderedDict()
+        self.__etag_lock: Lock = Lock()
 
     def __base_url(self) -> str:
         return f'http://{self.__host}:{self.__port}{self.__api_base_path}'
 
+    def __conditional_get(self, url: str, headers: Dict) -> Tuple[requests.Response, Any]:
+        """ Sends a GET request, revalidating the copy of its response kept from a previous one.
+
+        Args:
+            - url (str): The URL.
+            - headers (Dict): The request headers.
+
+        Returns:
+            - Tuple[requests.Response, Any]: The response and its JSON content (the kept copy if
+              the response is 304 Not Modified). The content is `None` if not successful.
+        """
+        with self.__etag_lock:
+            cached: Optional[Tuple[str, Any]] = self.__etag_cache.get(url)
+        if cached is not None:
+            headers = dict(headers, **{'If-None-Match': cached[0]})
+        response: requests.Response = self.__session.get(url, headers=headers)
+        if response.status_code == 304 and cached is not None:
+            with self.__etag_lock:
+                if url in self.__etag_cache:
+                    self.__etag_cache.move_to_end(url)
+            return (response, cached[1])
+        if not response.ok:
+            return (response, None)
+        content: Any = response.json()
+        etag: Optional[str] = response.headers.get('ETag')
+        if etag is not None and self.__etag_cache_size > 0:
+            with self.__etag_lock:
+                self.__etag_cache[url] = (etag, content)
+                self.__etag_cache.move_to_end(url)
+                while len(self.__etag_cache) > self.__etag_cache_size:
+                    self.__etag_cache.popitem(last=False)
+        return (response, content)
+
     def list_questions(self, token: Optional[str]) -> ResponseData:
         """ Requests a list of registered questions.
 
+        The list is only downloaded again if it has changed since the last request.
+
         Args:
             token (Optional[str]): The user session token.
 
@@ -48,7 +96,7 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
+        response, content = self.__conditional_get(
             self.__base_url() + '/questions',
             headers={
                 'Authorization': f'Bearer {token}',
@@ -57,7 +105,7 @@ class BackendService():
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
-            response_data.set_content(response.json())
+            response_data.set_content(content)
         else:
             response_data.add_message(response.content.decode('ascii'))
             response_data.set_content([])
@@ -83,7 +131,7 @@ class BackendService():
             - ResponseData: If successful, the contents hold the new question's data.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
+        response: requests.Response = self.__session.post(
             self.__base_url() + '/questions/add',
             json={
                 'question': question,
@@ -126,7 +174,7 @@ class BackendService():
             - ResponseData: If successful, the contents hold the new question's data.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.put(
+        response: requests.Response = self.__session.put(
             self.__base_url() + f'/questions/{questionId}/edit',
             json={
                 'questionId': questionId,
@@ -153,6 +201,8 @@ class BackendService():
     def get_question(self, token: Optional[str], questionId: int) -> ResponseData:
         """ Requests a question.
 
+        The question is only downloaded again if it has changed since the last request.
+
         Args:
             - token (Optional[str]): The user session token.
             - questionId (int): Question identifier.
@@ -162,7 +212,7 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
+        response, content = self.__conditional_get(
             self.__base_url() + f'/questions/{questionId}/preview',
             headers={
                 'Authorization': f'Bearer {token}',
@@ -171,7 +221,7 @@ class BackendService():
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
-            response_data.set_content(response.json())
+            response_data.set_content(content)
         else:
             response_data.add_message(response.content.decode('ascii'))
             response_data.set_content([])
@@ -191,7 +241,7 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
+        response: requests.Response = self.__session.post(
             self.__base_url() + f'/questions/{questionId}/answer/{user}',
             json={
                 'user': user,
@@ -211,20 +261,26 @@ class BackendService():
             response_data.set_content([])
         return response_data
 
-    def list_answers_to_question(self, token: Optional[str], questionId: int) -> ResponseData:
-        """ List all the answers to a question.
+    def answer_questions(self, token: Optional[str], user: str, answers: List[Dict]) -> ResponseData:
+        """ Answers several questions at once.
 
         Args:
             - token (Optional[str]): The user session token.
-            - questionId (int): Question identifier.
+            - user (str): The user that is answering the questions.
+            - answers (List[Dict]): The answers, each one a dictionary with its `questionId` and
+              its `answer`.
 
         Returns:
-            - ResponseData: If successful, the contents hold a list of answers.
-              Otherwise, the contents will be an empty list.
+            - ResponseData: If successful, the contents hold a list with the result of each answer
+              (its `index`, `questionId` and `status`). Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/questions/{questionId}/answers',
+        response: requests.Response = self.__session.post(
+            self.__base_url() + f'/questions/{user}/answers/batch',
+            json=[
+                {'questionId': eachAnswer['questionId'], 'answer': eachAnswer['answer']}
+                for eachAnswer in answers
+            ],
             headers={
                 'Authorization': f'Bearer {token}',
                 self.__apikey_header: self.__apikey_secret
@@ -238,20 +294,68 @@ class BackendService():
             response_data.set_content([])
         return response_data
 
-    def list_answers_from_user(self, token: Optional[str], user: str) -> ResponseData:
-        """ List all the answers made by an user.
+    def list_answers_to_question(self, token: Optional[str], questionId: int,
+                                 limit: Optional[int] = None, after: Optional[str] = None,
+                                 since: Optional[str] = None) -> ResponseData:
+        """ List the answers to a question.
+
+        Args:
+            - token (Optional[str]): The user session token.
+            - questionId (int): Question identifier.
+            - limit (Optional[int]): If given, the maximum number of answers in the page.
+            - after (Optional[str]): The cursor of the page (a previous response's next cursor).
+            - since (Optional[str]): If given, an ISO 8601 date-time to list the answers from.
+
+        Returns:
+            - ResponseData: If successful, the contents hold a list of answers and the next cursor
+              (if there are more pages). Otherwise, the contents will be an empty list.
+        """
+        return self.__list_answers(token, f'/questions/{questionId}/answers', limit, after, since)
+
+    def list_answers_from_user(self, token: Optional[str], user: str,
+                               limit: Optional[int] = None, after: Optional[str] = None,
+                               since: Optional[str] = None) -> ResponseData:
+        """ List the answers made by an user.
 
         Args:
             - token (Optional[str]): The user session token.
             - user (str): An user.
+            - limit (Optional[int]): If given, the maximum number of answers in the page.
+            - after (Optional[str]): The cursor of the page (a previous response's next cursor).
+            - since (Optional[str]): If given, an ISO 8601 date-time to list the answers from.
 
         Returns:
-            - ResponseData: If successful, the contents hold a list of answers.
-              Otherwise, the contents will be an empty list.
+            - ResponseData: If successful, the contents hold a list of answers and the next cursor
+              (if there are more pages). Otherwise, the contents will be an empty list.
+        """
+        return self.__list_answers(token, f'/questions/{user}/answers', limit, after, since)
+
+    def __list_answers(self, token: Optional[str], path: str, limit: Optional[int],
+                       after: Optional[str], since: Optional[str]) -> ResponseData:
+        """ Requests a page of an answers listing.
+
+        Args:
+            - token (Optional[str]): The user session token.
+            - path (str): The path of the listing.
+            - limit (Optional[int]): If given, the maximum number of answers in the page.
+            - after (Optional[str]): The cursor of the page.
+            - since (Optional[str]): If given, an ISO 8601 date-time to list the answers from.
+
+        Returns:
+            - ResponseData: If successful, the contents hold a list of answers and the next cursor
+              (if there are more pages). Otherwise, the contents will be an empty list.
         """
+        params: Dict = {}
+        if limit is not None:
+            params['limit'] = limit
+        if after is not None:
+            params['after'] = after
+        if since is not None:
+            params['since'] = since
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/questions/{user}/answers',
+        response: requests.Response = self.__session.get(
+            self.__base_url() + path,
+            params=params,
             headers={
                 'Authorization': f'Bearer {token}',
                 self.__apikey_header: self.__apikey_secret
@@ -260,6 +364,7 @@ class BackendService():
         response_data.set_successful(response.ok)
         if response_data.is_successful():
             response_data.set_content(response.json())
+            response_data.set_next_cursor(response.headers.get('X-Next-Cursor'))
         else:
             response_data.add_message(response.content.decode('ascii'))
             response_data.set_content([])
@@ -278,7 +383,7 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
+        response: requests.Response = self.__session.get(
             self.__base_url() + f'/questions/{user}/answers/{questionId}',
             headers={
                 'Authorization': f'Bearer {token}',
@@ -1,12 +1,28 @@
 """ Presentation-layer web logic modules.
 """
 
-from .webauth import WebAuth
-from .webuser import WebUser
-from .webutils import WebUtils
+from typing import TYPE_CHECKING
+from dms2122common.lazyexports import LazyExports
 
-from .adminendpoints import AdminEndpoints
-from .commonendpoints import CommonEndpoints
-from .sessionendpoints import SessionEndpoints
-from .studentendpoints import StudentEndpoints
-from .teacherendpoints import TeacherEndpoints
+if TYPE_CHECKING:
+    from .webauth import WebAuth
+    from .webuser import WebUser
+    from .webutils import WebUtils
+    from .adminendpoints import AdminEndpoints
+    from .commonendpoints import CommonEndpoints
+    from .sessionendpoints import SessionEndpoints
+    from .studentendpoints import StudentEndpoints
+    from .teacherendpoints import TeacherEndpoints
+
+_exports = LazyExports(__name__, {
+    'WebAuth': 'webauth',
+    'WebUser': 'webuser',
+    'WebUtils': 'webutils',
+    'AdminEndpoints': 'adminendpoints',
+    'CommonEndpoints': 'commonendpoints',
+    'SessionEndpoints': 'sessionendpoints',
+    'StudentEndpoints': 'studentendpoints',
+    'TeacherEndpoints': 'teacherendpoints'
+})
+__getattr__ = _exports.get_attribute
+__dir__ = _exports.list_attributes
@@ -1,7 +1,7 @@
 """ AdminEndpoints class module.
 """
 
-from typing import Text, Union
+from typing import List, Optional, Text, Union
 from flask import redirect, url_for, session, render_template, request, flash
 from werkzeug.wrappers import Response
 from dms2122common.data import Role
@@ -135,12 +135,13 @@ class AdminEndpoints():
             return redirect(url_for('get_login'))
         if Role.Admin.name not in session['roles']:
             return redirect(url_for('get_home'))
-        successful: bool = True
-        successful &= WebUser.update_user_roles(auth_service,
-                                                request.form['username'],
-                                                request.form.getlist('roles')
-                                                )
-        session['roles'] = WebUser.get_roles(auth_service, session['user'])
+        roles: Optional[List] = WebUser.update_user_roles(auth_service,
+                                                          request.form['username'],
+                                                          request.form.getlist('roles')
+                                                          )
+        if roles is not None and request.form['username'] == session['user']:
+            # The token claims keep the former roles until it is refreshed with a new version
+            session['roles'] = roles
         redirect_to = request.form['redirect_to']
         if not redirect_to:
             redirect_to = url_for('get_admin_users')
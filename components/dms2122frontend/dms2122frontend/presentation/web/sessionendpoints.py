@@ -7,7 +7,6 @@ from werkzeug.wrappers import Response
 from dms2122common.data.rest import ResponseData
 from dms2122frontend.data.rest import AuthService
 from .webauth import WebAuth
-from .webuser import WebUser
 from .webutils import WebUtils
 
 
@@ -45,8 +44,10 @@ class SessionEndpoints():
             return redirect(url_for('get_login'))
 
         session['user'] = request.form['user']
-        session['token'] = response.get_content()
-        session['roles'] = WebUser.get_roles(auth_service, session['user'])
+        # Role claims of a former session user must not be taken as current
+        session.pop('roles', None)
+        session.pop('roles_version', None)
+        WebAuth.update_session_token(auth_service, response.get_content())
         return redirect(url_for('get_home'))
 
     @staticmethod
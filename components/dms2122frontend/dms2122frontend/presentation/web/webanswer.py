@@ -27,6 +27,25 @@ class WebAnswer():
         WebUtils.flash_response_messages(response)
         return response.get_content()
 
+    @staticmethod
+    def answer_questions(backend_service: BackendService, user: str, answers: List[Dict]) -> List:
+        """ Answers several questions at once in the backend service.
+
+        Args:
+            - backend_service (BackendService): The backend service.
+            - user (str): A string with the user.
+            - answers (List[Dict]): The answers, each one a dictionary with its `questionId` and
+              its `answer`.
+
+        Returns:
+            - List: A list with the result of each answer (the list is empty on error).
+        """
+        response: ResponseData = backend_service.answer_questions(session.get('token'), user, answers)
+        WebUtils.flash_response_messages(response)
+        if response.get_content() is not None and isinstance(response.get_content(), list):
+            return list(response.get_content())
+        return []
+
     @staticmethod
     def list_answers_to_question(backend_service: BackendService, questionId: int) -> List:
         """ Gets the list of questions from the backend service.
@@ -1,9 +1,11 @@
 """ WebAuth class module.
 """
 
+from typing import Dict, Optional
 from flask import session
 from dms2122common.data.rest import ResponseData
 from dms2122frontend.data.rest import AuthService
+from .webuser import WebUser
 from .webutils import WebUtils
 
 class WebAuth():
@@ -26,5 +28,27 @@ class WebAuth():
         if not response.is_successful():
             return False
 
-        session['token'] = response.get_content()
+        WebAuth.update_session_token(auth_service, response.get_content())
         return True
+
+    @staticmethod
+    def update_session_token(auth_service: AuthService, token: str) -> None:
+        """ Stores a new user session token in the session, along with the user roles.
+
+        The roles are taken from the token claims, and only updated when their version differs
+        from the one of the roles already in the session. Tokens without role claims fall back
+        to requesting the roles from the authentication service.
+
+        Args:
+            - auth_service (AuthService): The authentication service.
+            - token (str): The user session token.
+        """
+        session['token'] = token
+        claims: Optional[Dict] = auth_service.get_role_claims(token)
+        if claims is None:
+            if 'roles' not in session:
+                session['roles'] = WebUser.get_roles(auth_service, session['user'])
+            return
+        if 'roles' not in session or session.get('roles_version') != claims['roles_version']:
+            session['roles'] = claims['roles']
+            session['roles_version'] = claims['roles_version']
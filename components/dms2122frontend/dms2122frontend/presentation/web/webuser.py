@@ -65,7 +65,8 @@ class WebUser():
         return []
 
     @staticmethod
-    def update_user_roles(auth_service: AuthService, username: str, roles: List) -> bool:
+    def update_user_roles(auth_service: AuthService, username: str,
+                          roles: List) -> Optional[List]:
         """ Updates the user roles in the authentication service.
 
         Args:
@@ -74,10 +75,12 @@ class WebUser():
             - roles (List): The list of roles to grant. Roles not present here will be revoked.
 
         Returns:
-            - bool: Whether all the roles were updated successfully (`True`) or there were some
-              errors (`False`)
+            - List: The resulting list of role names if the roles were updated successfully.
+            - None: Nothing on error (no role is updated).
         """
         response: ResponseData = auth_service.update_user_roles(
             session.get('token'), username, roles)
         WebUtils.flash_response_messages(response)
-        return response.is_successful()
+        if response.is_successful() and isinstance(response.get_content(), list):
+            return list(response.get_content())
+        return None
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+""" Measures the cold start of the services and fails if any is slower than its threshold.
+
+Each service entry point is run with `--check` (build the application and exit without serving
+it) against a temporary configuration and SQLite database, several times, and the median time
+from process start to exit is compared with the threshold of the service. The modules imported
+are profiled with `python -X importtime`, and the packages taking most of the import time listed,
+to tell what made a slow start slow. The services and their dependencies must be installed (or in
+`PYTHONPATH`).
+
+Usage: `scripts/verify-startup-time.py [--services dms2122auth dms2122backend dms2122frontend]
+[--runs 5] [--max-seconds dms2122backend=1.5 ...] [--top 8]`
+"""
+
+import argparse
+import collections
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Counter, Dict, List, Tuple
+import yaml
+
+# Seconds from process start to exit, with the specification bundle already compiled
+THRESHOLDS: Dict[str, float] = {
+    'dms2122auth': 1.5,
+    'dms2122backend': 1.5,
+    'dms2122frontend': 0.6
+}
+
+COMPONENTS_DIR: str = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'components'
+)
+
+
+def write_configuration(service: str, workdir: str) -> Dict[str, str]:
+    """ Writes the configuration of a service in a temporary directory.
+
+    Args:
+        - service (str): The service name.
+        - workdir (str): The temporary directory.
+
+    Returns:
+        - Dict[str, str]: The environment variables to run the service with.
+    """
+    config_home: str = os.path.join(workdir, 'config')
+    os.makedirs(os.path.join(config_home, service), exist_ok=True)
+    values: Dict = {'service_host': '127.0.0.1'}
+    if service != 'dms2122frontend':
+        values['db_connection_string'] = 'sqlite:///' + os.path.join(workdir, 'service.db')
+    with open(os.path.join(config_home, service, 'config.yml'), 'w') as config_file:
+        yaml.safe_dump(values, config_file)
+    return dict(os.environ, XDG_CONFIG_HOME=config_home,
+                XDG_CACHE_HOME=os.path.join(workdir, 'cache'))
+
+
+def run_service(script: str, env: Dict[str, str], *options: str) -> Tuple[float, str]:
+    """ Runs a service entry point with `--check`.
+
+    Args:
+        - script (str): The path of the entry point.
+        - env (Dict[str, str]): The environment variables.
+        - options (str): The options of the Python interpreter.
+
+    Raises:
+        - RuntimeError: If the service fails to start.
+
+    Returns:
+        - Tuple[float, str]: The seconds from process start to exit and the standard error.
+    """
+    start: float = time.perf_counter()
+    process: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, *options, script, '--check'], env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=False
+    )
+    elapsed: float = time.perf_counter() - start
+    stderr: str = process.stderr.decode('utf-8', 'replace')
+    if process.returncode != 0:
+        raise RuntimeError(f'{script} --check failed:\n{stderr}')
+    return (elapsed, stderr)
+
+
+def import_times(importtime_output: str) -> Counter[str]:
+    """ Adds up the import time of the modules of each top-level package.
+
+    Args:
+        - importtime_output (str): The standard error of a `python -X importtime` run.
+
+    Returns:
+        - Counter[str]: The microseconds spent importing each package.
+    """
+    packages: Counter[str] = collections.Counter()
+    for line in importtime_output.splitlines():
+        if not line.startswith('import time:') or line.endswith('imported package'):
+            continue
+        fields: List[str] = line[len('import time:'):].split('|')
+        try:
+            packages[fields[2].strip().split('.')[0]] += int(fields[0])
+        except (IndexError, ValueError):
+            continue
+    return packages
+
+
+def main() -> None:
+    """ Measures the services and exits with an error status if any exceeds its threshold.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--services', nargs='+', default=sorted(THRESHOLDS),
+                        choices=sorted(THRESHOLDS))
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--max-seconds', nargs='+', default=[], metavar='SERVICE=SECONDS',
+                        help='override the threshold of a service')
+    parser.add_argument('--top', type=int, default=8,
+                        help='number of packages listed by import time')
+    args = parser.parse_args()
+    thresholds: Dict[str, float] = dict(THRESHOLDS)
+    for override in args.max_seconds:
+        service, _, seconds = override.partition('=')
+        thresholds[service] = float(seconds)
+
+    failures: List[str] = []
+    print(f'{"service":<16} {"median s":>9} {"max s":>7} {"imports s":>10}  slowest packages (ms)')
+    for service in args.services:
+        script: str = shutil.which(service) or os.path.join(COMPONENTS_DIR, service, 'bin', service)
+        workdir: str = tempfile.mkdtemp()
+        try:
+            env: Dict[str, str] = write_configuration(service, workdir)
+            # Creates the database and compiles the specification, as done when deploying
+            run_service(script, env)
+            elapsed: float = statistics.median(
+                run_service(script, env)[0] for _ in range(args.runs)
+            )
+            packages: Counter[str] = import_times(run_service(script, env, '-X', 'importtime')[1])
+        finally:
+            shutil.rmtree(workdir)
+        slowest: str = ', '.join(
+            f'{package} {microseconds / 1000:.0f}'
+            for package, microseconds in packages.most_common(args.top)
+        )
+        print(f'{service:<16} {elapsed:>9.3f} {thresholds[service]:>7.2f} '
+              f'{sum(packages.values()) / 1e6:>10.3f}  {slowest}')
+        if elapsed > thresholds[service]:
+            failures.append(service)
+    if failures:
+        print('Cold start over the threshold: ' + ', '.join(failures), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()